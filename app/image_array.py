@@ -0,0 +1,51 @@
+import numpy as np
+
+
+class ImageArray(np.ndarray):
+    """
+    A numpy array of a BGRA image which keeps the data derived from it, like its HSV image, its V channel and whether it is
+    grayscale or opaque, so that the steps of the pipeline and the views of the GUI reading the same image compute them once.
+    It is used like any other array, the processors are given it in place of the plain array.
+
+    The derived data is computed the first time it is asked for and only kept while the array is read-only, which is how the
+    pipeline shares its input and the cached outputs of the steps. A writable array may be written at any time, so its data
+    is computed again every time. Copies, views and the results of numpy operations start without any derived data.
+    The derived data lives as long as the array, on top of the memory of the image itself.
+    """
+    def __array_finalize__(self, obj):
+        self.derived = {}           # the derived data by name, only filled while the array is read-only
+
+
+    @classmethod
+    def wrap(cls, image):
+        """
+        Get an image as an ImageArray without copying it.
+        Args:
+            image (numpy.ndarray): The image in the BGRA format.
+        Returns:
+            ImageArray: The image itself if it is already an ImageArray, otherwise a view of it.
+        """
+        return image if isinstance(image, cls) else image.view(cls)
+
+
+    def get_derived(self, name, compute, writable=False):
+        """
+        Get data derived from the image, computing it unless it is kept.
+        Args:
+            name (str): The name of the data, e.g. 'hsv'.
+            compute (callable): Computes the data from the image.
+            writable (bool): Whether the caller writes into the returned array, a kept array is copied then.
+        Returns:
+            object: The derived data, a read-only array if it is kept and 'writable' is not set.
+        """
+        if self.flags.writeable:                # the image may be written after the data is computed, nothing is kept
+            return compute(self)
+
+        if name not in self.derived:
+            data = compute(self)
+            if isinstance(data, np.ndarray):
+                data.flags.writeable = False    # the kept data is shared by all the callers
+            self.derived[name] = data
+
+        data = self.derived[name]
+        return data.copy() if writable and isinstance(data, np.ndarray) else data
@@ -1,12 +1,37 @@
+import numpy as np
+import cv2
+
+import constants
+from app import processor_utils
+from app.image_array import ImageArray
+from app.profiler import Profiler
+from app.step_cache import StepCache
+from app.tiled_executor import TiledExecutor
+
 
 class Pipeline():
     """
     A class representing a processing pipeline for image processing.
     The pipeline consists of a series of steps, each represented by a FunctionBox class.
+    The steps are executed through immutable specs of their parameters, so a run does not touch the widgets.
+    The output of every step is cached under a fingerprint of its parameters and of all the steps before it,
+    so that only the steps after the edited one are recomputed.
+    The wall time and the CPU time of every step of the last run are kept in 'step_times'. If the profiler tracks the memory,
+    the peak memory allocated by every step is kept with them, and the number of full-resolution image buffers alive after
+    every step in 'step_buffers'.
+    Args:
+        cache_bytes (int): The maximum number of bytes spent on caching the outputs of the steps.
+        profiler (Profiler): The profiler recording the steps for the trace. Defaults to a profiler which only measures the steps.
     """
-    def __init__(self):
-        self.steps = []       
-        
+    def __init__(self, cache_bytes=constants.PIPELINE_CACHE_BYTES, profiler=None):
+        self.steps = []
+        self.cache = StepCache(cache_bytes)         # LRU cache holding the (image, mask) output of the steps
+        self.input_images = []                      # the (image, version) pairs of the recent inputs, kept to recognize them in the following runs
+        self.input_version = 0                      # increased every time a new input image is given to the pipeline
+        self.profiler = profiler if profiler is not None else Profiler(max_events=0)
+        self.step_times = []                        # the (wall ms, CPU ms, peak bytes, note) of every step of the last finished run, None for the disabled steps
+        self.step_buffers = []                      # the (count, bytes) of the image buffers alive after every step of the last finished run
+
 
     def add_step(self, step):
         """
@@ -17,29 +42,431 @@ class Pipeline():
         self.steps.append(step)
 
 
-    def run(self, input_image):
+    def snapshot(self):
+        """
+        Take an immutable snapshot of the parameters of all the steps.
+        The snapshot can be run on another thread while the user keeps editing the toolboxes.
+        Returns:
+            specs (list): The spec of every enabled step and None for every disabled step, in the order of the steps.
+        """
+        specs = []
+        for step in self.steps:
+            with self.profiler.span(step.title, "read"):
+                specs.append(step.get_spec() if step.switch.isChecked() else None)
+
+        return specs
+
+
+    def run(self, input_image, specs=None, cancelled=None):
         """
         Run the pipeline on the input image.
+        Steps whose fingerprint is found in the cache are not executed again.
+        An opaque grayscale image is carried as a single plane, it is only expanded to BGRA for the steps without a single plane path,
+        see 'StepSpec.gray_plane'. The output of such a step is taken back to a single plane if it is still opaque and grayscale.
         Args:
-            image (numpy array): The input image to be processed in the BGRA format.
+            input_image (numpy array): The input image to be processed in the BGRA format, or a grayscale single plane.
+            specs (list): A snapshot of the steps taken by the 'snapshot' method. If None, a new snapshot is taken.
+            cancelled (callable): A function checked between the steps, the run is abandoned when it returns True.
         Returns:
-            image (numpy array): The processed image in the BGRA format.
+            image (numpy array): The processed image in the BGRA format, a single plane for an opaque grayscale image,
+                or None if the run was cancelled. A single plane is only expanded to be displayed, see 'processor_utils.to_bgra'.
+                It is read-only if it is shared with the cache or the input image. It is an 'ImageArray', so the data derived
+                from a read-only image is shared by the following steps and the caller.
         """
-        output_image = input_image.copy()          
+        if specs is None:
+            specs = self.snapshot()
+
+        keys = self.get_step_keys(input_image, specs)
+
+        # find the last enabled step whose output is cached, the execution continues after that step
+        start = 0
+        output_image = ImageArray.wrap(processor_utils.read_only(input_image))     # the input image belongs to the caller, it is never written
         mask = None                                  # initialize mask to None, it will be used to store the mask produced by steps
-        for step in self.steps:
-            if step.switch.isChecked():                     # check if the function box is activated
-                result = step.execute(output_image, mask)      
+        for i in range(len(specs) - 1, -1, -1):
+            cached = self.cache.get(keys[i]) if specs[i] is not None else None
+            if cached is not None:
+                output_image, mask = cached
+                start = i + 1
+                break
+
+        if start == 0:
+            output_image = processor_utils.get_gray_plane(output_image)    # the plane is kept by the input image for the following runs
+        image_bytes = output_image.nbytes if output_image.ndim == 2 else input_image.nbytes     # the smallest image buffer of the run
+
+        times = [(0.0, 0.0, None, "cached") if spec is not None else None for spec in specs[:start]] + [None] * (len(specs) - start)
+        buffers = [None] * len(specs)
+
+        i = start
+        checked_end = start
+        while i < len(specs):
+            if cancelled is not None and cancelled():       # a newer request made this run obsolete
+                return None
+
+            spec = specs[i]
+            started = self.profiler.start()
+            if (spec is not None and mask is not None and spec.masked_only and spec.halo is not None and
+                    (output_image.ndim == 3 or spec.gray_plane)):
+                # a step changing only the masked pixels is run on the bounding box of a small mask
+                roi_image = self.run_in_roi(output_image, mask, spec)
+                if roi_image is not None:
+                    output_image, mask = ImageArray.wrap(roi_image), None
+                    self.cache.put(keys[i], output_image, mask)
+                    step_time = self.profiler.stop(started, type(spec).__name__, "step", step=i, path="roi")
+                    self.set_step_times(times, buffers, specs, i, i + 1, step_time, "ROI", image_bytes)
+                    i += 1
+                    continue
+
+            end = self.get_lut_steps_end(specs, i)
+            if mask is None and sum(s is not None for s in specs[i:end]) > 1:
+                # point-wise steps are composed into look-up tables, a mask would only affect the first step so it is run on its own
+                output_image = self.run_lut_steps(output_image, specs[i:end], cancelled)
+                if output_image is None:
+                    return None
+                output_image = ImageArray.wrap(output_image)
+                self.cache.put(keys[end - 1], output_image, None)
+                step_time = self.profiler.stop(started, "look-up tables", "step", steps=list(range(i, end)))
+                self.set_step_times(times, buffers, specs, i, end, step_time, "fused", image_bytes)
+                i = end
+                continue
+
+            end = self.get_v_steps_end(specs, i)
+            if end - i > 1 and i >= checked_end and output_image.ndim == 3 and processor_utils.is_image_grayscale(output_image):
+                # the V channel of a grayscale image is any of its color channels, the steps are run on it without converting
+                # the image to the HSV color space and back, only the output of the last step is cached
+                output_image = self.run_v_steps(output_image, mask, specs[i:end], cancelled)
+                if output_image is None:
+                    return None
+                output_image = ImageArray.wrap(output_image)
+                mask = None
+                self.cache.put(keys[end - 1], output_image, mask)
+                step_time = self.profiler.stop(started, "V channel steps", "step", steps=list(range(i, end)))
+                self.set_step_times(times, buffers, specs, i, end, step_time, "fused", image_bytes)
+                i = end
+                continue
+            checked_end = max(checked_end, end)             # the image is not checked again for the rest of a run on a color image
+
+            if spec is not None:                            # check if the step is activated
+                # the cached and the input images are read-only, only a step writing into its input is given a copy of them,
+                # the image produced by the previous step belongs to this run if it was not cached, so it is handed over directly
+                image = output_image
+                expanded = output_image.ndim == 2 and not spec.gray_plane
+                if expanded:
+                    # the step has no single plane path, it is given the plane expanded to BGRA, which belongs to this run
+                    with self.profiler.span("expand", "copy", step=i):
+                        image = processor_utils.to_bgra(output_image)
+                elif spec.writes_input and not output_image.flags.writeable:
+                    with self.profiler.span("copy", "copy", step=i):
+                        image = output_image.copy()
+                masked = mask is not None
+                result = spec.apply(image, mask)
                 if isinstance(result, tuple):               # check if the result is a tuple (image, mask)
-                    output_image = result[0]
+                    output_image = ImageArray.wrap(result[0])
                     mask = result[1]
                 else:
-                    output_image = result
+                    output_image = ImageArray.wrap(result)
                     mask = None         # this way mask will affect only the following step after the one that produced it
+
+                if output_image.ndim == 3 and (expanded or spec.gray_output):
+                    output_image = ImageArray.wrap(processor_utils.get_gray_plane(output_image))
+
+                self.cache.put(keys[i], output_image, mask)
+                step_time = self.profiler.stop(started, type(spec).__name__, "step", step=i, masked=masked)
+                self.set_step_times(times, buffers, specs, i, i + 1, step_time, "", image_bytes)
             else:
                 mask = None             # if the step is not activated, reset the mask to None in case the previous step produced a mask
+            i += 1
+
+        self.step_times = times
+        self.step_buffers = buffers
+        return output_image
+
+
+    def set_step_times(self, times, buffers, specs, start, end, step_time, note, image_bytes):
+        """
+        Set the time of a step, or of the steps run together as their individual times can not be told apart.
+        If the profiler tracks the memory, the image buffers alive after the steps are counted as well.
+        Args:
+            times (list): The times of the steps of the run, modified in place.
+            buffers (list): The image buffers alive after the steps of the run, modified in place.
+            specs (list): A snapshot of the steps.
+            start (int): The index of the first step.
+            end (int): The index after the last step.
+            step_time (tuple): The wall time, the CPU time and the peak memory of the steps returned by 'Profiler.stop'.
+            note (str): How the steps were run, '' if the step was run on its own, 'fused' or 'ROI'.
+            image_bytes (int): The size of the input image, or of its single plane, the smallest buffer counted as an image buffer.
+        """
+        for j in range(start, end):
+            if specs[j] is not None:
+                times[j] = step_time + (note,)
+
+        if self.profiler.track_memory:
+            buffers[end - 1] = self.profiler.count_buffers(image_bytes)
+            self.profiler.counter("image buffers", count=buffers[end - 1][0])
+
+
+    def run_in_roi(self, image, mask, spec):
+        """
+        Run a step changing only the masked pixels on the bounding box of the mask, extended by the halo of the step.
+        The pixels of the bounding box are computed exactly as on the whole image, the pixels outside of it are left as they are.
+        Steps depending on statistics of the whole image are bound to the statistics of the whole image first.
+        Args:
+            image (numpy array): The input image of the step in the BGRA format.
+            mask (numpy array): The mask produced by the previous step.
+            spec (StepSpec): The spec of the step, with 'masked_only' set and a halo.
+        Returns:
+            image (numpy array): The output image of the step in the BGRA format,
+                or None if the bounding box covers too much of the image to be worth it.
+        """
+        left, top, width, height = cv2.boundingRect(mask)
+        im_height, im_width = image.shape[:2]
+        if width * height > constants.ROI_MAX_FRACTION * im_width * im_height:
+            return None
+
+        output_image = image if image.flags.writeable else image.copy()     # the output is written into the image if it belongs to this run
+        if width == 0 or height == 0:           # an empty mask selects no pixel to change
+            return output_image
+
+        if spec.global_stats:
+            spec = spec.with_stats([spec.collect_stats(image, (slice(None), slice(None)))])
+
+        # extend the bounding box by the halo without going out of the image, the steps handle the image borders themselves
+        halo = spec.halo
+        region_top, region_bottom = max(0, top - halo), min(im_height, top + height + halo)
+        region_left, region_right = max(0, left - halo), min(im_width, left + width + halo)
+        core = (slice(top - region_top, top + height - region_top), slice(left - region_left, left + width - region_left))
+
+        region = np.array(image[region_top:region_bottom, region_left:region_right])        # a copy the step may write into
+        result = spec.apply(region, mask[region_top:region_bottom, region_left:region_right])
+        output_image[top:top + height, left:left + width] = result[core]
+
+        return output_image
+
+
+    def get_lut_steps_end(self, specs, start):
+        """
+        Find the end of the run of consecutive point-wise steps starting at the given step.
+        Disabled steps inside the run pass the image through, they are part of the run. The run ends with an enabled step,
+        as its output is cached under the fingerprint of its last step, which is only looked up for enabled steps.
+        Args:
+            specs (list): A snapshot of the steps taken by the 'snapshot' method.
+            start (int): The index of the first step of the run.
+        Returns:
+            int: The index after the last point-wise step of the run, 'start' if the step is not a point-wise step.
+        """
+        if specs[start] is None:
+            return start
+
+        end = start
+        while end < len(specs) and (specs[end] is None or specs[end].lut_channel is not None):
+            end += 1
+        while end > start and specs[end - 1] is None:          # the trailing disabled steps are left to the following steps
+            end -= 1
+
+        return end
+
+
+    def run_lut_steps(self, image, specs, cancelled=None):
+        """
+        Run consecutive point-wise steps as look-up tables, composing the tables wherever the result stays identical to running the steps one by one.
+        On a grayscale image all the tables are composed and applied at once. On a color image the tables of the steps mapping
+        the color channels are composed, but the steps mapping the V channel are composed only up to a step making a grayscale
+        image from the V channel, as the hue and saturation of a color image drift in every conversion to the HSV color space and back.
+        The other V channel steps are run on their own.
+        Args:
+            image (numpy array): The input image of the first step in the BGRA format.
+            specs (list): The specs of the point-wise steps, None for the disabled steps.
+            cancelled (callable): A function checked between the steps, the run is abandoned when it returns True.
+        Returns:
+            image (numpy array): The output image of the last step in the BGRA format, or a single plane for an opaque grayscale image,
+                or None if the run was cancelled.
+        """
+        specs = [spec for spec in specs if spec is not None]        # the disabled steps only reset the mask, which is already None
+        identity = np.arange(256, dtype=np.uint8)
+        lut = identity                          # the composition of the tables of the steps so far
+        plane = None                            # the V channel the table is applied to, once the image is known to be grayscale
+        counts = []                             # the histogram of the plane, only computed for the steps depending on the whole image
+
+        def histogram():
+            if not counts:
+                counts.append(np.bincount(plane.ravel(), minlength=256))
+            return np.bincount(lut, weights=counts[0], minlength=256)       # the histogram of the plane mapped by the table so far
 
-        return output_image              
+        grayscale = processor_utils.is_image_grayscale(image)
+        if grayscale:
+            plane = image if image.ndim == 2 else image[:, :, 0]    # every color channel of a grayscale image is its V channel
+
+        i = 0
+        while i < len(specs):
+            if cancelled is not None and cancelled():
+                return None
+
+            spec = specs[i]
+            if plane is None and spec.lut_channel == "V":
+                gray_end = i
+                while gray_end < len(specs) and specs[gray_end].lut_channel == "V" and not specs[gray_end].gray_output:
+                    gray_end += 1
+
+                if gray_end < len(specs) and specs[gray_end].gray_output:
+                    # the V channel is the maximum of the color channels, the table so far is applied before taking it
+                    image = self.apply_lut(image, lut, identity)
+                    plane = processor_utils.get_v_plane(image)
+                    lut = identity
+                else:
+                    image = spec.apply(self.apply_lut(image, lut, identity), None)
+                    lut = identity
+                    i += 1
+                    continue
+
+            lut = spec.get_lut(histogram)[lut]          # compose the table of the step with the table so far
+            i += 1
+
+        if plane is None or grayscale:
+            return self.apply_lut(image, lut, identity)
+
+        if processor_utils.is_image_opaque(image):
+            return cv2.LUT(plane, lut)          # the image made grayscale is carried as a single plane
+
+        output_image = image.copy()
+        output_image[:, :, :3] = cv2.LUT(plane, lut)[:, :, None]
+
+        return output_image
+
+
+    def apply_lut(self, image, lut, identity):
+        """
+        Apply a look-up table to the color channels of an image in a single pass, keeping its alpha channel.
+        Args:
+            image (numpy array): The input image in the BGRA format, or a grayscale single plane, it is not modified.
+            lut (numpy array): The look-up table of 256 uint8 values.
+            identity (numpy array): The identity look-up table, applied to the alpha channel.
+        Returns:
+            image (numpy array): The mapped image in the format of the input image, a copy of it even if the table is the identity.
+        """
+        if lut is identity:
+            return image.copy()
+        if image.ndim == 2:
+            return cv2.LUT(image, lut)
+
+        return cv2.LUT(image, np.dstack((lut, lut, lut, identity)))
+
+
+    def get_v_steps_end(self, specs, start):
+        """
+        Find the end of the run of consecutive V channel steps starting at the given step.
+        Args:
+            specs (list): A snapshot of the steps taken by the 'snapshot' method.
+            start (int): The index of the first step of the run.
+        Returns:
+            int: The index after the last V channel step of the run, 'start' if the step is not a V channel step.
+        """
+        end = start
+        while end < len(specs) and specs[end] is not None and specs[end].v_channel:
+            end += 1
+
+        return end
+
+
+    def run_v_steps(self, image, mask, specs, cancelled=None):
+        """
+        Run consecutive V channel steps on a grayscale image, handing a single plane from step to step.
+        The result is identical to running the steps one by one, as a grayscale image converts to the HSV color space
+        and back without any loss. Color images are not run this way, their hue and saturation drift in the round trip.
+        Args:
+            image (numpy array): The grayscale input image of the first step in the BGRA format.
+            mask (numpy array): The mask produced by the step before the run, or None.
+            specs (list): The specs of the V channel steps.
+            cancelled (callable): A function checked between the steps, the run is abandoned when it returns True.
+        Returns:
+            image (numpy array): The output image of the last step in the BGRA format, or None if the run was cancelled.
+        """
+        plane = image[:, :, 0].copy()
+        for spec in specs:
+            if cancelled is not None and cancelled():
+                return None
+            plane = spec.apply(plane, mask)
+            mask = None                 # the mask affects only the first step of the run
+
+        output_image = image.copy()
+        output_image[:, :, :3] = plane[:, :, None]
+
+        return output_image
+
+
+    def run_tiled(self, input_image, specs=None, executor=None):
+        """
+        Run the pipeline on the input image tile by tile, for images too large to be processed at once.
+        The outputs of the steps are not cached. The steps without a halo are applied to the whole image, see 'TiledExecutor'.
+        An opaque grayscale image is processed as a single plane, and gives the same output as 'run'. A color image goes through
+        the HSV color space tile by tile, whose conversion rounds a few pixels differently depending on their position in the tile.
+        The later steps stretching the values, like the histogram equalization or the log transform, amplify these differences
+        of one level: after a histogram equalization, a smoothing and a log transform, about 1% of the pixels differ from 'run'
+        by more than one level, and the worst ones by more than 100 levels.
+        Args:
+            input_image (numpy array): The input image to be processed in the BGRA format, it can be a memory-mapped array,
+                or an opaque grayscale single plane.
+            specs (list): A snapshot of the steps taken by the 'snapshot' method. If None, a new snapshot is taken.
+            executor (TiledExecutor): The executor defining the tile size, the number of threads and the storage of the intermediate images.
+        Returns:
+            image (numpy array): The processed image in the BGRA format, a single plane for an opaque grayscale image
+                whose output is still opaque and grayscale.
+        """
+        if specs is None:
+            specs = self.snapshot()
+        if executor is None:
+            executor = TiledExecutor()
+
+        input_image = processor_utils.get_gray_plane(input_image)          # the tiles of a grayscale image are single planes
+        output_image = executor.run(input_image, specs)
+        if input_image.ndim == 2:
+            output_image = processor_utils.get_gray_plane(output_image)    # a step without a single plane path expanded it
+
+        return output_image
+
+
+    def get_step_keys(self, input_image, specs):
+        """
+        Calculate the fingerprint of every step in the pipeline.
+        A fingerprint depends on the input image, the parameters of the step and the fingerprints of all the previous steps.
+        Args:
+            input_image (numpy array): The input image of the pipeline.
+            specs (list): A snapshot of the steps taken by the 'snapshot' method.
+        Returns:
+            keys (list): The fingerprints of the steps in the same order as the steps.
+        """
+        keys = []
+        key = hash(("input", self.get_input_version(input_image), input_image.shape))
+        for spec in specs:
+            if spec is not None:
+                key = hash((key, type(spec).__name__, spec))    # specs of different types may have equal fields
+            else:
+                key = hash((key, None))             # a disabled step passes the image through and resets the mask
+            keys.append(key)
+
+        return keys
+
+
+    def get_input_version(self, input_image):
+        """
+        Get the version number of the input image. A new input image gets a new version, which invalidates all the fingerprints.
+        The recent read-only inputs are remembered, so alternating between an image and its downscaled proxy keeps both cached.
+        A writable input may have been changed in place since the last run, so it gets a new version on every run.
+        Args:
+            input_image (numpy array): The input image of the pipeline.
+        Returns:
+            int: The version of the input image.
+        """
+        if not input_image.flags.writeable:
+            for image, version in self.input_images:
+                if image is input_image:
+                    return version
+
+        self.input_version += 1
+        if input_image.flags.writeable:
+            return self.input_version           # the image is not remembered, it would never be recognized
+
+        self.input_images = [(input_image, self.input_version)] + self.input_images[:constants.PIPELINE_CACHED_INPUTS - 1]
+
+        return self.input_version
 
 
     def clear(self):
@@ -47,6 +474,7 @@ class Pipeline():
         Clear the whole pipeline.
         """
         self.steps = []
+        self.cache.clear()
 
 
     def move_step(self, step, new_index):
@@ -71,4 +499,4 @@ class Pipeline():
             if step.id == step_id:
                 self.steps.remove(step)
                 break
-        
+
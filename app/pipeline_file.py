@@ -0,0 +1,80 @@
+import json
+from dataclasses import fields
+
+import constants
+from app import specs
+
+
+def spec_to_dict(spec):
+    """
+    Convert a spec to a dictionary that can be written to a JSON file.
+    Only the fields compared by the dataclass are saved, fields holding data like the second image are left out.
+    Args:
+        spec (StepSpec): The spec to be converted.
+    Returns:
+        dict: The name of the spec class and its saved fields.
+    """
+    params = {f.name: getattr(spec, f.name) for f in fields(spec) if f.compare}
+    return {"type": type(spec).__name__, "params": params}
+
+
+def spec_from_dict(data):
+    """
+    Create a spec from a dictionary made by 'spec_to_dict'.
+    Args:
+        data (dict): The name of the spec class and its saved fields.
+    Returns:
+        StepSpec: The created spec.
+    """
+    spec_class = getattr(specs, data["type"], None)
+    if spec_class is None:
+        raise ValueError(f"Unknown step type: {data['type']}")
+
+    # JSON has no tuples, the lists are converted back so the spec stays hashable
+    params = {name: tuple(value) if isinstance(value, list) else value for name, value in data["params"].items()}
+
+    return spec_class.from_params(params)
+
+
+def save_pipeline(filePath, steps):
+    """
+    Save the steps of a pipeline to a JSON file.
+    Args:
+        filePath (str): The path of the file.
+        steps (list): The (spec, enabled) pairs of the steps in the order of the pipeline.
+    """
+    data = {
+        "version": constants.PIPELINE_FILE_VERSION,
+        "steps": [dict(spec_to_dict(spec), enabled=enabled) for spec, enabled in steps]
+    }
+
+    with open(filePath, "w") as f:
+        json.dump(data, f, indent=4)
+
+
+def read_pipeline(filePath):
+    """
+    Read the steps of a pipeline from a JSON file written by 'save_pipeline'.
+    Args:
+        filePath (str): The path of the file.
+    Returns:
+        list: The (spec, enabled) pairs of the steps in the order of the pipeline.
+    """
+    with open(filePath, "r") as f:
+        data = json.load(f)
+
+    if data.get("version") != constants.PIPELINE_FILE_VERSION:
+        raise ValueError(f"Unsupported pipeline file version: {data.get('version')}")
+
+    return [(spec_from_dict(step), step.get("enabled", True)) for step in data["steps"]]
+
+
+def load_pipeline(filePath):
+    """
+    Load a pipeline file as a snapshot that can be run by 'Pipeline.run' without the GUI.
+    Args:
+        filePath (str): The path of the file.
+    Returns:
+        specs (list): The spec of every enabled step and None for every disabled step, in the order of the steps.
+    """
+    return [spec if enabled else None for spec, enabled in read_pipeline(filePath)]
@@ -1,12 +1,560 @@
+import os
+import math
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
+import cv2
+
+import constants
+from app.image_array import ImageArray
+
+def get_derived_data(image, name, compute, writable=False):
+    """
+    Helper function to get data derived from an image, kept by the image if it is a read-only 'ImageArray'.
+    Args:
+        image (numpy.ndarray): The input image in the BGRA format.
+        name (str): The name of the data.
+        compute (callable): Computes the data from the image.
+        writable (bool): Whether the caller writes into the returned array.
+    Returns:
+        object: The derived data, read-only if it is kept by the image and 'writable' is not set.
+    """
+    if isinstance(image, ImageArray):
+        return image.get_derived(name, compute, writable)
+
+    return compute(image)
+
 
 def is_image_grayscale(imageBGRA):
     """
     Helper function to check if the given image is grayscale.
     Args:
-        imageBGRA (numpy.ndarray): The input image in the BGRA format.
+        imageBGRA (numpy.ndarray): The input image in the BGRA format, or a single plane.
     Returns:
         isGray (bool): True if the image is grayscale, False otherwise.
     """
-    return (np.array_equal(imageBGRA[:, :, 0], imageBGRA[:, :, 1]) and np.array_equal(imageBGRA[:, :, 1], imageBGRA[:, :, 2]))
+    if imageBGRA.ndim == 2:
+        return True
+
+    return get_derived_data(imageBGRA, "grayscale", lambda image: (np.array_equal(image[:, :, 0], image[:, :, 1]) and
+                                                                   np.array_equal(image[:, :, 1], image[:, :, 2])))
+
+
+def is_image_opaque(imageBGRA):
+    """
+    Helper function to check if every pixel of the given image is fully opaque.
+    Args:
+        imageBGRA (numpy.ndarray): The input image in the BGRA format, or a single plane.
+    Returns:
+        isOpaque (bool): True if the alpha channel of the image is 255 everywhere, False otherwise.
+    """
+    if imageBGRA.ndim == 2 or imageBGRA.shape[2] < 4:
+        return True
+
+    return get_derived_data(imageBGRA, "opaque", lambda image: image.size == 0 or image[:, :, 3].min() == 255)
+
+
+def get_hsv(imageBGRA, writable=False):
+    """
+    Helper function to convert the color channels of the given image to the HSV color space.
+    The hue and the saturation of a grayscale single plane are 0 and its value is the plane itself.
+    Args:
+        imageBGRA (numpy.ndarray): The input image in the BGRA format, or a grayscale single plane.
+        writable (bool): Whether the caller writes into the returned image.
+    Returns:
+        imageHSV (numpy.ndarray): The HSV image, read-only if it is kept by the input image and 'writable' is not set.
+    """
+    def compute(image):
+        if image.ndim == 2:
+            zeros = np.zeros_like(image)
+            return cv2.merge((zeros, zeros, np.asarray(image)))
+        return cv2.cvtColor(image[:, :, :3], cv2.COLOR_BGR2HSV)
+
+    return get_derived_data(imageBGRA, "hsv", compute, writable)
+
+
+def get_v_plane(imageBGRA):
+    """
+    Helper function to get the V channel of the given image, the maximum of its color channels.
+    It is taken from the HSV image if the input image already keeps it, without converting the whole image otherwise.
+    The V channel of a grayscale single plane is the plane itself.
+    Args:
+        imageBGRA (numpy.ndarray): The input image in the BGRA format, or a grayscale single plane.
+    Returns:
+        vChannel (numpy.ndarray): The V channel, read-only if it is kept by the input image.
+    """
+    if imageBGRA.ndim == 2:
+        return imageBGRA
+
+    def compute(image):
+        imageHSV = image.derived.get("hsv") if isinstance(image, ImageArray) else None
+        if imageHSV is not None:
+            return imageHSV[:, :, 2]
+        return cv2.max(cv2.max(image[:, :, 0], image[:, :, 1]), image[:, :, 2])
+
+    return get_derived_data(imageBGRA, "v", compute)
+
+
+
+def get_gray_plane(imageBGRA):
+    """
+    Helper function to get an opaque grayscale image as a single plane, the format the pipeline carries such images in.
+    Every color channel of a grayscale image is the same plane and the alpha channel of an opaque image holds no information,
+    so the plane takes a quarter of the memory of the image and the steps process a single channel instead of four.
+    Args:
+        imageBGRA (numpy.ndarray): The input image in the BGRA format, or a single plane.
+    Returns:
+        image (numpy.ndarray): A copy of the gray plane of an opaque grayscale image, read-only if it is kept by the input image,
+            otherwise the input image itself.
+    """
+    if imageBGRA.ndim == 2:
+        return imageBGRA
+
+    def compute(image):
+        if not is_image_grayscale(image) or not is_image_opaque(image):
+            return None
+        return ImageArray.wrap(np.ascontiguousarray(image[:, :, 0]))
+
+    plane = get_derived_data(imageBGRA, "plane", compute)
+    return imageBGRA if plane is None else plane
+
+
+def to_bgra(image):
+    """
+    Helper function to expand a grayscale single plane to the BGRA format, for the steps and the views working on four channels.
+    Args:
+        image (numpy.ndarray): The input image in the BGRA format, or a grayscale single plane taken as opaque.
+    Returns:
+        imageBGRA (numpy.ndarray): A new opaque BGRA image for a single plane, otherwise the input image itself.
+    """
+    if image.ndim == 3:
+        return image
+
+    return cv2.cvtColor(np.asarray(image), cv2.COLOR_GRAY2BGRA)
+
+
+def set_gray_output(gray, image):
+    """
+    Helper function to make the grayscale output of a step in the format of its input image.
+    Args:
+        gray (numpy.ndarray): The grayscale output plane of the step.
+        image (numpy.ndarray): The input image of the step in the BGRA format, or a grayscale single plane.
+    Returns:
+        image (numpy.ndarray): The gray plane itself for a single plane input, otherwise a BGRA image of the gray plane
+            with the alpha channel of the input image.
+    """
+    if image.ndim == 2:
+        return gray
+
+    return cv2.merge((gray, gray, gray, image[:, :, 3]))
+
+
+def read_only(image):
+    """
+    Helper function to get a read-only view of an image, so that the image can be shared without being modified.
+    Args:
+        image (numpy.ndarray): The image to be shared.
+    Returns:
+        view (numpy.ndarray): A view of the image that can not be written.
+    """
+    if not image.flags.writeable:           # the image is shared already, the data it keeps is kept with it
+        return image
+
+    view = image.view()
+    view.flags.writeable = False
+
+    return view
+
+
+def normalize_by_range(array, value_range, out_max=255):
+    """
+    Helper function to stretch the values like cv2.normalize with NORM_MINMAX, but using the given input range
+    instead of the minimum and maximum of the array. This way a part of an image can be normalized with the statistics of the whole image.
+    Args:
+        array (numpy.ndarray): The values to be stretched.
+        value_range (tuple): The (min, max) values to be mapped to 0 and out_max.
+        out_max (int or float): The upper limit of the output range.
+    Returns:
+        normalized (numpy.ndarray): The stretched values in the same shape and type as the input.
+    """
+    # clip the values into the range and append the range limits, so cv2.normalize finds exactly the given minimum and maximum
+    values = np.clip(array.ravel(), value_range[0], value_range[1])
+    values = np.concatenate((values, np.asarray(value_range, dtype=array.dtype)))
+    normalized = cv2.normalize(values, None, 0, out_max, cv2.NORM_MINMAX)
+
+    return normalized.ravel()[:-2].reshape(array.shape)
+
+
+def stretch_to_unit(values, value_range):
+    """
+    Helper function to linearly map the given range of float values to the 0-1 range.
+    Unlike cv2.normalize, the result of a pixel does not depend on its position in the array, so tiles of an image
+    stretched with the range of the whole image are identical to the stretched whole image.
+    Args:
+        values (numpy.ndarray): The float32 values to be stretched.
+        value_range (tuple): The (min, max) values to be mapped to 0 and 1.
+    Returns:
+        stretched (numpy.ndarray): The stretched float32 values.
+    """
+    low, high = value_range
+    scale = np.float32(1.0 / (high - low)) if high > low else np.float32(0)
+
+    return (values - np.float32(low)) * scale
+
+
+def get_equalization_lut(histogram):
+    """
+    Helper function to calculate the look-up table used by cv2.equalizeHist from a 256-bin histogram.
+    Args:
+        histogram (numpy.ndarray): The 256-bin histogram of an 8-bit channel.
+    Returns:
+        lut (numpy.ndarray): The 256-entry uint8 look-up table.
+    """
+    histogram = np.asarray(histogram, dtype=np.int64)
+    first = np.flatnonzero(histogram)[0]                    # the darkest level present in the image
+    total = histogram.sum()
+
+    if histogram[first] == total:                           # a flat image is left unchanged
+        return np.full(256, first, dtype=np.uint8)
+
+    scale = 255.0 / (total - histogram[first])
+    cumulative = (np.cumsum(histogram) - histogram[first]).astype(np.float64)
+    lut = np.clip(np.rint(cumulative * scale), 0, 255).astype(np.uint8)
+    lut[:first + 1] = 0
+
+    return lut
+
+
+def get_laplacian_response(imageBGRA, extended=False):
+    """
+    Helper function to calculate the laplacian of the V channel of the image.
+    Args:
+        imageBGRA (numpy.ndarray): The input image in the BGRA format.
+        extended (bool): If True, the extended laplace kernel including the diagonals is used.
+    Returns:
+        laplace (numpy.ndarray): The float32 laplacian of the V channel normalized to 0-1 range.
+    """
+    # create the laplace kernel according to the extended switch
+    if extended:
+        w = np.array([[1, 1, 1], [1, -8, 1], [1, 1, 1]], dtype=np.float32)
+    else:
+        w = np.array([[0, 1, 0], [0, -4, 0], [0, 1, 0]], dtype=np.float32)
+
+    vChannel = get_v_plane(imageBGRA).astype(np.float32) / 255.0               # get and normalize the V channel of the image
+
+    return cv2.filter2D(vChannel, -1, w, borderType=cv2.BORDER_REPLICATE)       # apply the laplace filter to the V channel
+
+
+def get_sobel_response(imageBGRA):
+    """
+    Helper function to calculate the sobel gradient magnitude of the V channel of the image.
+    Args:
+        imageBGRA (numpy.ndarray): The input image in the BGRA format.
+    Returns:
+        sobel (numpy.ndarray): The float32 gradient magnitude of the V channel normalized to 0-1 range.
+    """
+    # create the sobel kernels
+    w_x = np.array([[-1, -2, -1], [0, 0, 0], [1, 2, 1]], dtype=np.float32)
+    w_y = np.array([[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]], dtype=np.float32)
+
+    vChannel = get_v_plane(imageBGRA).astype(np.float32) / 255.0        # get and normalize the V channel of the image
+
+    # get the sobel filters
+    sobel_x = cv2.filter2D(vChannel, -1, w_x, borderType=cv2.BORDER_REPLICATE)
+    sobel_y = cv2.filter2D(vChannel, -1, w_y, borderType=cv2.BORDER_REPLICATE)
+
+    return np.sqrt(sobel_x ** 2 + sobel_y ** 2)
+
+
+def read_image(filePath, keep_gray=False):
+    """
+    Helper function to read an image file with OpenCV and convert it to the BGRA format used by the processors.
+    Args:
+        filePath (str): The path of the image file.
+        keep_gray (bool): Whether a grayscale file is kept as a single plane, which the pipeline processes without expanding it.
+    Returns:
+        image (numpy.ndarray): The image in the BGRA format, or a single plane for a grayscale file if 'keep_gray' is set.
+    """
+    image = cv2.imread(filePath, cv2.IMREAD_UNCHANGED)      # read the image
+    
+    if image is None:
+        raise ValueError("No input image provided")
+    elif len(image.shape) == 2:                             # if image is (h,w)
+        image = image if keep_gray else cv2.cvtColor(image, cv2.COLOR_GRAY2BGRA)
+    elif len(image.shape) == 3 and image.shape[2] == 1:     # if image is (h,w,1)
+        image = image[:, :, 0] if keep_gray else cv2.cvtColor(image, cv2.COLOR_GRAY2BGRA)
+    elif len(image.shape) == 3 and image.shape[2] == 3:     # if image is (BGR) (h,w,3)
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2BGRA)
+    elif len(image.shape) == 3 and image.shape[2] == 4:     # if image is (BGRA) (h,w,4)
+        pass
+    else:
+        raise ValueError("Unsupported image format")
+    
+    return image
+
+
+def get_v_channel(image):
+    """
+    Helper function to get the V channel of an image for the processors working on the V channel.
+    A single-channel image is taken as the V channel itself, so that consecutive V channel steps can be applied
+    to a single plane without converting the image to the HSV color space and back for every step.
+    Args:
+        image (numpy.ndarray): The input image in the BGRA format, or a single V channel plane.
+    Returns:
+        tuple: The HSV image, None for a single plane, and the V channel.
+    """
+    if image.ndim == 2:
+        return None, image
+
+    imageHSV = get_hsv(image, writable=True)                        # convert the image to HSV color space
+    return imageHSV, imageHSV[:, :, 2]
+
+
+def set_v_channel(image, imageHSV, vChannel):
+    """
+    Helper function to write the processed V channel back to the image it was taken from by 'get_v_channel'.
+    Args:
+        image (numpy.ndarray): The input image in the BGRA format, or a single V channel plane.
+        imageHSV (numpy.ndarray): The HSV image returned by 'get_v_channel', None for a single plane.
+        vChannel (numpy.ndarray): The processed V channel.
+    Returns:
+        image (numpy.ndarray): The processed image in the BGRA format, or the processed V channel for a single plane.
+    """
+    if imageHSV is None:
+        return vChannel
+
+    imageHSV[:, :, 2] = vChannel
+    image[:, :, :3] = cv2.cvtColor(imageHSV, cv2.COLOR_HSV2BGR)               # convert back to BGRA color space
+    return image
+
+
+def fill_random_bands(out, seed, fill):
+    """
+    Helper function to fill an array with random samples band by band of rows, the bands are filled in parallel.
+    Every band draws from its own 'numpy.random.Generator', whose stream is spawned from the seed for the index of the band,
+    so the samples only depend on the seed and the shape of the array, not on the number of threads or the order of the bands.
+    Args:
+        out (numpy.ndarray): The array to be filled, split along its first axis.
+        seed (int): The seed of the random streams, None draws a fresh seed from the operating system.
+        fill (callable): Fills the rows of a band, called with the generator of the band and the slice of its rows.
+    Returns:
+        out (numpy.ndarray): The filled array.
+    """
+    height = out.shape[0]
+    bands = [slice(top, min(top + constants.NOISE_BAND_ROWS, height)) for top in range(0, height, constants.NOISE_BAND_ROWS)]
+    generators = [np.random.default_rng(stream) for stream in np.random.SeedSequence(seed).spawn(len(bands))]
+
+    workers = min(len(bands), os.cpu_count() or 1)
+    if workers <= 1:
+        for generator, rows in zip(generators, bands):
+            fill(generator, rows)
+    else:
+        # the generators release the GIL while drawing the samples
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(fill, generators, bands))
+
+    return out
+
+
+def set_bgr_channels(imageBGRA, imageBGR, mask=None):
+    """
+    Helper function to get a copy of an image with its color channels replaced, only in the pixels selected by a mask if one is given.
+    Args:
+        imageBGRA (numpy.ndarray): The input image in the BGRA format, it is not modified.
+        imageBGR (numpy.ndarray): The new color channels, or a single plane set to all the three channels.
+        mask (numpy.ndarray): A mask selecting the pixels to be replaced, or None.
+    Returns:
+        imageBGRA (numpy.ndarray): The new image in the BGRA format.
+    """
+    imageBGR = imageBGR[:, :, np.newaxis] if imageBGR.ndim == 2 else imageBGR
+    output = imageBGRA.copy()
+
+    if mask is None:
+        output[:, :, :3] = imageBGR
+    else:
+        np.copyto(output[:, :, :3], imageBGR, where=mask[:, :, np.newaxis] > 0)
+
+    return output
+
+
+@functools.lru_cache(maxsize=constants.TRANSFER_FUNCTION_CACHE_SIZE)
+def get_transfer_function(shape, filter_type, radius):
+    """
+    Helper function to build the transfer function of an ideal low-pass or high-pass filter for the real DFT of an image.
+    The image is transformed at its own size, padding it to a faster DFT size would change its periodic extension and the set of
+    frequencies inside the cut-off, and so the output all over the image. The transfer function is laid out like the CCS-packed spectrum returned
+    by 'cv2.dft' for a real input, the real and imaginary parts of a frequency get the same value, so the spectrum is filtered by
+    an element-wise product without shifting it. The transfer functions are cached, as they only depend on the parameters.
+    Args:
+        shape (tuple): The (height, width) of the image.
+        filter_type (str): 'Low Pass' or 'High Pass'.
+        radius (int): The cut-off frequency.
+    Returns:
+        transfer (numpy.ndarray): The read-only float32 transfer function in the size of the image.
+    """
+    height, width = shape
+    rows, columns = np.arange(height), np.arange(width)
+
+    # the columns hold the real and imaginary parts of the non-negative horizontal frequencies side by side,
+    # the rows hold the signed vertical frequencies, except in the columns of the frequencies 0 and width / 2,
+    # which hold the real and imaginary parts of the non-negative vertical frequencies in consecutive rows
+    x = (columns + 1) // 2
+    y = np.abs((rows + height // 2) % height - height // 2)
+    packed_y = (rows + 1) // 2
+
+    distance = np.sqrt(y[:, None] ** 2 + x[None, :] ** 2)
+    distance[:, 0] = packed_y
+    if width % 2 == 0:
+        distance[:, -1] = np.sqrt(packed_y ** 2 + x[-1] ** 2)
+
+    if filter_type == 'Low Pass':
+        transfer = (distance <= radius).astype(np.float32)
+    elif filter_type == 'High Pass':
+        transfer = (distance > radius).astype(np.float32)
+    else:
+        raise ValueError("filter_type must be 'Low Pass' or 'High Pass'")
+
+    transfer.flags.writeable = False            # the cached array is shared by all the calls
+    return transfer
+
+
+@functools.lru_cache(maxsize=constants.SPATIAL_MASK_CACHE_SIZE)
+def get_rounded_corners(radius):
+    """
+    Helper function to get the pixels left out by the rounded corners of a rectangle.
+    The coverage of every pixel of a corner square by the circle of the corner is its exact area inside the circle, computed
+    from the area of the circle below and left of every pixel corner, and a pixel is kept if more than half of it is covered.
+    The squares are computed row by row at the size of the image, the corners are mirrors of each other.
+    Args:
+        radius (int): The radius of the corners.
+    Returns:
+        tuple: The read-only boolean arrays of the top-left, top-right, bottom-left and bottom-right corner squares,
+            True for the pixels outside the rectangle.
+    """
+    squared = float(radius) ** 2
+    edges = np.arange(radius + 1, dtype=np.float64)         # the distances of the pixel edges from the center of the circle
+
+    def get_area(height):
+        # the area of the quarter circle within [0, x] x [0, height] for every edge x, from the integral of its upper half
+        def integral(x):
+            return (x * np.sqrt(squared - x ** 2) + squared * np.arcsin(x / radius)) / 2
+
+        crossing = np.minimum(np.sqrt(max(squared - height ** 2, 0.0)), edges)     # where the circle leaves the strip of the height
+        return height * crossing + integral(edges) - integral(crossing)
+
+    # the bottom-right corner square, with the center of the circle at its top-left corner
+    outside = np.empty((radius, radius), dtype=bool)
+    below = get_area(0.0)
+    for row in range(radius):
+        above = get_area(row + 1.0)
+        coverage = np.diff(above) - np.diff(below)
+        outside[row] = coverage * 255 <= 127
+        below = above
+
+    outside.flags.writeable = False         # the cached arrays are shared by all the calls
+    return outside[::-1, ::-1], outside[::-1, :], outside[:, ::-1], outside
+
+
+@functools.lru_cache(maxsize=constants.SPATIAL_MASK_CACHE_SIZE)
+def get_rounded_rect_mask(shape, width, height, left, top, radius, invert=False):
+    """
+    Helper function to build the mask of a rectangle with rounded corners.
+    The corners are covered by the circles of the corners, see 'get_rounded_corners', the rest of the rectangle is filled directly.
+    The masks are cached, as dragging the sliders of the mask asks for the same few masks again and again.
+    Args:
+        shape (tuple): The (height, width) of the image.
+        width (int): The width of the rectangle, within the image.
+        height (int): The height of the rectangle, within the image.
+        left (int): The x-coordinate of the top-left corner of the rectangle.
+        top (int): The y-coordinate of the top-left corner of the rectangle.
+        radius (int): The radius of the corners, at most half of the width and the height.
+        invert (bool): Whether the pixels outside the rectangle are selected instead.
+    Returns:
+        mask (numpy.ndarray): The read-only uint8 mask, 255 for the selected pixels and 0 elsewhere.
+    """
+    inside, outside = (0, 255) if invert else (255, 0)
+
+    mask = np.full(shape, outside, dtype=np.uint8)
+    mask[top:top + height, left:left + width] = inside
+
+    if radius > 0:
+        top_left, top_right, bottom_left, bottom_right = get_rounded_corners(radius)
+
+        bottom, right = top + height - radius, left + width - radius
+        mask[top:top + radius, left:left + radius][top_left] = outside
+        mask[top:top + radius, right:right + radius][top_right] = outside
+        mask[bottom:bottom + radius, left:left + radius][bottom_left] = outside
+        mask[bottom:bottom + radius, right:right + radius][bottom_right] = outside
+
+    mask.flags.writeable = False            # the cached array is shared by all the calls
+    return mask
+
+
+def get_magnitude_spectrum(channel):
+    """
+    Helper function to get the log magnitude spectrum of a channel for display, with the zero frequency in the center.
+    The channel is transformed with the real DFT, whose CCS-packed output holds only the non-negative horizontal frequencies,
+    the magnitudes of the negative horizontal frequencies are mirrored from them as the spectrum of a real channel is symmetric.
+    Args:
+        channel (numpy.ndarray): The single-channel image.
+    Returns:
+        spectrum (numpy.ndarray): The logarithm of the magnitude spectrum normalized to uint8, in the size of the channel.
+    """
+    height, width = channel.shape
+    packed = cv2.dft(np.float32(channel))
+    rows = np.arange(height)
+    half = np.empty((height, width // 2 + 1), np.float32)      # the magnitudes of the non-negative horizontal frequencies
+
+    # the columns hold the real and imaginary parts of the horizontal frequencies side by side
+    pairs = (width - 1) // 2
+    half[:, 1:pairs + 1] = np.hypot(packed[:, 1:2 * pairs:2], packed[:, 2:2 * pairs + 1:2])
+
+    # the columns of the frequencies 0 and width / 2 hold the real and imaginary parts of the vertical frequencies in consecutive rows
+    for column, frequency in [(0, 0)] + ([(width - 1, width // 2)] if width % 2 == 0 else []):
+        values = packed[:, column]
+        magnitudes = np.empty(height // 2 + 1, np.float32)
+        magnitudes[0] = abs(values[0])
+        magnitudes[1:(height - 1) // 2 + 1] = np.hypot(values[1:height - 1:2], values[2:height:2])[:(height - 1) // 2]
+        if height % 2 == 0:
+            magnitudes[height // 2] = abs(values[-1])
+        half[:, frequency] = magnitudes[np.minimum(rows, height - rows)]
+
+    # the magnitude of the frequency (-y, -x) equals the magnitude of (y, x)
+    magnitude = np.empty((height, width), np.float32)
+    magnitude[:, :width // 2 + 1] = half
+    magnitude[:, width // 2 + 1:] = half[(-rows) % height, (width - 1) // 2:0:-1]
+
+    magnitude = np.fft.fftshift(magnitude)
+    magnitude_log = cv2.log(cv2.add(magnitude, 1, dst=magnitude), dst=magnitude)
+    return cv2.normalize(magnitude_log, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
+
+
+def get_sampling_step(image, max_pixels=None):
+    """
+    Helper function to get the stride sampling an image down to at most the given number of pixels.
+    Args:
+        image (numpy.ndarray): The image to be sampled.
+        max_pixels (int): The largest number of sampled pixels, None to sample every pixel.
+    Returns:
+        step (int): The stride of the sampled rows and columns, 1 if the image is small enough.
+    """
+    pixels = image.shape[0] * image.shape[1]
+    if max_pixels is None or pixels <= max_pixels:
+        return 1
+
+    return math.ceil(math.sqrt(pixels / max_pixels))
+
+
+def get_histograms(image):
+    """
+    Helper function to count the pixels of every value in every channel of an uint8 image, with one bin per value.
+    Args:
+        image (numpy.ndarray): The single-channel or multi-channel uint8 image.
+    Returns:
+        histograms (numpy.ndarray): The float32 counts of the 256 values, with the shape (channels, 256).
+    """
+    image = np.ascontiguousarray(image)
+    channel_count = image.shape[2] if image.ndim == 3 else 1
 
+    return np.stack([cv2.calcHist([image], [i], None, [256], [0, 256]).ravel() for i in range(channel_count)])
@@ -2,33 +2,39 @@ from app import processor_utils
 import numpy as np
 import cv2
 
-def add_gaussian_noise(imageBGRA, mean, std, mask=None):
+def add_gaussian_noise(imageBGRA, mean, std, mask=None, grayscale=None, seed=None):
     """
     Adds Gaussian noise to the given image.
+    The float32 samples are drawn in parallel bands of rows, see 'processor_utils.fill_random_bands'.
     Args:
         imageBGRA (numpy.ndarray): The input image in the BGRA format.
         mean (float): The mean value for the Gaussian noise.
         std (float): The standard deviation for the Gaussian noise.
         mask (numpy.ndarray): A mask to apply the noise only to certain pixels.
+        grayscale (bool): Whether the whole image is grayscale, if the image is only a part of it. Default is None, which checks the given image.
+        seed (int): The seed of the noise, the same seed gives the same noise. Default is None, which gives a different noise every time.
     Returns:
         imageBGRA (numpy.ndarray): The image with Gaussian noise added in the BGRA format.
     """
-    imageBGR = cv2.cvtColor(imageBGRA, cv2.COLOR_BGRA2BGR).astype(np.float32)          # convert the BGRA image to BGR color space
-
-    # If the image is grayscale, make the noise channels identical
-    if processor_utils.is_image_grayscale(imageBGRA):
-        noise = np.random.normal(mean, std, imageBGR[:, :, 0].shape).astype(np.float32) 
-        noise = cv2.merge((noise, noise, noise))
+    # If the image is grayscale, make the noise channels identical by adding the noise to a single channel
+    if grayscale is None:
+        grayscale = processor_utils.is_image_grayscale(imageBGRA)
+    if grayscale:
+        source = np.ascontiguousarray(imageBGRA[:, :, 0])
     else:
-        noise = np.random.normal(mean, std, imageBGR.shape).astype(np.float32)
+        source = cv2.cvtColor(imageBGRA, cv2.COLOR_BGRA2BGR)           # convert the BGRA image to BGR color space
+
+    noise = np.empty(source.shape, dtype=np.float32)
+
+    def fill(generator, rows):
+        band = noise[rows]
+        generator.standard_normal(dtype=np.float32, out=band)
+        band *= std
+        band += mean
 
-    noised = cv2.add(imageBGR, noise)                                # add noise
+    processor_utils.fill_random_bands(noise, seed, fill)
 
-    # If a mask is provided, use it to update only the pixels where mask != 0
-    mask3 = None if mask is None else mask[:, :, np.newaxis]                # expand the mask dimensions to match the noise shape
-    imageBGR = noised if mask3 is None else np.where(mask3 > 0, noised, imageBGR)
+    noised = cv2.add(source, noise, dtype=cv2.CV_8U)                # add noise, saturating to the range [0, 255]
 
-    imageBGR = np.clip(imageBGR, 0, 255).astype(np.uint8)       # clip the values to the range [0, 255]
-    imageBGRA = cv2.merge((imageBGR, imageBGRA[:, :, 3]))       # set back the alpha channel to make it BGRA
-    
-    return imageBGRA
\ No newline at end of file
+    # If a mask is provided, update only the pixels where mask != 0
+    return processor_utils.set_bgr_channels(imageBGRA, noised, mask)
@@ -2,29 +2,32 @@ from app import processor_utils
 import numpy as np
 import cv2
 
-def add_poisson_noise(imageBGRA, mask=None):
+def add_poisson_noise(imageBGRA, mask=None, grayscale=None, seed=None):
     """
     Applies Poisson noise to the input image.
+    The samples are drawn in parallel bands of rows, see 'processor_utils.fill_random_bands'.
     Args:
         imageBGRA (numpy.ndarray): Input image in BGRA format.
         mask (numpy.ndarray): A mask to apply the noise only to certain pixels.
+        grayscale (bool): Whether the whole image is grayscale, if the image is only a part of it. Default is None, which checks the given image.
+        seed (int): The seed of the noise, the same seed gives the same noise. Default is None, which gives a different noise every time.
     Returns:
         numpy.ndarray: The resulting image with Poisson noise applied, in BGRA format.
     """
-    imageBGR = cv2.cvtColor(imageBGRA, cv2.COLOR_BGRA2BGR)      # convert the BGRA image to BGR color space
-
-    # If the image is grayscale, make the noise channels identical
-    if processor_utils.is_image_grayscale(imageBGRA):
-        imageGray = np.random.poisson(imageBGR[:, :, 0].astype(np.float32))
-        imageBGR = cv2.merge((imageGray, imageGray, imageGray))
+    # If the image is grayscale, make the noise channels identical by drawing the noise for a single channel
+    if grayscale is None:
+        grayscale = processor_utils.is_image_grayscale(imageBGRA)
+    if grayscale:
+        source = imageBGRA[:, :, 0]
     else:
-        imageBGR = np.random.poisson(imageBGR.astype(np.float32))
+        source = cv2.cvtColor(imageBGRA, cv2.COLOR_BGRA2BGR)           # convert the BGRA image to BGR color space
+
+    noised = np.empty(source.shape, dtype=np.uint8)
+
+    def fill(generator, rows):
+        noised[rows] = np.minimum(generator.poisson(source[rows]), 255)    # clip the values to the range [0, 255]
 
-    # If a mask is provided, use it to update only the pixels where mask != 0
-    mask3 = None if mask is None else mask[:, :, np.newaxis]                # expand the mask dimensions to match the noise shape
-    imageBGR = imageBGR if mask3 is None else np.where(mask3 > 0, imageBGR, imageBGRA[:, :, :3])
-    
-    imageBGR = np.clip(imageBGR, 0, 255).astype(np.uint8)       # clip the values to the range [0, 255]
-    imageBGRA = cv2.merge((imageBGR, imageBGRA[:, :, 3]))       # set back the alpha channel to make it BGRA
+    processor_utils.fill_random_bands(noised, seed, fill)
 
-    return imageBGRA
\ No newline at end of file
+    # If a mask is provided, update only the pixels where mask != 0
+    return processor_utils.set_bgr_channels(imageBGRA, noised, mask)
@@ -1,32 +1,32 @@
+from app import processor_utils
 import numpy as np
-import cv2
 
-def add_salt_and_pepper(imageBGRA, saltPepProb, mask=None):
+def add_salt_and_pepper(imageBGRA, saltPepProb, mask=None, seed=None):
     """
     Adds salt and pepper noise to the given image.
+    Every pixel turns white with the given probability and black with the same probability, decided by a uniform float32
+    sample drawn for every pixel in parallel bands of rows, see 'processor_utils.fill_random_bands'.
     Args:
         imageBGRA (numpy.ndarray): The input image in the BGRA format.
-        saltPepProb (float): The probability of salt and pepper noise to be added to the image.
+        saltPepProb (float): The probability of a pixel to become salt, and of a pixel to become pepper.
         mask (numpy.ndarray): A mask to apply the noise only to certain pixels.
+        seed (int): The seed of the noise, the same seed gives the same noise. Default is None, which gives a different noise every time.
     Returns 
         imageBGRA (numpy.ndarray): The image with salt and pepper noise added in the BGRA format.
     """
-    imageBGR = cv2.cvtColor(imageBGRA, cv2.COLOR_BGRA2BGR)          # convert the BGRA image to BGR color space
-    numSalt = int(imageBGR.size * saltPepProb)                      # number of salt pixels to add
-    numPep = int(imageBGR.size * saltPepProb)                       # number of pepper pixels to add
+    samples = np.empty(imageBGRA.shape[:2], dtype=np.float32)
+    processor_utils.fill_random_bands(samples, seed, lambda generator, rows: generator.random(dtype=np.float32, out=samples[rows]))
 
-    # generate random coordinates for salt and pepper noise
-    saltCoords = [np.random.randint(0, i-1, numSalt) for i in imageBGR.shape]
-    pepCoords = [np.random.randint(0, i-1, numPep) for i in imageBGR.shape]
-    
-    imageBGR[saltCoords[0], saltCoords[1]] = [255, 255, 255]    # add salt noise
-    imageBGR[pepCoords[0], pepCoords[1]] = [0,0,0]              # add pepper noise
+    salt = samples < saltPepProb                                    # the samples below the probability are salt
+    pepper = (samples >= saltPepProb) & (samples < 2 * saltPepProb) # the next ones of the same probability are pepper
 
+    # If a mask is provided, add the noise only to the pixels where mask != 0
+    if mask is not None:
+        salt &= mask > 0
+        pepper &= mask > 0
 
-    # If a mask is provided, use it to update only the pixels where mask != 0
-    mask3 = None if mask is None else mask[:, :, np.newaxis]                # Expand the mask dimensions to match the noise shape
-    imageBGR = imageBGR if mask3 is None else np.where(mask3 > 0, imageBGR, imageBGRA[:, :, :3])
+    imageBGRA = imageBGRA.copy()
+    imageBGRA[salt, :3] = 255                                       # add salt noise
+    imageBGRA[pepper, :3] = 0                                       # add pepper noise
 
-    imageBGRA = cv2.merge((imageBGR, imageBGRA[:, :, 3]))       # set back the alpha channel to make it BGRA
-    
-    return imageBGRA 
\ No newline at end of file
+    return imageBGRA
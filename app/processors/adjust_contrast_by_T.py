@@ -1,3 +1,4 @@
+from app import processor_utils
 import numpy as np
 import cv2
 
@@ -5,21 +6,19 @@ def adjust_contrast_by_T(imageBGRA, alpha, beta, mask=None):
     """
     Adjusts the contrast of the given image by applying a linear transformation to the V channel of the image.
     Args:
-        imageBGRA (numpy.ndarray): The input image in the BGRA format.
+        imageBGRA (numpy.ndarray): The input image in the BGRA format, or its V channel as a single plane.
         alpha (float): The scaling factor for the V channel of the image.
         beta (int): The offset value for the V channel of the image.
         mask (numpy.ndarray): A mask to apply the contrast adjustment only to certain pixels.
     Returns:
-        imageBGRA (numpy.ndarray): The image with adjusted contrast in the BGRA format.
+        imageBGRA (numpy.ndarray): The image with adjusted contrast in the BGRA format, or the processed V channel for a single plane.
     """
-    imageHSV = cv2.cvtColor(imageBGRA[:, :, :3], cv2.COLOR_BGR2HSV)      # convert the image to HSV color space
+    imageHSV, vChannel = processor_utils.get_v_channel(imageBGRA)      # get the V channel, converting the image to HSV color space unless it is a single plane
 
     # apply the contrast adjustment to the v channel of the HSVA image
-    enhanced = cv2.convertScaleAbs(imageHSV[:, :, 2], -1, alpha, beta) 
+    enhanced = cv2.convertScaleAbs(vChannel, -1, alpha, beta) 
 
     # If a mask is provided, use it to update only the pixels where mask != 0
-    imageHSV[:, :, 2] = enhanced if mask is None else np.where(mask > 0, enhanced, imageHSV[:, :, 2])
+    enhanced = enhanced if mask is None else np.where(mask > 0, enhanced, vChannel)
 
-    imageBGRA[:, :, :3] = cv2.cvtColor(imageHSV, cv2.COLOR_HSV2BGR)               # convert back to BGRA color space
-
-    return imageBGRA
\ No newline at end of file
+    return processor_utils.set_v_channel(imageBGRA, imageHSV, enhanced)      # convert back to BGRA color space
\ No newline at end of file
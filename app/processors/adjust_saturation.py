@@ -2,7 +2,7 @@ from app import processor_utils
 import numpy as np
 import cv2
 
-def adjust_saturation(imageBGRA, value, mask=None):
+def adjust_saturation(imageBGRA, value, mask=None, grayscale=None):
     """
     Adjusts the saturation of the given image by adding a value to the S channel of the image.
     Args:
@@ -10,13 +10,17 @@ def adjust_saturation(imageBGRA, value, mask=None):
         value (int): The value to be added to the S channel of the image.
         color_space (str): The color space to which the saturation adjustment should be applied.
         mask (numpy.ndarray): A mask to apply the brightness only to certain pixels.
+        grayscale (bool): Whether the whole image is grayscale, if the image is only a tile of it. Default is None, which checks the given image.
     Returns:
         imageBGRA (numpy.ndarray): The image with adjusted saturation in the BGRA format.
     """
-    if processor_utils.is_image_grayscale(imageBGRA):
+    if grayscale is None:
+        grayscale = processor_utils.is_image_grayscale(imageBGRA)
+
+    if grayscale:
         return imageBGRA
 
-    imageHSV = cv2.cvtColor(imageBGRA[:, :, :3], cv2.COLOR_BGR2HSV)     # convert the image to HSVA color space
+    imageHSV = processor_utils.get_hsv(imageBGRA, writable=True)        # convert the image to HSVA color space
     adjusted = cv2.add(imageHSV[:, :, 1], value)                        # adjust the S channel of the HSVA image
     
     # If a mask is provided, use it to update only the pixels where mask != 0
@@ -1,55 +1,53 @@
 import numpy as np
 import cv2
 
-def apply_frequency_filter(imageBGRA, filter_radius1, filter_type='Low Pass'):
+from app import processor_utils
+
+def apply_frequency_filter(imageBGRA, filter_radius1, filter_type='Low Pass', luminance_only=False):
     """
     Applies a frequency domain filter to each color channel of the input BGRA image.
+    The channels are transformed with the real DFT, and filtered by a cached transfer function.
     Args:
-        imageBGRA (ndarray): Input image in BGRA format.
+        imageBGRA (ndarray): Input image in BGRA format, or a grayscale single plane.
         filter_radius1 (int): Radius for low-pass or high-pass filter.
-        filter_radius2 (int, optional): Secondary radius for band-pass/band-stop. Defaults to None.
-        filter_type (str): Type of filter - 'low' or 'high'.
+        filter_type (str): Type of filter - 'Low Pass' or 'High Pass'.
+        luminance_only (bool): If True, only the luminance of the image is filtered, which takes one transform instead of three.
     Returns:
-        ndarray: Filtered image in BGRA format.
+        ndarray: Filtered image in BGRA format, or a single plane for a single plane input.
     """
     height, width = imageBGRA.shape[:2]
-    center = (width // 2, height // 2)
-
-    # Create mask template
-    mask = np.zeros((height, width, 2), np.float32)
-
-    # Distance map
-    Y, X = np.ogrid[:height, :width]
-    distance = np.sqrt((X - center[0]) ** 2 + (Y - center[1]) ** 2)
+    transfer = processor_utils.get_transfer_function((height, width), filter_type, filter_radius1)
 
-    if filter_type == 'Low Pass':
-        mask[:,:,0] = mask[:,:,1] = (distance <= filter_radius1).astype(np.float32)
-    elif filter_type == 'High Pass':
-        mask[:,:,0] = mask[:,:,1] = (distance > filter_radius1).astype(np.float32)
+    if imageBGRA.ndim == 2:
+        channels = [imageBGRA]          # the luminance and every color channel of a grayscale single plane are the plane itself
+    elif luminance_only:
+        imageYCrCb = cv2.cvtColor(imageBGRA[:, :, :3], cv2.COLOR_BGR2YCrCb)
+        channels = [imageYCrCb[:, :, 0]]
     else:
-        raise ValueError("filter_type must be 'low' or 'high'")
+        channels = cv2.split(imageBGRA[:, :, :3])     # Only B, G, R channels
 
     filtered_channels = []
-    for i in range(3):  # Only B, G, R channels
-        # Convert to float32
-        ch_float = np.float32(imageBGRA[:, :, i])
-        dft = cv2.dft(ch_float, flags=cv2.DFT_COMPLEX_OUTPUT)
-        dft_shift = np.fft.fftshift(dft)
+    for channel in channels:
+        # Transform the channel, the spectrum of the real channel is packed into a single float32 plane
+        dft = cv2.dft(np.float32(channel))
 
-        # Apply mask in frequency domain
-        fshift_filtered = dft_shift * mask
+        # Apply the transfer function in frequency domain
+        dft *= transfer
 
-        # Inverse DFT
-        f_ishift = np.fft.ifftshift(fshift_filtered)
-        img_back = cv2.idft(f_ishift)
-        img_back = cv2.magnitude(img_back[:,:,0], img_back[:,:,1])
+        # Inverse DFT, the filtered channel is real
+        img_back = np.abs(cv2.idft(dft, flags=cv2.DFT_REAL_OUTPUT))
 
         # Normalize to 0-255 and convert to uint8
         img_back_norm = cv2.normalize(img_back, None, 0, 255, cv2.NORM_MINMAX)
         filtered_channels.append(img_back_norm.astype(np.uint8))
 
-
-    output_bgr = cv2.merge(filtered_channels)                       # Merge filtered BGR channels
+    if imageBGRA.ndim == 2:
+        return filtered_channels[0]
+    elif luminance_only:
+        imageYCrCb[:, :, 0] = filtered_channels[0]
+        output_bgr = cv2.cvtColor(imageYCrCb, cv2.COLOR_YCrCb2BGR)
+    else:
+        output_bgr = cv2.merge(filtered_channels)                   # Merge filtered BGR channels
     output_bgra = cv2.merge((output_bgr, imageBGRA[:, :, 3]))           # Preserve original alpha channel
 
-    return output_bgra
\ No newline at end of file
+    return output_bgra
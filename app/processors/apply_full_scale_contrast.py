@@ -1,24 +1,26 @@
+from app import processor_utils
 import numpy as np
 import cv2
 
-def apply_full_scale_contrast(imageBGRA, mask=None):
+def apply_full_scale_contrast(imageBGRA, mask=None, v_range=None):
     """
     Adjusts the contrast of the given image by applying full scale contrast stretching to the V channel of the image.
     Args:
-        imageBGRA (numpy.ndarray): The input image in the BGRA format.
+        imageBGRA (numpy.ndarray): The input image in the BGRA format, or its V channel as a single plane.
         mask (numpy.ndarray): A mask to apply the contrast adjustment only to certain pixels.
+        v_range (tuple): The (min, max) of the V channel of the whole image, if the image is only a tile of it. Default is None.
     Returns:
-        imageBGRA (numpy.ndarray): The image with adjusted contrast in the BGRA format.
+        imageBGRA (numpy.ndarray): The image with adjusted contrast in the BGRA format, or the processed V channel for a single plane.
     """
-    imageHSV = cv2.cvtColor(imageBGRA[:, :, :3], cv2.COLOR_BGR2HSV)      # convert the image to HSV color space
+    imageHSV, vChannel = processor_utils.get_v_channel(imageBGRA)      # get the V channel, converting the image to HSV color space unless it is a single plane
 
     # perform full scale contrast stretching
-    enhanced = cv2.normalize(imageHSV[:, :, 2], None, 0, 255, cv2.NORM_MINMAX)
+    if v_range is None:
+        enhanced = cv2.normalize(vChannel, None, 0, 255, cv2.NORM_MINMAX)
+    else:
+        enhanced = processor_utils.normalize_by_range(vChannel, v_range, 255)
 
     # If a mask is provided, use it to update only the pixels where mask != 0
-    imageHSV[:, :, 2] = enhanced if mask is None else np.where(mask > 0, enhanced, imageHSV[:, :, 2])
+    enhanced = enhanced if mask is None else np.where(mask > 0, enhanced, vChannel)
 
-    imageBGRA[:, :, :3] = cv2.cvtColor(imageHSV, cv2.COLOR_HSV2BGR)               # convert back to BGRA color space
-
-
-    return imageBGRA
\ No newline at end of file
+    return processor_utils.set_v_channel(imageBGRA, imageHSV, enhanced)      # convert back to BGRA color space
\ No newline at end of file
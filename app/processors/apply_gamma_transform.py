@@ -1,3 +1,4 @@
+from app import processor_utils
 import numpy as np
 import cv2
 
@@ -5,21 +6,18 @@ def apply_gamma_transform(imageBGRA, gamma, mask=None):
     """
     Adjusts the contrast of the given image by applying gamma transformation to the V channel of the image.
     Args:
-        imageBGRA (numpy.ndarray): The input image in the BGRA format.
+        imageBGRA (numpy.ndarray): The input image in the BGRA format, or its V channel as a single plane.
         gamma (float): The gamma value for the transformation.
         mask (numpy.ndarray): A mask to apply the contrast adjustment only to certain pixels.
     Returns:
-        imageBGRA (numpy.ndarray): The image with adjusted contrast in the BGRA format.
+        imageBGRA (numpy.ndarray): The image with adjusted contrast in the BGRA format, or the processed V channel for a single plane.
     """
-    imageHSV = cv2.cvtColor(imageBGRA[:, :, :3], cv2.COLOR_BGR2HSV)      # convert the image to HSV color space
-    vChannel = imageHSV[:, :, 2].astype(np.float32) / 255.0    # get the V channel of the HSVA image
-    vChannel = cv2.pow(vChannel, gamma)                         # apply gamma transformation
-    enhanced = (vChannel*255).astype(np.uint8)        # update the V channel of the HSVA image
+    imageHSV, vChannel = processor_utils.get_v_channel(imageBGRA)      # get the V channel, converting the image to HSV color space unless it is a single plane
+    normalized = vChannel.astype(np.float32) / 255.0            # normalize the V channel to 0-1 range
+    normalized = cv2.pow(normalized, gamma)                         # apply gamma transformation
+    enhanced = (normalized*255).astype(np.uint8)        # update the V channel of the HSVA image
     
     # If a mask is provided, use it to update only the pixels where mask != 0
-    imageHSV[:, :, 2] = enhanced if mask is None else np.where(mask > 0, enhanced, imageHSV[:, :, 2])
+    enhanced = enhanced if mask is None else np.where(mask > 0, enhanced, vChannel)
 
-    imageBGRA[:, :, :3] = cv2.cvtColor(imageHSV, cv2.COLOR_HSV2BGR)               # convert back to BGRA color space
-
-
-    return imageBGRA
\ No newline at end of file
+    return processor_utils.set_v_channel(imageBGRA, imageHSV, enhanced)      # convert back to BGRA color space
\ No newline at end of file
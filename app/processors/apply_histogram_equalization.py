@@ -1,23 +1,25 @@
+from app import processor_utils
 import numpy as np
 import cv2
 
-def apply_histogram_equalization(imageBGRA, mask=None):
+def apply_histogram_equalization(imageBGRA, mask=None, histogram=None):
     """
     Applies histogram equalization to the V channel of the given image.
     Args:
-        imageBGRA (numpy.ndarray): The input image in the BGRA format.
+        imageBGRA (numpy.ndarray): The input image in the BGRA format, or its V channel as a single plane.
         mask (numpy.ndarray): A mask to apply the histogram equalization only to certain pixels.
+        histogram (tuple): The 256-bin histogram of the V channel of the whole image, if the image is only a tile of it. Default is None.
     Returns 
-        imageBGRA (numpy.ndarray): Histogram equalization applied image in the BGRA format.
+        imageBGRA (numpy.ndarray): Histogram equalization applied image in the BGRA format, or the processed V channel for a single plane.
     """
-    imageHSV = cv2.cvtColor(imageBGRA[:, :, :3], cv2.COLOR_BGR2HSV)      # convert the image to HSV color space
+    imageHSV, vChannel = processor_utils.get_v_channel(imageBGRA)      # get the V channel, converting the image to HSV color space unless it is a single plane
 
-    enhanced = cv2.equalizeHist(imageHSV[:, :, 2])       # equalize the V channel of the HSVA image
+    if histogram is None:
+        enhanced = cv2.equalizeHist(vChannel)       # equalize the V channel of the HSVA image
+    else:
+        enhanced = cv2.LUT(vChannel, processor_utils.get_equalization_lut(histogram))
     
     # If a mask is provided, use it to update only the pixels where mask != 0
-    imageHSV[:, :, 2] = enhanced if mask is None else np.where(mask > 0, enhanced, imageHSV[:, :, 2])
+    enhanced = enhanced if mask is None else np.where(mask > 0, enhanced, vChannel)
     
-    imageBGRA[:, :, :3] = cv2.cvtColor(imageHSV, cv2.COLOR_HSV2BGR)               # convert back to BGRA color space
-
-    
-    return imageBGRA
\ No newline at end of file
+    return processor_utils.set_v_channel(imageBGRA, imageHSV, enhanced)      # convert back to BGRA color space
\ No newline at end of file
@@ -1,3 +1,4 @@
+from app import processor_utils
 import numpy as np
 import cv2
 
@@ -6,12 +7,12 @@ def apply_laplacian_sharpening(imageBGRA, alpha, extended=False, mask=None):
     """
     Applies Laplacian sharpening to the V channel of the given image.   
     Args:
-        imageBGRA (numpy.ndarray): The input image in the BGRA format.
+        imageBGRA (numpy.ndarray): The input image in the BGRA format, or its V channel as a single plane.
         alpha (float): The scaling factor for the V channel of the image.
         extended (bool): If True, use extended Laplacian kernel. Default is False.
         mask (numpy.ndarray): A mask to apply the Laplacian sharpening only to certain pixels.
     Returns:
-        imageBGRA (numpy.ndarray): The image with Laplacian sharpening applied in the BGRA format.
+        imageBGRA (numpy.ndarray): The image with Laplacian sharpening applied in the BGRA format, or the processed V channel for a single plane.
     """
     # create the laplace kernel
     if extended:
@@ -19,16 +20,14 @@ def apply_laplacian_sharpening(imageBGRA, alpha, extended=False, mask=None):
     else:
         w = np.array([[0, 1, 0], [1, -4, 1], [0, 1, 0]], dtype=np.float32)
 
-    imageHSV = cv2.cvtColor(imageBGRA[:, :, :3], cv2.COLOR_BGR2HSV)     # convert the image to HSV color space
-    vChannel = imageHSV[:, :, 2].astype(np.float32) / 255.0             # get and normalize the V channel of the HSV image    
-    laplace = cv2.filter2D(vChannel, cv2.CV_32F, w, borderType=cv2.BORDER_REPLICATE)   # get the laplacian filter
-    vChannel = vChannel - laplace * alpha                       # sharpen the image using the laplacian filter
-    vChannel = np.clip(vChannel, 0, 1)                          # clip the image to 0-1 range
-    vChannel = (vChannel * 255).astype(np.uint8)                # convert back to uint8
+    imageHSV, vChannel = processor_utils.get_v_channel(imageBGRA)      # get the V channel, converting the image to HSV color space unless it is a single plane
+    normalized = vChannel.astype(np.float32) / 255.0             # normalize the V channel to 0-1 range
+    laplace = cv2.filter2D(normalized, cv2.CV_32F, w, borderType=cv2.BORDER_REPLICATE)   # get the laplacian filter
+    normalized = normalized - laplace * alpha                   # sharpen the image using the laplacian filter
+    normalized = np.clip(normalized, 0, 1)                      # clip the image to 0-1 range
+    sharpened = (normalized * 255).astype(np.uint8)             # convert back to uint8
 
     # If a mask is provided, use it to update only the pixels where mask != 0
-    imageHSV[:, :, 2] = vChannel if mask is None else np.where(mask > 0, vChannel, imageHSV[:, :, 2])
+    sharpened = sharpened if mask is None else np.where(mask > 0, sharpened, vChannel)
 
-    imageBGRA[:, :, :3] = cv2.cvtColor(imageHSV, cv2.COLOR_HSV2BGR)               # convert back to BGRA color space
-
-    return imageBGRA
\ No newline at end of file
+    return processor_utils.set_v_channel(imageBGRA, imageHSV, sharpened)      # convert back to BGRA color space
\ No newline at end of file
@@ -1,25 +1,33 @@
+from app import processor_utils
 import numpy as np
 import cv2
 
-def apply_log_transform(imageBGRA, mask=None):
+def apply_log_transform(imageBGRA, mask=None, v_range=None):
     """
     Adjusts the contrast of the given image by applying log transformation to the V channel of the image.
     Args:
-        imageBGRA (numpy.ndarray): The input image in the BGRA format.
+        imageBGRA (numpy.ndarray): The input image in the BGRA format, or its V channel as a single plane.
         mask (numpy.ndarray): A mask to apply the contrast adjustment only to certain pixels.
+        v_range (tuple): The (min, max) of the V channel of the whole image, if the image is only a tile of it. Default is None.
     Returns:
-        imageBGRA (numpy.ndarray): The image with adjusted contrast in the BGRA format.
+        imageBGRA (numpy.ndarray): The image with adjusted contrast in the BGRA format, or the processed V channel for a single plane.
     """        
-    imageHSV = cv2.cvtColor(imageBGRA[:, :, :3], cv2.COLOR_BGR2HSV)      # convert the image to HSV color space
+    imageHSV, vChannel = processor_utils.get_v_channel(imageBGRA)      # get the V channel, converting the image to HSV color space unless it is a single plane
 
-    vChannel = imageHSV[:, :, 2].astype(np.float32)            # get the V channel of the HSVA image
-    vChannel = np.log(1 + vChannel)                             # apply log transformation
-    vChannel = cv2.normalize(vChannel, None, 0, 255, cv2.NORM_MINMAX)
-    enhanced = vChannel.astype(np.uint8)              # update the V channel of the HSVA image
+    if v_range is None:
+        logChannel = vChannel.astype(np.float32)                    # get the V channel as floats
+        logChannel = np.log(1 + logChannel)                         # apply log transformation
+        logChannel = cv2.normalize(logChannel, None, 0, 255, cv2.NORM_MINMAX)
+        enhanced = logChannel.astype(np.uint8)              # update the V channel of the HSVA image
+    else:
+        # the log transformation keeps the order of the values, so the levels between the global min and max
+        # are transformed and normalized the same way as the whole image and applied as a look-up table
+        levels = np.log(1 + np.arange(v_range[0], v_range[1] + 1, dtype=np.float32))
+        lut = np.zeros(256, dtype=np.uint8)
+        lut[v_range[0]:v_range[1] + 1] = cv2.normalize(levels, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8).ravel()
+        enhanced = cv2.LUT(vChannel, lut)
 
     # If a mask is provided, use it to update only the pixels where mask != 0
-    imageHSV[:, :, 2] = enhanced if mask is None else np.where(mask > 0, enhanced, imageHSV[:, :, 2])
+    enhanced = enhanced if mask is None else np.where(mask > 0, enhanced, vChannel)
 
-    imageBGRA[:, :, :3] = cv2.cvtColor(imageHSV, cv2.COLOR_HSV2BGR)               # convert back to BGRA color space
-
-    return imageBGRA
\ No newline at end of file
+    return processor_utils.set_v_channel(imageBGRA, imageHSV, enhanced)      # convert back to BGRA color space
\ No newline at end of file
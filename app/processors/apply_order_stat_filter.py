@@ -1,3 +1,4 @@
+from app import processor_utils
 import numpy as np
 import cv2
 
@@ -6,26 +7,24 @@ def apply_order_stat_filter(imageBGRA, kernelSize, order, mask=None):
     """
     Applies order statistics filter to the V channel of the given image.
     Args:
-        imageBGRA (numpy.ndarray): The input image in the BGRA format.
+        imageBGRA (numpy.ndarray): The input image in the BGRA format, or its V channel as a single plane.
         kernelSize (int): The size of the kernel for the filter.
         order (str): The order statistic to be applied. Options are "max", "min", "median".
         mask (numpy.ndarray): A mask to apply the filter only to certain pixels.
     Returns:
-        imageBGRA (numpy.ndarray): The image with order statistics filter applied in the BGRA format.
+        imageBGRA (numpy.ndarray): The image with order statistics filter applied in the BGRA format, or the processed V channel for a single plane.
     """
-    imageHSV = cv2.cvtColor(imageBGRA[:, :, :3], cv2.COLOR_BGR2HSV)      # convert the image to HSV color space
+    imageHSV, vChannel = processor_utils.get_v_channel(imageBGRA)      # get the V channel, converting the image to HSV color space unless it is a single plane
 
     # apply the order statistics filter to the V channel
     if order == "max":
-        filtered = cv2.dilate(imageHSV[:, :, 2], np.ones((kernelSize, kernelSize), np.uint8), borderType=cv2.BORDER_REPLICATE)   
+        filtered = cv2.dilate(vChannel, np.ones((kernelSize, kernelSize), np.uint8), borderType=cv2.BORDER_REPLICATE)   
     elif order == "min":
-        filtered = cv2.erode(imageHSV[:, :, 2], np.ones((kernelSize, kernelSize), np.uint8),borderType=cv2.BORDER_REPLICATE)     
+        filtered = cv2.erode(vChannel, np.ones((kernelSize, kernelSize), np.uint8),borderType=cv2.BORDER_REPLICATE)     
     elif order == "median":
-        filtered = cv2.medianBlur(imageHSV[:, :, 2], kernelSize)  
+        filtered = cv2.medianBlur(vChannel, kernelSize)  
 
     # If a mask is provided, use it to update only the pixels where mask != 0
-    imageHSV[:, :, 2] = filtered if mask is None else np.where(mask > 0, filtered, imageHSV[:, :, 2])
+    filtered = filtered if mask is None else np.where(mask > 0, filtered, vChannel)
 
-    imageBGRA[:, :, :3] = cv2.cvtColor(imageHSV, cv2.COLOR_HSV2BGR)               # convert back to BGRA color space
-
-    return imageBGRA
\ No newline at end of file
+    return processor_utils.set_v_channel(imageBGRA, imageHSV, filtered)      # convert back to BGRA color space
\ No newline at end of file
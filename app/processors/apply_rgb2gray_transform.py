@@ -1,16 +1,14 @@
+from app import processor_utils
 import cv2
 
 def apply_rgb2gray_transform(imageBGRA):
     """
     Converts the given image from RGB to grayscale.
     Args:
-        imageBGRA (numpy.ndarray): The input image in the BGRA format.
+        imageBGRA (numpy.ndarray): The input image in the BGRA format, or a grayscale single plane.
     Returns:
-        imageBGRA (numpy.ndarray): The converted image in the BGRA format.
+        imageBGRA (numpy.ndarray): The converted image in the BGRA format, or a single plane for a single plane input.
     """
-    imageHSV = cv2.cvtColor(imageBGRA[:, :, :3], cv2.COLOR_BGR2HSV)     # convert the image to HSV color space
-    gray = imageHSV[:, :, 2]                                            # get only the V channel of the HSVA image
-    grayBGR = cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)                    # make the binary image 3 channel
-    grayBGRA = cv2.merge((grayBGR, imageBGRA[:, :, 3]))                 # set back the alpha channel of the image
+    gray = processor_utils.get_v_plane(imageBGRA)                       # get only the V channel of the image
 
-    return grayBGRA
\ No newline at end of file
+    return processor_utils.set_gray_output(gray, imageBGRA)             # make it BGRA with the alpha channel of the image
\ No newline at end of file
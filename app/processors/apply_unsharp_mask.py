@@ -1,3 +1,4 @@
+from app import processor_utils
 import numpy as np
 import cv2
 
@@ -5,26 +6,24 @@ def apply_unsharp_mask(imageBGRA, kernelSize, sigma, alpha, mask=None):
     """
     Applies unsharp masking to the V channel of the given image.
     Args:
-        imageBGRA (numpy.ndarray): The input image in the BGRA format.
+        imageBGRA (numpy.ndarray): The input image in the BGRA format, or its V channel as a single plane.
         kernelSize (int): The size of the kernel for the filter.
         sigma (float): The standard deviation for the Gaussian kernel.
         alpha (float): The scaling factor for the V channel of the image.
         mask (numpy.ndarray): A mask to apply the unsharp masking only to certain pixels.
     Returns:
-        imageBGRA (numpy.ndarray): The image with unsharp masking applied in the BGRA format.
+        imageBGRA (numpy.ndarray): The image with unsharp masking applied in the BGRA format, or the processed V channel for a single plane.
     """
-    imageHSV = cv2.cvtColor(imageBGRA[:, :, :3], cv2.COLOR_BGR2HSV)      # convert the image to HSV color space
-    vChannel = imageHSV[:, :, 2].astype(np.float32) / 255.0              # get and normalize the v channel to 0-1 range
+    imageHSV, vChannel = processor_utils.get_v_channel(imageBGRA)      # get the V channel, converting the image to HSV color space unless it is a single plane
+    normalized = vChannel.astype(np.float32) / 255.0             # normalize the V channel to 0-1 range
 
-    Blurred = cv2.GaussianBlur(vChannel, (kernelSize, kernelSize), sigma, borderType=cv2.BORDER_REPLICATE)     
-    Sharp = vChannel - Blurred                                  # get the sharpened filter
-    vChannel = vChannel + Sharp * alpha                         # sharpen the image
-    vChannel = np.clip(vChannel, 0, 1)                          # clip the image to 0-1 range
-    vChannel = (vChannel * 255).astype(np.uint8)                # convert back to uint8
+    Blurred = cv2.GaussianBlur(normalized, (kernelSize, kernelSize), sigma, borderType=cv2.BORDER_REPLICATE)     
+    Sharp = normalized - Blurred                                # get the sharpened filter
+    normalized = normalized + Sharp * alpha                     # sharpen the image
+    normalized = np.clip(normalized, 0, 1)                      # clip the image to 0-1 range
+    sharpened = (normalized * 255).astype(np.uint8)             # convert back to uint8
 
     # If a mask is provided, use it to update only the pixels where mask != 0
-    imageHSV[:, :, 2] = vChannel if mask is None else np.where(mask > 0, vChannel, imageHSV[:, :, 2])
+    sharpened = sharpened if mask is None else np.where(mask > 0, sharpened, vChannel)
 
-    imageBGRA[:, :, :3] = cv2.cvtColor(imageHSV, cv2.COLOR_HSV2BGR)               # convert back to BGRA color space
-
-    return imageBGRA
\ No newline at end of file
+    return processor_utils.set_v_channel(imageBGRA, imageHSV, sharpened)      # convert back to BGRA color space
\ No newline at end of file
@@ -1,3 +1,4 @@
+from app import processor_utils
 import cv2
 import numpy as np
 
@@ -10,7 +11,7 @@ def generate_color_mask(imageBGRA, lowerBound, upperBound, invert=False, prev_ma
     Returns:
         imageBGRA (numpy.ndarray): The masked image in the BGRA format.
     """
-    imageHSV = cv2.cvtColor(imageBGRA[:, :, :3], cv2.COLOR_BGR2HSV)     # convert the image to HSV color space
+    imageHSV = processor_utils.get_hsv(imageBGRA)                       # convert the image to HSV color space
     mask = cv2.inRange(imageHSV[:, :, :3], lowerBound, upperBound)      # create a mask based on the range values
 
     # If a mask is provided (this means double masking) apply mask only where the previous mask is not 0 
@@ -4,10 +4,13 @@ def get_image_complement(imageBGRA):
     """
     Converts the given image to its complement.
     Args:
-        imageBGRA (numpy.ndarray): The input image in the BGRA format.
+        imageBGRA (numpy.ndarray): The input image in the BGRA format, or a grayscale single plane.
     Returns:
-        imageBGRA (numpy.ndarray): The converted image in the BGRA format.
+        imageBGRA (numpy.ndarray): The converted image in the BGRA format, or a single plane for a single plane input.
     """
+    if imageBGRA.ndim == 2:
+        return cv2.bitwise_not(imageBGRA)                           # a single plane has no alpha channel to keep
+
     imageBGR = cv2.cvtColor(imageBGRA, cv2.COLOR_BGRA2BGR)          # convert the BGRA image to BGR color space       
     imageBGR = cv2.bitwise_not(imageBGR)                            # apply bitwise not to the BGR image                    
     imageBGRA = cv2.merge((imageBGR, imageBGRA[:, :, 3]))           # set back the alpha channel to make it BGRA
@@ -1,32 +1,26 @@
+from app import processor_utils
 import numpy as np
 import cv2
 
-def get_laplacian_filter(imageBGRA, extended=False, normalize=False):
+def get_laplacian_filter(imageBGRA, extended=False, normalize=False, response_range=None):
     """
     Applies Laplacian filter to the V channel of the given image.
     Args:
-        imageBGRA (numpy.ndarray): The input image in the BGRA format.
+        imageBGRA (numpy.ndarray): The input image in the BGRA format, or a grayscale single plane.
         extended (bool): If True, use extended Laplacian kernel. Default is False.
         normalize (bool): If True, normalize the filtered image. Default is False.
+        response_range (tuple): The (min, max) of the laplacian of the whole image used for normalizing, if the image is only a tile of it. Default is None.
     Returns:
-        imageBGRA (numpy.ndarray): The image with Laplacian filter applied in the BGRA format.
+        imageBGRA (numpy.ndarray): The image with Laplacian filter applied in the BGRA format, or a single plane for a single plane input.
     """
-    # create the laplace kernel according to the extended switch
-    if extended:
-        w = np.array([[1, 1, 1], [1, -8, 1], [1, 1, 1]], dtype=np.float32)
-    else:
-        w = np.array([[0, 1, 0], [0, -4, 0], [0, 1, 0]], dtype=np.float32)
-
-    imageHSV = cv2.cvtColor(imageBGRA[:, :, :3], cv2.COLOR_BGR2HSV)             # convert the image to HSV color space
-    vChannel = imageHSV[:, :, 2].astype(np.float32) / 255.0                    # get and normalize the V channel of the HSVA image
-    laplace = cv2.filter2D(vChannel, -1, w, borderType=cv2.BORDER_REPLICATE)    # apply the laplace filter to the V channel
+    laplace = processor_utils.get_laplacian_response(imageBGRA, extended)       # apply the laplace filter to the V channel
 
     # normalize the filtered image if the normalize switch is checked
     if normalize:
-        laplace = cv2.normalize(laplace, None, 0, 1, cv2.NORM_MINMAX)
+        response_range = cv2.minMaxLoc(laplace)[:2] if response_range is None else response_range
+        laplace = processor_utils.stretch_to_unit(laplace, response_range)
     
     laplace = (np.clip(laplace, 0, 1) * 255).astype(np.uint8)                   # clip the values to the range [0, 255]  
-    imageBGR = cv2.cvtColor(laplace, cv2.COLOR_GRAY2BGR)                        # mkae the laplace image 3 channel
-    imageBGRA = cv2.merge((imageBGR, imageBGRA[:, :, 3]))                       # set back the alpha channel to make it BGRA
+    imageBGRA = processor_utils.set_gray_output(laplace, imageBGRA)             # make it BGRA with the alpha channel of the image
     
     return imageBGRA
\ No newline at end of file
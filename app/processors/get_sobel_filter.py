@@ -1,35 +1,27 @@
+from app import processor_utils
 import numpy as np
 import cv2
 
 
-def get_sobel_filter(imageBGRA, normalize=False):
+def get_sobel_filter(imageBGRA, normalize=False, response_range=None):
     """
     Applies Sobel filter to the V channel of the given image.
     Args:
-        imageBGRA (numpy.ndarray): The input image in the BGRA format.
+        imageBGRA (numpy.ndarray): The input image in the BGRA format, or a grayscale single plane.
         normalize (bool): If True, normalize the filtered image. Default is False.
+        response_range (tuple): The (min, max) of the gradient magnitude of the whole image used for normalizing, if the image is only a tile of it. Default is None.
         mask (numpy.ndarray): A mask to apply the Sobel filter only to certain pixels.
     Returns:
-        imageBGRA (numpy.ndarray): The image with Sobel filter applied in the BGRA format.
+        imageBGRA (numpy.ndarray): The image with Sobel filter applied in the BGRA format, or a single plane for a single plane input.
     """
-    # create the sobel kernels
-    w_x = np.array([[-1, -2, -1], [0, 0, 0], [1, 2, 1]], dtype=np.float32)
-    w_y = np.array([[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]], dtype=np.float32)
-
-    imageHSV = cv2.cvtColor(imageBGRA[:, :, :3], cv2.COLOR_BGR2HSV)     # convert the image to HSV color space
-    vChannel = imageHSV[:, :, 2].astype(np.float32) / 255.0             # get and normalize the V channel of the HSVA image
-
-    # get the sobel filters
-    sobel_x = cv2.filter2D(vChannel, -1, w_x, borderType=cv2.BORDER_REPLICATE)
-    sobel_y = cv2.filter2D(vChannel, -1, w_y, borderType=cv2.BORDER_REPLICATE)
-    sobel = np.sqrt(sobel_x ** 2 + sobel_y ** 2)
+    sobel = processor_utils.get_sobel_response(imageBGRA)       # get the gradient magnitude of the V channel
 
     # normalize the filtered image if the normalize switch is checked
     if normalize:
-        sobel = cv2.normalize(sobel, None, 0, 1, cv2.NORM_MINMAX)
+        response_range = cv2.minMaxLoc(sobel)[:2] if response_range is None else response_range
+        sobel = processor_utils.stretch_to_unit(sobel, response_range)
 
     sobel = (np.clip(sobel, 0, 1) * 255).astype(np.uint8)       # clip the values to the range [0, 255]
-    imageBGR = cv2.cvtColor(sobel, cv2.COLOR_GRAY2BGR)          # mkae the sobel image 3 channel
-    imageBGRA = cv2.merge((imageBGR, imageBGRA[:, :, 3]))       # set back the alpha channel of the image
+    imageBGRA = processor_utils.set_gray_output(sobel, imageBGRA)   # make it BGRA with the alpha channel of the image
     
     return imageBGRA
\ No newline at end of file
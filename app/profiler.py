@@ -0,0 +1,146 @@
+import os
+import json
+import time
+import threading
+import contextlib
+import tracemalloc
+from collections import deque
+
+import numpy as np
+
+import constants
+
+
+class Profiler():
+    """
+    A class recording the wall time and the CPU time of named spans of work, e.g. the steps of the pipeline and the display of the images.
+    The spans of a session can be saved as a Chrome trace, which can be opened in 'chrome://tracing' or 'ui.perfetto.dev'.
+    Spans can be recorded from several threads at once.
+
+    If 'track_memory' is set, the peak of the memory allocated during every span is measured with 'tracemalloc', which also
+    traces the buffers of numpy arrays, including the arrays created by OpenCV. Buffers OpenCV allocates and frees internally
+    are not traced. The measure is process-wide, spans running at the same time on other threads are counted as well.
+    Tracing slows down the allocations, so it is meant to be switched on only to investigate the memory of a pipeline.
+    Args:
+        max_events (int): The number of the most recent spans kept for the trace, 0 keeps none but the times are still measured.
+        track_memory (bool): Whether to measure the memory allocated during the spans.
+    """
+    def __init__(self, max_events=constants.PROFILER_MAX_EVENTS, track_memory=False):
+        self.events = deque(maxlen=max_events)      # the recorded spans as Chrome trace events
+        self.thread_names = {}                      # the names of the threads that recorded spans, by thread id
+        self.lock = threading.Lock()
+        self.origin = time.perf_counter()           # the time the timestamps of the trace are relative to
+        self.track_memory = track_memory
+
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+
+    def start(self):
+        """
+        Start measuring a span on the calling thread.
+        Returns:
+            tuple: The wall time, the CPU time of the thread and the traced memory at the start, to be given to 'stop'.
+        """
+        memory = None
+        if self.track_memory:
+            if hasattr(tracemalloc, "reset_peak"):      # Python 3.9+, older versions measure the peak since the start of the tracing
+                tracemalloc.reset_peak()
+            memory = tracemalloc.get_traced_memory()[0]
+
+        return time.perf_counter(), time.thread_time(), memory
+
+
+    def stop(self, started, name, category, **args):
+        """
+        Stop measuring a span and record it.
+        Args:
+            started (tuple): The value returned by 'start' on the same thread.
+            name (str): The name of the span, e.g. the name of the step.
+            category (str): The category of the span, e.g. 'step' or 'display'.
+            **args: Additional values shown with the span in the trace.
+        Returns:
+            tuple: The wall time and the CPU time of the span in milliseconds, and the peak number of bytes allocated
+                during the span on top of the memory allocated before it, None if the memory is not tracked.
+        """
+        wall = (time.perf_counter() - started[0]) * 1000
+        cpu = (time.thread_time() - started[1]) * 1000
+        peak = max(0, tracemalloc.get_traced_memory()[1] - started[2]) if self.track_memory else None
+
+        if self.events.maxlen != 0:
+            thread = threading.current_thread()
+            args["cpu_ms"] = round(cpu, 3)
+            if peak is not None:
+                args["peak_bytes"] = peak
+            with self.lock:
+                self.thread_names[thread.ident] = thread.name
+                self.events.append({"name": name, "cat": category, "ph": "X", "pid": os.getpid(), "tid": thread.ident,
+                                    "ts": (started[0] - self.origin) * 1e6, "dur": wall * 1000, "args": args})
+
+        return wall, cpu, peak
+
+
+    def count_buffers(self, min_bytes):
+        """
+        Count the numpy buffers alive at least as large as the given size, e.g. the full-resolution images held by a run and its cache.
+        It is only available if the memory is tracked.
+        Args:
+            min_bytes (int): The size of the smallest buffer counted.
+        Returns:
+            tuple: The number of the buffers and their total size in bytes.
+        """
+        snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.DomainFilter(True, np.lib.tracemalloc_domain)])
+        sizes = [trace.size for trace in snapshot.traces if trace.size >= min_bytes]
+
+        return len(sizes), sum(sizes)
+
+
+    def counter(self, name, **values):
+        """
+        Record the values of a counter, shown as a graph in the trace.
+        Args:
+            name (str): The name of the counter.
+            **values: The values of the counter at the current time.
+        """
+        if self.events.maxlen != 0:
+            with self.lock:
+                self.events.append({"name": name, "ph": "C", "pid": os.getpid(), "ts": (time.perf_counter() - self.origin) * 1e6, "args": values})
+
+
+    @contextlib.contextmanager
+    def span(self, name, category, **args):
+        """
+        Measure and record the code run inside a 'with' statement.
+        Args:
+            name (str): The name of the span.
+            category (str): The category of the span.
+            **args: Additional values shown with the span in the trace.
+        """
+        started = self.start()
+        try:
+            yield
+        finally:
+            self.stop(started, name, category, **args)
+
+
+    def save_trace(self, filePath):
+        """
+        Save the recorded spans to a file in the Chrome trace event format.
+        Args:
+            filePath (str): The path of the JSON file.
+        """
+        with self.lock:
+            events = list(self.events)
+            names = [{"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": name}}
+                     for tid, name in self.thread_names.items()]
+
+        with open(filePath, "w") as file:
+            json.dump({"traceEvents": names + events, "displayTimeUnit": "ms"}, file)
+
+
+    def clear(self):
+        """
+        Remove all the recorded spans.
+        """
+        with self.lock:
+            self.events.clear()
@@ -0,0 +1,148 @@
+from dataclasses import dataclass
+import numpy as np
+import cv2
+
+
+@dataclass(frozen=True)
+class StepSpec():
+    """
+    A base class for the parameters of a pipeline step.
+    A spec is an immutable snapshot of the parameters of a toolbox. It does not depend on any widget,
+    so it can be processed outside of the GUI thread and be used as a part of the cache fingerprint.
+
+    For the tiled execution, a spec declares its 'halo', the radius of the neighbourhood needed to compute one output pixel.
+    Point-wise steps keep the default 0, steps that change the geometry or need the whole image at once use None.
+    Steps that depend on statistics of the whole image set 'global_stats' and implement 'collect_stats' and 'with_stats'.
+
+    Steps are given a private copy of the image to write into, unless they set 'writes_input' to False and only read the image.
+
+    Steps that only process the V channel set 'v_channel' and accept the V channel as a single plane in place of the image,
+    so that the pipeline can run consecutive V channel steps on one plane, see 'Pipeline.run_v_steps'.
+    Steps that only change the pixels selected by their mask set 'masked_only', so that the pipeline can run them on the
+    bounding box of the mask extended by their halo, see 'Pipeline.run_in_roi'.
+    Point-wise steps mapping every value of a channel on its own set 'lut_channel', so that the pipeline can compose
+    consecutive steps into a single look-up table, see 'get_lut' and 'Pipeline.run_lut_steps'.
+    Steps that accept an opaque grayscale image as a single plane, and return a single plane in place of the image, set 'gray_plane',
+    so that the pipeline can carry such images as one channel instead of four. The other steps are given the image expanded to BGRA.
+
+    The fields compared by the dataclass are the saved parameters of the step, see 'app.pipeline_file'.
+    """
+    writes_input = True         # False if the step never writes into the image it is given, so it can be given a shared image
+    halo = 0                    # neighbourhood radius in pixels, None if the step can not be applied tile by tile
+    global_stats = False        # True if the step needs statistics of the whole image
+    v_channel = False           # True if the step only processes the V channel of the image
+    masked_only = False         # True if the step only changes the pixels selected by the mask it is given
+    lut_channel = None          # "BGR" or "V" if the step maps every value of these channels on its own, None otherwise
+    gray_output = False         # True if the output of the step is a grayscale image made from its V channel
+    gray_plane = False          # True if the step accepts an opaque grayscale image as a single plane and returns a single plane
+
+    def apply(self, imageBGRA, mask):
+        """
+        Apply the step to the given image.
+        Args:
+            imageBGRA (numpy.ndarray): The input image in the BGRA format.
+            mask (numpy.ndarray): The mask produced by the previous step, or None.
+        Returns:
+            imageBGRA (numpy.ndarray) or tuple: The processed image, or an (image, mask) tuple if the step produces a mask.
+        """
+        raise NotImplementedError
+
+
+    @classmethod
+    def from_params(cls, params):
+        """
+        Create a spec from the parameters read from a pipeline file.
+        Specs referring to external files, like a second image, must override this method to load them.
+        Args:
+            params (dict): The saved fields of the spec.
+        Returns:
+            StepSpec: The created spec.
+        """
+        return cls(**params)
+
+
+    def get_lut(self, histogram):
+        """
+        Get the look-up table of a point-wise step, mapping every value of its 'lut_channel' to the output value.
+        The table is made by applying the step to a grayscale image of all the 256 levels, which is converted to the HSV
+        color space and back without any loss, so the table gives the same values as the step itself.
+        Steps depending on the values of the whole image must override this method.
+        Args:
+            histogram (callable): A function returning the histogram of the channel the table is applied to.
+        Returns:
+            numpy.ndarray: The look-up table of 256 uint8 values.
+        """
+        levels = cv2.cvtColor(np.arange(256, dtype=np.uint8).reshape(1, 256), cv2.COLOR_GRAY2BGRA)
+
+        return np.ascontiguousarray(self.apply(levels, None)[0, :, 0])
+
+
+    def rescale(self, scale):
+        """
+        Get a copy of the spec for an image resized by the given factor, so that the result looks the same at the new size.
+        Specs whose parameters are given in pixels must override this method.
+        Args:
+            scale (float): The ratio of the new image size to the original image size.
+        Returns:
+            StepSpec: The rescaled spec.
+        """
+        return self
+
+
+    def collect_stats(self, imageBGRA, core):
+        """
+        Collect the statistics of a tile needed by the step. The statistics of all the tiles are combined by 'with_stats'.
+        Args:
+            imageBGRA (numpy.ndarray): The input tile of the step in the BGRA format, including its halo.
+            core (tuple): The slices selecting the part of the tile the statistics are collected from.
+        Returns:
+            object: The statistics of the tile.
+        """
+        raise NotImplementedError
+
+
+    def with_stats(self, stats):
+        """
+        Get a copy of the spec that uses the statistics of the whole image instead of the statistics of the image it is applied to.
+        Args:
+            stats (list): The statistics collected from every tile of the image by 'collect_stats'.
+        Returns:
+            StepSpec: The spec bound to the statistics of the whole image.
+        """
+        raise NotImplementedError
+
+
+def merge_ranges(ranges):
+    """
+    Combine the (min, max) ranges of several tiles into the range of the whole image.
+    Args:
+        ranges (list): The (min, max) ranges of the tiles.
+    Returns:
+        tuple: The (min, max) range of the whole image.
+    """
+    return (min(r[0] for r in ranges), max(r[1] for r in ranges))
+
+
+def scale_length(length, scale, minimum=0):
+    """
+    Rescale a length given in pixels.
+    Args:
+        length (int): The length to be rescaled.
+        scale (float): The ratio of the new image size to the original image size.
+        minimum (int): The smallest value the rescaled length may have.
+    Returns:
+        int: The rescaled length.
+    """
+    return max(minimum, int(round(length * scale)))
+
+
+def scale_kernel_size(kernel_size, scale):
+    """
+    Rescale the size of a filter kernel while keeping it odd.
+    Args:
+        kernel_size (int): The odd kernel size to be rescaled.
+        scale (float): The ratio of the new image size to the original image size.
+    Returns:
+        int: The rescaled odd kernel size.
+    """
+    return max(1, int(round((kernel_size - 1) / 2 * scale)) * 2 + 1)
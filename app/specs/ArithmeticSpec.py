@@ -0,0 +1,35 @@
+import cv2
+from dataclasses import dataclass, field
+from app.spec_bases import StepSpec
+from app import processors, processor_utils
+
+
+@dataclass(frozen=True)
+class ArithmeticSpec(StepSpec):
+    """
+    Parameters of the image arithmetic step.
+    The second image is compared by its key only, so the spec stays cheap to hash.
+    The path of the second image is saved with the spec, the image is read again when the spec is loaded.
+    """
+    operation: str = "Add"
+    alpha: float = 1.0
+    second_image_key: str = ""
+    second_image_path: str = ""
+    second_image: object = field(default=None, compare=False, repr=False)
+
+    writes_input = False
+    halo = None                 # the step resizes the second image to the whole image
+
+    @classmethod
+    def from_params(cls, params):
+        second_image = None
+        if params.get("second_image_path"):
+            second_image = cv2.cvtColor(processor_utils.read_image(params["second_image_path"]), cv2.COLOR_BGRA2BGR)
+
+        return cls(**params, second_image=second_image)
+
+    def apply(self, imageBGRA, mask):
+        if self.second_image is not None:
+            imageBGRA = processors.apply_image_arithmetic(imageBGRA, self.second_image, self.alpha, self.operation)
+
+        return imageBGRA
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from app.spec_bases import StepSpec
+from app import processors
+
+
+@dataclass(frozen=True)
+class BitSliceSpec(StepSpec):
+    """
+    Parameters of the bit plane slicing step.
+    """
+    bit_plane: int = 0
+
+    writes_input = False
+    lut_channel = "V"
+    gray_output = True
+    gray_plane = True
+
+    def apply(self, imageBGRA, mask):
+        return processors.extract_bit_planes(imageBGRA, self.bit_plane)
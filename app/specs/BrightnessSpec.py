@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from app.spec_bases import StepSpec
+from app import processors
+
+
+@dataclass(frozen=True)
+class BrightnessSpec(StepSpec):
+    """
+    Parameters of the brightness adjustment step.
+    """
+    value: int = 0
+    color_space: str = "HSV"
+
+    masked_only = True
+
+    @property
+    def v_channel(self):
+        return self.color_space == "HSV"
+
+    @property
+    def gray_plane(self):
+        return self.v_channel
+
+    @property
+    def lut_channel(self):
+        return "V" if self.color_space == "HSV" else "BGR"
+
+    def apply(self, imageBGRA, mask):
+        return processors.adjust_brightness(imageBGRA, self.value, self.color_space, mask)
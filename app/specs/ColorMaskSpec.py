@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from app.spec_bases import StepSpec
+from app import processors
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ColorMaskSpec(StepSpec):
+    """
+    Parameters of the color masking step.
+    The bounds are given in the HSV color space.
+    """
+    lower: tuple = (0, 0, 0)
+    upper: tuple = (0, 0, 0)
+    invert: bool = False
+
+    writes_input = False
+    gray_plane = True
+
+    def apply(self, imageBGRA, mask):
+        mask = processors.generate_color_mask(imageBGRA, np.asarray(self.lower), np.asarray(self.upper), self.invert, mask)
+
+        return imageBGRA, mask
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from app.spec_bases import StepSpec
+from app import processors
+
+
+@dataclass(frozen=True)
+class ComplementSpec(StepSpec):
+    """
+    Parameters of the complement step. The step has no parameters.
+    """
+    writes_input = False
+    lut_channel = "BGR"
+    gray_plane = True
+
+    def apply(self, imageBGRA, mask):
+        return processors.get_image_complement(imageBGRA)
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from app.spec_bases import StepSpec
+from app import processors
+
+
+@dataclass(frozen=True)
+class ContrastSpec(StepSpec):
+    """
+    Parameters of the contrast adjustment step.
+    Only the parameters of the selected method are used.
+    """
+    method: str = "by Input-Output Range"
+    in_range: tuple = (0, 255)
+    out_range: tuple = (0, 255)
+    alpha: float = 1.0
+    beta: int = 0
+
+    v_channel = True
+    lut_channel = "V"
+    gray_plane = True
+
+    @property
+    def masked_only(self):
+        return self.method == "by T(s)"     # the input-output range also clips the pixels outside the mask
+
+    def apply(self, imageBGRA, mask):
+        if self.method == "by Input-Output Range":
+            imageBGRA = processors.adjust_contrast_by_range(imageBGRA, list(self.in_range), list(self.out_range), mask)
+        elif self.method == "by T(s)":
+            imageBGRA = processors.adjust_contrast_by_T(imageBGRA, self.alpha, self.beta, mask)
+
+        return imageBGRA
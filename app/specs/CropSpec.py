@@ -0,0 +1,32 @@
+from dataclasses import dataclass, replace
+from app.spec_bases import StepSpec, scale_length
+from app import processors
+
+
+@dataclass(frozen=True)
+class CropSpec(StepSpec):
+    """
+    Parameters of the cropping step.
+    Cut values larger than the image are ignored when the step is applied.
+    """
+    left: int = 0
+    right: int = 0
+    top: int = 0
+    bottom: int = 0
+
+    writes_input = False
+    halo = None                 # the step changes the size of the image
+    gray_plane = True
+
+    def apply(self, imageBGRA, mask):
+        h, w = imageBGRA.shape[:2]       # get the height and width of the input image
+
+        # ignore the cut values that do not fit into the image
+        leftCut, rightCut = [cut if cut <= w else 0 for cut in (self.left, self.right)]
+        topCut, bottomCut = [cut if cut <= h else 0 for cut in (self.top, self.bottom)]
+
+        return processors.crop_image(imageBGRA, leftCut, rightCut, topCut, bottomCut)
+
+    def rescale(self, scale):
+        return replace(self, left=scale_length(self.left, scale), right=scale_length(self.right, scale),
+                       top=scale_length(self.top, scale), bottom=scale_length(self.bottom, scale))
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from app.spec_bases import StepSpec
+from app import processors
+
+
+@dataclass(frozen=True)
+class FlipSpec(StepSpec):
+    """
+    Parameters of the flipping step.
+    The flip code is 1 for horizontal, 0 for vertical and -1 for both.
+    """
+    flip_code: int = 1
+
+    writes_input = False
+    halo = None                 # the step moves pixels across the whole image
+    gray_plane = True
+
+    def apply(self, imageBGRA, mask):
+        return processors.flip_image(imageBGRA, self.flip_code)
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from app.spec_bases import StepSpec
+from app import processors
+
+
+@dataclass(frozen=True)
+class FrequencyFilterSpec(StepSpec):
+    """
+    Parameters of the frequency domain filtering step.
+    """
+    radius: int = 30
+    filter_type: str = "Low Pass"
+    luminance_only: bool = False
+
+    writes_input = False
+    halo = None                 # the step transforms the whole image at once
+    gray_plane = True
+
+    def apply(self, imageBGRA, mask):
+        return processors.apply_frequency_filter(imageBGRA, self.radius, self.filter_type, self.luminance_only)
+
+    def rescale(self, scale):
+        # the radius counts cycles per image, so the same frequencies are kept at any image size
+        return self
@@ -0,0 +1,31 @@
+from dataclasses import dataclass, replace
+from typing import Optional, Tuple
+from app.spec_bases import StepSpec, merge_ranges
+from app import processors, processor_utils
+import cv2
+
+
+@dataclass(frozen=True)
+class FullScaleContrastSpec(StepSpec):
+    """
+    Parameters of the full scale contrast step. The step has no parameters.
+    The V range is only set by the tiled execution to stretch every tile with the range of the whole image.
+    """
+    v_range: Optional[Tuple[int, int]] = None
+
+    global_stats = True
+    v_channel = True
+    masked_only = True
+    gray_plane = True
+
+    def apply(self, imageBGRA, mask):
+        return processors.apply_full_scale_contrast(imageBGRA, mask, self.v_range)
+
+    def collect_stats(self, imageBGRA, core):
+        vChannel = processor_utils.get_v_plane(imageBGRA)[core]
+        minVal, maxVal = cv2.minMaxLoc(vChannel)[:2]
+
+        return (int(minVal), int(maxVal))
+
+    def with_stats(self, stats):
+        return replace(self, v_range=merge_ranges(stats))
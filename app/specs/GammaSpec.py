@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from app.spec_bases import StepSpec
+from app import processors
+import numpy as np
+
+
+@dataclass(frozen=True)
+class GammaSpec(StepSpec):
+    """
+    Parameters of the gamma transformation step.
+    """
+    gamma: float = 1.0
+
+    v_channel = True
+    masked_only = True
+    lut_channel = "V"
+    gray_plane = True
+
+    def apply(self, imageBGRA, mask):
+        imageBGRA = processors.apply_gamma_transform(imageBGRA, self.gamma, mask)
+
+        return np.uint8(imageBGRA)
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from app.spec_bases import StepSpec
+from app import processors
+
+
+@dataclass(frozen=True)
+class HistCLAHESpec(StepSpec):
+    """
+    Parameters of the CLAHE (Contrast Limited Adaptive Histogram Equalization) step.
+    """
+    clip_limit: float = 0.2
+    tile_grid_size: int = 8
+
+    halo = None                 # the step splits the whole image into its own grid of tiles
+    v_channel = True
+    gray_plane = True
+
+    def apply(self, imageBGRA, mask):
+        return processors.apply_clahe(imageBGRA, self.clip_limit, self.tile_grid_size, mask)
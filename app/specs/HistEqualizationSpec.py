@@ -0,0 +1,30 @@
+from dataclasses import dataclass, replace
+from typing import Optional, Tuple
+from app.spec_bases import StepSpec
+from app import processors, processor_utils
+import numpy as np
+
+
+@dataclass(frozen=True)
+class HistEqualizationSpec(StepSpec):
+    """
+    Parameters of the histogram equalization step. The step has no parameters.
+    The histogram is only set by the tiled execution to equalize every tile with the histogram of the whole image.
+    """
+    histogram: Optional[Tuple[int, ...]] = None
+
+    global_stats = True
+    v_channel = True
+    masked_only = True
+    gray_plane = True
+
+    def apply(self, imageBGRA, mask):
+        return processors.apply_histogram_equalization(imageBGRA, mask, self.histogram)
+
+    def collect_stats(self, imageBGRA, core):
+        vChannel = processor_utils.get_v_plane(imageBGRA)[core]
+
+        return np.bincount(vChannel.ravel(), minlength=256)
+
+    def with_stats(self, stats):
+        return replace(self, histogram=tuple(int(count) for count in np.sum(stats, axis=0)))
@@ -0,0 +1,35 @@
+from dataclasses import dataclass, replace
+from typing import Optional, Tuple
+from app.spec_bases import StepSpec, merge_ranges
+from app import processors, processor_utils
+import cv2
+
+
+@dataclass(frozen=True)
+class LaplaceSpec(StepSpec):
+    """
+    Parameters of the laplacian filter step.
+    The response range is only set by the tiled execution to normalize every tile with the range of the whole image.
+    """
+    extended: bool = False
+    normalize: bool = False
+    response_range: Optional[Tuple[float, float]] = None
+
+    writes_input = False
+    halo = 1                    # the filter uses a 3x3 kernel
+    gray_plane = True
+
+    @property
+    def global_stats(self):
+        return self.normalize
+
+    def apply(self, imageBGRA, mask):
+        return processors.get_laplacian_filter(imageBGRA, self.extended, self.normalize, self.response_range)
+
+    def collect_stats(self, imageBGRA, core):
+        laplace = processor_utils.get_laplacian_response(imageBGRA, self.extended)
+
+        return cv2.minMaxLoc(laplace[core])[:2]
+
+    def with_stats(self, stats):
+        return replace(self, response_range=merge_ranges(stats))
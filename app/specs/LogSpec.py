@@ -0,0 +1,41 @@
+from dataclasses import dataclass, replace
+from typing import Optional, Tuple
+from app.spec_bases import StepSpec, merge_ranges
+from app import processors, processor_utils
+import numpy as np
+import cv2
+
+
+@dataclass(frozen=True)
+class LogSpec(StepSpec):
+    """
+    Parameters of the log transformation step. The step has no parameters.
+    The V range is only set by the tiled execution to normalize every tile with the range of the whole image.
+    """
+    v_range: Optional[Tuple[int, int]] = None
+
+    global_stats = True
+    v_channel = True
+    masked_only = True
+    lut_channel = "V"
+    gray_plane = True
+
+    def apply(self, imageBGRA, mask):
+        return processors.apply_log_transform(imageBGRA, mask, self.v_range)
+
+    def get_lut(self, histogram):
+        if self.v_range is None:
+            # the table of the whole image is the table of the range of its values
+            levels = np.flatnonzero(histogram())
+            return replace(self, v_range=(int(levels[0]), int(levels[-1]))).get_lut(histogram)
+
+        return super().get_lut(histogram)
+
+    def collect_stats(self, imageBGRA, core):
+        vChannel = processor_utils.get_v_plane(imageBGRA)[core]
+        minVal, maxVal = cv2.minMaxLoc(vChannel)[:2]
+
+        return (int(minVal), int(maxVal))
+
+    def with_stats(self, stats):
+        return replace(self, v_range=merge_ranges(stats))
@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from typing import Optional
+from app.spec_bases import StepSpec
+from app import processors
+
+
+@dataclass(frozen=True)
+class NoiseSpec(StepSpec):
+    """
+    Parameters of the noise step.
+    Only the parameters of the selected noise type are used.
+    The noise is drawn from streams seeded by 'seed', so the same parameters always give the same output and it can be cached.
+    The grayscale flag overrides the check of the image for grayscale, None checks the image.
+    """
+    noise_type: str = "Gaussian"
+    mean: int = 0
+    std: int = 25
+    salt_pep_prob: float = 0.02
+    grayscale: Optional[bool] = None
+    seed: int = 0
+
+    writes_input = False
+    halo = None                 # the noise of a pixel depends on its row in the whole image, so it is not drawn tile by tile
+
+    def apply(self, imageBGRA, mask):
+        if self.noise_type == "Gaussian":
+            imageBGRA = processors.add_gaussian_noise(imageBGRA, self.mean, self.std, mask, self.grayscale, self.seed)
+        elif self.noise_type == "Salt & Pepper":
+            imageBGRA = processors.add_salt_and_pepper(imageBGRA, self.salt_pep_prob, mask, self.seed)
+        elif self.noise_type == "Poisson":
+            imageBGRA = processors.add_poisson_noise(imageBGRA, mask, self.grayscale, self.seed)
+
+        return imageBGRA
@@ -0,0 +1,27 @@
+from dataclasses import dataclass, replace
+from app.spec_bases import StepSpec, scale_kernel_size
+from app import processors
+
+
+@dataclass(frozen=True)
+class OrderStatSpec(StepSpec):
+    """
+    Parameters of the order statistics filtering step.
+    The order is one of "median", "max" and "min".
+    """
+    order: str = "median"
+    kernel_size: int = 3
+
+    v_channel = True
+    masked_only = True
+    gray_plane = True
+
+    @property
+    def halo(self):
+        return self.kernel_size // 2
+
+    def apply(self, imageBGRA, mask):
+        return processors.apply_order_stat_filter(imageBGRA, self.kernel_size, self.order, mask)
+
+    def rescale(self, scale):
+        return replace(self, kernel_size=scale_kernel_size(self.kernel_size, scale))
@@ -0,0 +1,28 @@
+from dataclasses import dataclass, replace
+from app.spec_bases import StepSpec, scale_length
+from app import processors
+import cv2
+
+
+@dataclass(frozen=True)
+class PaddingSpec(StepSpec):
+    """
+    Parameters of the padding step.
+    The padding type is a cv2 border type like cv2.BORDER_CONSTANT.
+    """
+    padding_type: int = cv2.BORDER_CONSTANT
+    left: int = 0
+    right: int = 0
+    top: int = 0
+    bottom: int = 0
+    constant: int = 0
+
+    writes_input = False
+    halo = None                 # the step changes the size of the image
+
+    def apply(self, imageBGRA, mask):
+        return processors.apply_padding(imageBGRA, self.padding_type, self.left, self.right, self.top, self.bottom, self.constant)
+
+    def rescale(self, scale):
+        return replace(self, left=scale_length(self.left, scale), right=scale_length(self.right, scale),
+                       top=scale_length(self.top, scale), bottom=scale_length(self.bottom, scale))
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from app.spec_bases import StepSpec
+from app import processors
+
+
+@dataclass(frozen=True)
+class RGB2GraySpec(StepSpec):
+    """
+    Parameters of the RGB to grayscale conversion step. The step has no parameters.
+    """
+    writes_input = False
+    gray_output = True
+    gray_plane = True
+
+    def apply(self, imageBGRA, mask):
+        return processors.apply_rgb2gray_transform(imageBGRA)
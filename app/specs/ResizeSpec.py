@@ -0,0 +1,25 @@
+from dataclasses import dataclass, replace
+from typing import Optional
+from app.spec_bases import StepSpec, scale_length
+from app import processors
+
+
+@dataclass(frozen=True)
+class ResizeSpec(StepSpec):
+    """
+    Parameters of the resizing step.
+    The interpolation is a cv2 interpolation flag, or None to use the default one.
+    """
+    width: int = 128
+    height: int = 128
+    interpolation: Optional[int] = None
+
+    writes_input = False
+    halo = None                 # the step changes the size of the image
+    gray_plane = True
+
+    def apply(self, imageBGRA, mask):
+        return processors.resize_image(imageBGRA, self.width, self.height, self.interpolation)
+
+    def rescale(self, scale):
+        return replace(self, width=scale_length(self.width, scale, 1), height=scale_length(self.height, scale, 1))
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from app.spec_bases import StepSpec
+from app import processors
+
+
+@dataclass(frozen=True)
+class RotateSpec(StepSpec):
+    """
+    Parameters of the rotation step.
+    """
+    angle: int = 0
+
+    writes_input = False
+    halo = None                 # the step changes the geometry of the image
+
+    def apply(self, imageBGRA, mask):
+        return processors.rotate_image(imageBGRA, self.angle)
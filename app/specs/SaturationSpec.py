@@ -0,0 +1,27 @@
+from dataclasses import dataclass, replace
+from typing import Optional
+from app.spec_bases import StepSpec
+from app import processors, processor_utils
+
+
+@dataclass(frozen=True)
+class SaturationSpec(StepSpec):
+    """
+    Parameters of the saturation adjustment step.
+    The grayscale flag is only set by the tiled execution, so that a gray tile of a colored image is not skipped.
+    """
+    value: int = 0
+    grayscale: Optional[bool] = None
+
+    global_stats = True
+    masked_only = True
+    gray_plane = True
+
+    def apply(self, imageBGRA, mask):
+        return processors.adjust_saturation(imageBGRA, self.value, mask, self.grayscale)
+
+    def collect_stats(self, imageBGRA, core):
+        return processor_utils.is_image_grayscale(imageBGRA[core])
+
+    def with_stats(self, stats):
+        return replace(self, grayscale=all(stats))
@@ -0,0 +1,45 @@
+from dataclasses import dataclass, replace
+from app.spec_bases import StepSpec, scale_kernel_size
+from app import processors
+
+
+@dataclass(frozen=True)
+class SharpeningSpec(StepSpec):
+    """
+    Parameters of the sharpening step.
+    Only the parameters of the selected method are used.
+    """
+    method: str = "Laplace Sharpening"
+    kernel_size: int = 3
+    sigma: float = 1.0
+    alpha: float = 1.0
+    extended: bool = False
+
+    masked_only = True
+
+    @property
+    def halo(self):
+        if self.method == "Unsharp Masking":
+            return self.kernel_size // 2
+        return 2 if self.method == "Sobel Sharpening" else 1       # the sobel sharpening applies two 3x3 kernels one after another
+
+    @property
+    def v_channel(self):
+        return self.method != "Sobel Sharpening"        # the sobel sharpening returns the whole image
+
+    @property
+    def gray_plane(self):
+        return self.v_channel
+
+    def apply(self, imageBGRA, mask):
+        if self.method == "Laplace Sharpening":
+            imageBGRA = processors.apply_laplacian_sharpening(imageBGRA, self.alpha, self.extended, mask)
+        elif self.method == "Sobel Sharpening":
+            imageBGRA = processors.apply_sobel_sharpening(imageBGRA, self.alpha, mask)
+        elif self.method == "Unsharp Masking":
+            imageBGRA = processors.apply_unsharp_mask(imageBGRA, self.kernel_size, self.sigma, self.alpha, mask)
+
+        return imageBGRA
+
+    def rescale(self, scale):
+        return replace(self, kernel_size=scale_kernel_size(self.kernel_size, scale), sigma=self.sigma * scale)
@@ -0,0 +1,33 @@
+from dataclasses import dataclass, replace
+from app.spec_bases import StepSpec, scale_kernel_size
+from app import processors
+
+
+@dataclass(frozen=True)
+class SmoothingSpec(StepSpec):
+    """
+    Parameters of the smoothing step.
+    Only the parameters of the selected method are used.
+    """
+    method: str = "Mean"
+    kernel_size: int = 3
+    sigma: float = 1.0
+
+    v_channel = True
+    masked_only = True
+    gray_plane = True
+
+    @property
+    def halo(self):
+        return self.kernel_size // 2
+
+    def apply(self, imageBGRA, mask):
+        if self.method == "Mean":
+            imageBGRA = processors.apply_box_filter(imageBGRA, self.kernel_size, mask)
+        elif self.method == "Gaussian":
+            imageBGRA = processors.apply_gaussian_blur(imageBGRA, self.kernel_size, self.sigma, mask)
+
+        return imageBGRA
+
+    def rescale(self, scale):
+        return replace(self, kernel_size=scale_kernel_size(self.kernel_size, scale), sigma=self.sigma * scale)
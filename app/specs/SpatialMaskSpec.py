@@ -0,0 +1,32 @@
+from dataclasses import dataclass, replace
+from app.spec_bases import StepSpec, scale_length
+from app import processors
+
+
+@dataclass(frozen=True)
+class SpatialMaskSpec(StepSpec):
+    """
+    Parameters of the spatial masking step.
+    The geometry of the mask is given in pixels of the input image.
+    """
+    width: int = 1
+    height: int = 1
+    left: int = 0
+    top: int = 0
+    border_radius: int = 0
+    invert: bool = False
+
+    writes_input = False
+    halo = None                 # the step places the mask relative to the whole image
+    gray_plane = True
+
+    def apply(self, imageBGRA, mask):
+        mask = processors.generate_spatial_mask(imageBGRA, self.width, self.height, self.left, self.top,
+                                                self.border_radius, self.invert)
+
+        return imageBGRA, mask
+
+    def rescale(self, scale):
+        return replace(self, width=scale_length(self.width, scale, 1), height=scale_length(self.height, scale, 1),
+                       left=scale_length(self.left, scale), top=scale_length(self.top, scale),
+                       border_radius=scale_length(self.border_radius, scale))
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from app.spec_bases import StepSpec
+from app import processors
+
+
+@dataclass(frozen=True)
+class ThresholdingSpec(StepSpec):
+    """
+    Parameters of the thresholding step.
+    """
+    threshold: int = 128
+
+    writes_input = False
+    lut_channel = "V"
+    gray_output = True
+    gray_plane = True
+
+    def apply(self, imageBGRA, mask):
+        return processors.apply_threshold_filter(imageBGRA, self.threshold)
@@ -0,0 +1,28 @@
+from .ArithmeticSpec import ArithmeticSpec
+from .BitSliceSpec import BitSliceSpec
+from .BrightnessSpec import BrightnessSpec
+from .ColorMaskSpec import ColorMaskSpec
+from .ComplementSpec import ComplementSpec
+from .ContrastSpec import ContrastSpec
+from .CropSpec import CropSpec
+from .FlipSpec import FlipSpec
+from .FrequencyFilterSpec import FrequencyFilterSpec
+from .FullScaleContrastSpec import FullScaleContrastSpec
+from .GammaSpec import GammaSpec
+from .HistCLAHESpec import HistCLAHESpec
+from .HistEqualizationSpec import HistEqualizationSpec
+from .LaplaceSpec import LaplaceSpec
+from .LogSpec import LogSpec
+from .LogicSpec import LogicSpec
+from .NoiseSpec import NoiseSpec
+from .OrderStatSpec import OrderStatSpec
+from .PaddingSpec import PaddingSpec
+from .RGB2GraySpec import RGB2GraySpec
+from .ResizeSpec import ResizeSpec
+from .RotateSpec import RotateSpec
+from .SaturationSpec import SaturationSpec
+from .SharpeningSpec import SharpeningSpec
+from .SmoothingSpec import SmoothingSpec
+from .SobelSpec import SobelSpec
+from .SpatialMaskSpec import SpatialMaskSpec
+from .ThresholdingSpec import ThresholdingSpec
@@ -0,0 +1,66 @@
+from collections import OrderedDict
+
+
+class StepCache():
+    """
+    A byte-bounded LRU cache for the outputs of pipeline steps.
+    Each entry is an (image, mask) pair stored under the fingerprint of the step that produced it.
+    The stored arrays are made read-only, as they are shared by the following runs.
+    Args:
+        max_bytes (int): The maximum number of bytes the cached images and masks may occupy.
+    """
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()        # fingerprint -> (image, mask, size), ordered from least to most recently used
+        self.total_bytes = 0
+
+
+    def get(self, key):
+        """
+        Get the cached output of a step and mark it as the most recently used entry.
+        Args:
+            key (int): The fingerprint of the step.
+        Returns:
+            tuple: The cached (image, mask) pair or None if the key is not cached.
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        self.entries.move_to_end(key)
+        return entry[0], entry[1]
+
+
+    def put(self, key, image, mask):
+        """
+        Store the output of a step and evict the least recently used entries until the cache fits into its budget.
+        Args:
+            key (int): The fingerprint of the step.
+            image (numpy.ndarray): The image produced by the step.
+            mask (numpy.ndarray): The mask produced by the step, or None.
+        """
+        size = image.nbytes + (0 if mask is None else mask.nbytes)
+        if size > self.max_bytes:                   # an entry larger than the whole budget would evict everything else
+            return
+
+        if key in self.entries:
+            self.total_bytes -= self.entries.pop(key)[2]
+
+        image.flags.writeable = False
+        if mask is not None:
+            mask.flags.writeable = False
+
+        self.entries[key] = (image, mask, size)
+        self.total_bytes += size
+
+        while self.total_bytes > self.max_bytes:
+            _, (_, _, evicted_size) = self.entries.popitem(last=False)
+            self.total_bytes -= evicted_size
+
+
+    def clear(self):
+        """
+        Remove all entries from the cache.
+        """
+        self.entries.clear()
+        self.total_bytes = 0
@@ -0,0 +1,224 @@
+import os
+import tempfile
+import threading
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+import constants
+from app import processor_utils
+
+
+class TiledExecutor():
+    """
+    A class that runs the pipeline tile by tile, so that images much larger than the memory can be processed.
+    Consecutive steps with a known halo are applied to overlapping tiles on a thread pool. Every tile is read with
+    the sum of the halos of the steps around it, so its core is computed exactly as it would be on the whole image.
+    Steps that need statistics of the whole image get an extra pass collecting the statistics tile by tile before the tiles are processed.
+    Steps without a halo are applied to the whole image: cropping, padding, resizing, rotating, flipping, frequency filtering,
+    CLAHE, noise, the spatial mask and the arithmetic and logic operations. Their input and output are whole images in the memory,
+    a memory-mapped image is loaded into the memory for a step writing into its input, so they bound the size of the images
+    a pipeline can process tile by tile.
+    An opaque grayscale image given as a single plane is processed as a single plane, a tile is only expanded to BGRA for a step
+    without a single plane path, see 'StepSpec.gray_plane', and the output of its sequence of tiled steps is then a BGRA image.
+    Args:
+        tile_size (int): The size of the square tiles in pixels.
+        workers (int): The number of threads processing the tiles. Defaults to the number of CPUs.
+        temp_dir (str): If given, the intermediate images are stored in memory-mapped files in this directory instead of the memory.
+    """
+    def __init__(self, tile_size=constants.TILE_SIZE, workers=None, temp_dir=None):
+        self.tile_size = tile_size
+        self.workers = workers or os.cpu_count() or 1
+        self.temp_dir = temp_dir
+
+
+    def run(self, input_image, specs):
+        """
+        Run the steps on the input image.
+        Args:
+            input_image (numpy.ndarray): The input image in the BGRA format, or an opaque grayscale single plane.
+                It can be a memory-mapped array.
+            specs (list): A snapshot of the steps taken by 'Pipeline.snapshot', None for the disabled steps.
+        Returns:
+            image (numpy.ndarray): The processed image in the BGRA format or a single plane, a memory-mapped array if 'temp_dir' is given.
+        """
+        image, mask = input_image, None
+
+        i = 0
+        while i < len(specs):
+            spec = specs[i]
+            if spec is not None and spec.halo is None:
+                # the step needs the whole image, a step writing into its input is given a copy of the image
+                expanded = image.ndim == 2 and not spec.gray_plane
+                if expanded:
+                    step_image = processor_utils.to_bgra(image)         # the step has no single plane path
+                else:
+                    step_image = np.array(image) if spec.writes_input else image
+                result = spec.apply(step_image, None if mask is None else np.array(mask))
+                image, mask = result if isinstance(result, tuple) else (result, None)
+                if expanded:
+                    image = processor_utils.get_gray_plane(image)      # taken back to a single plane if it is still opaque and grayscale
+                i += 1
+            else:
+                # collect the following steps that can be applied tile by tile
+                j = i
+                while j < len(specs) and (specs[j] is None or specs[j].halo is not None):
+                    j += 1
+                image, mask = self.run_segment(image, mask, specs[i:j], has_next=j < len(specs))
+                i = j
+
+        return image
+
+
+    def run_segment(self, image, mask, specs, has_next):
+        """
+        Apply a sequence of tileable steps to the image tile by tile.
+        Args:
+            image (numpy.ndarray): The input image of the sequence in the BGRA format, or a single plane.
+            mask (numpy.ndarray): The mask produced by the step before the sequence, or None.
+            specs (list): The specs of the steps with a halo, None for the disabled steps.
+            has_next (bool): Whether another step follows the sequence, which may use the mask produced by the last step.
+        Returns:
+            tuple: The output image and the mask produced by the last step of the sequence.
+        """
+        if all(spec is None for spec in specs):     # disabled steps only reset the mask
+            return image, None
+
+        specs = list(specs)
+        tiles = self.get_tiles(image.shape[:2])
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            # first pass, bind the steps depending on the whole image to the statistics collected from every tile
+            for k, spec in enumerate(specs):
+                if spec is not None and spec.global_stats:
+                    halo = self.get_halo(specs[:k + 1])
+                    stats = pool.map(lambda tile: self.collect_tile_stats(image, mask, specs[:k], spec, tile, halo), tiles)
+                    specs[k] = spec.with_stats(list(stats))
+
+            # second pass, process the tiles and write their cores into the output
+            planar = image.ndim == 2 and all(spec is None or spec.gray_plane for spec in specs)
+            output = self.allocate(image.shape if image.ndim == 3 or planar else image.shape + (4,), image.dtype)
+            outputs = {"image": output, "mask": None, "lock": threading.Lock()}
+            halo = self.get_halo(specs)
+            list(pool.map(lambda tile: self.process_tile(image, mask, specs, tile, halo, outputs, has_next), tiles))
+
+        return output, outputs["mask"]
+
+
+    def process_tile(self, image, mask, specs, tile, halo, outputs, has_next):
+        """
+        Apply the steps to a single tile and write its core into the output.
+        Args:
+            image (numpy.ndarray): The input image of the steps.
+            mask (numpy.ndarray): The input mask of the first step, or None.
+            specs (list): The specs of the steps, None for the disabled steps.
+            tile (tuple): The (top, bottom, left, right) borders of the core of the tile.
+            halo (int): The number of pixels read around the core of the tile.
+            outputs (dict): The output image, the output mask and a lock, the mask is allocated by the first tile producing one.
+            has_next (bool): Whether the mask of the last step needs to be kept.
+        """
+        tile_image, tile_mask, core = self.apply_to_tile(image, mask, specs, tile, halo)
+        top, bottom, left, right = tile
+
+        outputs["image"][top:bottom, left:right] = tile_image[core]
+
+        if tile_mask is not None and has_next:
+            with outputs["lock"]:
+                if outputs["mask"] is None:
+                    outputs["mask"] = self.allocate(image.shape[:2], np.uint8)
+            outputs["mask"][top:bottom, left:right] = tile_mask[core]
+
+
+    def collect_tile_stats(self, image, mask, specs, stats_spec, tile, halo):
+        """
+        Apply the steps before a step depending on the whole image to a tile and collect the statistics of the tile for that step.
+        Args:
+            image (numpy.ndarray): The input image of the steps.
+            mask (numpy.ndarray): The input mask of the first step, or None.
+            specs (list): The specs of the steps before the step collecting the statistics.
+            stats_spec (StepSpec): The spec of the step collecting the statistics.
+            tile (tuple): The (top, bottom, left, right) borders of the core of the tile.
+            halo (int): The number of pixels read around the core of the tile.
+        Returns:
+            object: The statistics of the tile.
+        """
+        tile_image, _, core = self.apply_to_tile(image, mask, specs, tile, halo)
+        if tile_image.ndim == 2 and not stats_spec.gray_plane:
+            tile_image = processor_utils.to_bgra(tile_image)
+
+        return stats_spec.collect_stats(tile_image, core)
+
+
+    def apply_to_tile(self, image, mask, specs, tile, halo):
+        """
+        Read a tile with its halo and apply the steps to it.
+        A single plane tile is expanded to BGRA for the first step without a single plane path, and stays BGRA afterwards.
+        Args:
+            image (numpy.ndarray): The input image of the steps.
+            mask (numpy.ndarray): The input mask of the first step, or None.
+            specs (list): The specs of the steps, None for the disabled steps.
+            tile (tuple): The (top, bottom, left, right) borders of the core of the tile.
+            halo (int): The number of pixels read around the core of the tile.
+        Returns:
+            tuple: The processed tile, its mask and the slices selecting the core of the tile.
+        """
+        top, bottom, left, right = tile
+        height, width = image.shape[:2]
+
+        # extend the tile by the halo without going out of the image, the steps handle the image borders themselves
+        region_top, region_bottom = max(0, top - halo), min(height, bottom + halo)
+        region_left, region_right = max(0, left - halo), min(width, right + halo)
+        core = (slice(top - region_top, bottom - region_top), slice(left - region_left, right - region_left))
+
+        tile_image = np.array(image[region_top:region_bottom, region_left:region_right])
+        tile_mask = None if mask is None else np.array(mask[region_top:region_bottom, region_left:region_right])
+
+        for spec in specs:
+            if spec is not None:
+                if tile_image.ndim == 2 and not spec.gray_plane:
+                    tile_image = processor_utils.to_bgra(tile_image)
+                result = spec.apply(tile_image, tile_mask)
+                tile_image, tile_mask = result if isinstance(result, tuple) else (result, None)
+            else:
+                tile_mask = None            # a disabled step resets the mask
+
+        return tile_image, tile_mask, core
+
+
+    def get_tiles(self, shape):
+        """
+        Split an image into square tiles.
+        Args:
+            shape (tuple): The (height, width) of the image.
+        Returns:
+            list: The (top, bottom, left, right) borders of the tiles.
+        """
+        height, width = shape
+        return [(top, min(top + self.tile_size, height), left, min(left + self.tile_size, width))
+                for top in range(0, height, self.tile_size) for left in range(0, width, self.tile_size)]
+
+
+    def get_halo(self, specs):
+        """
+        Calculate the halo needed by a sequence of steps, the neighbourhoods of the steps add up.
+        Args:
+            specs (list): The specs of the steps, None for the disabled steps.
+        Returns:
+            int: The number of pixels to be read around a tile.
+        """
+        return sum(spec.halo for spec in specs if spec is not None)
+
+
+    def allocate(self, shape, dtype):
+        """
+        Allocate an intermediate image, in a temporary memory-mapped file if 'temp_dir' is given.
+        Args:
+            shape (tuple): The shape of the image.
+            dtype (numpy.dtype): The data type of the image.
+        Returns:
+            numpy.ndarray: The allocated image.
+        """
+        if self.temp_dir is None:
+            return np.empty(shape, dtype)
+
+        # the temporary file is deleted as soon as the array is released
+        return np.memmap(tempfile.TemporaryFile(dir=self.temp_dir), dtype=dtype, mode="w+", shape=shape)
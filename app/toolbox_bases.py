@@ -1,5 +1,4 @@
 import uuid
-import cv2
 
 from PySide6.QtCore import Qt, Signal, QMimeData
 from PySide6.QtGui import QFont, QDrag
@@ -7,37 +6,33 @@ from PySide6.QtWidgets import (QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxL
                                QSizePolicy, QFrame, QCheckBox, QFileDialog)
 
 import constants
+from app import processor_utils
 from gui.gui_components import GUiComponents 
 from gui.gui_components import ArrowComboBox
 
 
+def select_image_file():
+    """
+    Open a file dialog to select an image file.
+    Returns:
+        filePath (str): The path of the selected file, or an empty string if no file was selected.
+    """
+    filePath, _ = QFileDialog.getOpenFileName(None, "Select an image file", "", "Image Files (*.png *.jpg *.jpeg *.bmp *.gif *.tif *.tiff *.webp)")
+    return filePath
+
+
 def select_image():
     """
     Open a file dialog to select an image file and read it using OpenCV.
     Returns:
-        image (np.ndarray): The selected image as a NumPy array.
+        image (np.ndarray): The selected image as a NumPy array, a single plane for a grayscale file.
     """
     # Open file dialog to select an image file
-    filePath, _ = QFileDialog.getOpenFileName(None, "Select an image file", "", "Image Files (*.png *.jpg *.jpeg *.bmp *.gif *.tif *.tiff *.webp)")
+    filePath = select_image_file()
 
     # Check if a file was selected
     if filePath:
-        image = cv2.imread(filePath, cv2.IMREAD_UNCHANGED)      # read the image
-        
-        if image is None:
-            raise ValueError("No input image provided")
-        elif len(image.shape) == 2:                             # if image is (h,w)
-            image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGRA)
-        elif len(image.shape) == 3 and image.shape[2] == 1:     # if image is (h,w,1)
-            image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGRA)
-        elif len(image.shape) == 3 and image.shape[2] == 3:     # if image is (BGR) (h,w,3)
-            image = cv2.cvtColor(image, cv2.COLOR_BGR2BGRA)
-        elif len(image.shape) == 3 and image.shape[2] == 4:     # if image is (BGRA) (h,w,4)
-            pass
-        else:
-            raise ValueError("Unsupported image format")
-        
-        return image
+        return processor_utils.read_image(filePath, keep_gray=True)
     
     
 
@@ -179,6 +174,12 @@ class Toolbox(QWidget, GUiComponents):
         self.switch.setFixedHeight(30)
         switchLayout.addWidget(self.switch, alignment=Qt.AlignTop)
 
+        # create a label showing the time the step took in the last run
+        self.time_label = QLabel("")
+        self.time_label.setFont(self.font)
+        self.time_label.setFixedHeight(30)
+        switchLayout.addWidget(self.time_label, alignment=Qt.AlignTop | Qt.AlignRight)
+
         # add the content layout to the frame layout
         frameLayout.addLayout(self.contentLayout, 4)
 
@@ -188,6 +189,28 @@ class Toolbox(QWidget, GUiComponents):
         self.contentLayout.addWidget(dummy)
     
 
+    def show_time(self, step_time):
+        """
+        Show the time the step took in the last run of the pipeline.
+        Args:
+            step_time (tuple): The (wall ms, CPU ms, peak bytes, note) of the step, None if the step did not run.
+                The peak bytes are the memory allocated by the step, None if the memory is not tracked.
+                The note is 'cached' if the output of the step was taken from the cache, 'fused' if the step was run together with
+                its neighbours and the time is the time of the whole group, 'ROI' if it was run on the bounding box of the mask.
+        """
+        if step_time is None:
+            self.time_label.setText("")
+            self.time_label.setToolTip("")
+            return
+
+        wall, cpu, peak, note = step_time
+        tooltip = f"Wall time: {wall:.2f} ms\nCPU time: {cpu:.2f} ms"
+        if peak is not None:
+            tooltip += f"\nPeak memory: {peak / 2**20:.1f} MB"
+        self.time_label.setText(note if note == "cached" else f"{wall:.1f} ms {note}".strip())
+        self.time_label.setToolTip(tooltip + (f"\n{note}" if note else ""))
+
+
     def update_toolbox(self, imageBGRA):
         """
         Runs only when the toolbox is created for the first time and everytime the input image is changed. 
@@ -195,6 +218,38 @@ class Toolbox(QWidget, GUiComponents):
         self.imageBGRA = imageBGRA
 
 
+    def get_spec(self):
+        """
+        Returns the current parameters of the toolbox as an immutable spec.
+        The spec is independent of the widgets, so it can be processed outside of the GUI thread.
+        Returns:
+            StepSpec: The parameters of the toolbox.
+        """
+        raise NotImplementedError
+
+
+    def set_spec(self, spec):
+        """
+        Set the widgets of the toolbox to the parameters of a spec, the inverse of 'get_spec'.
+        It is used to restore the toolbox from a saved pipeline.
+        Args:
+            spec (StepSpec): The parameters of the toolbox.
+        """
+        raise NotImplementedError
+
+
+    def execute(self, imageBGRA, mask):
+        """
+        Apply the toolbox to the given image with its current parameters.
+        Args:
+            imageBGRA (numpy.ndarray): The input image in the BGRA format.
+            mask (numpy.ndarray): The mask produced by the previous step, or None.
+        Returns:
+            imageBGRA (numpy.ndarray) or tuple: The processed image, or an (image, mask) tuple if the toolbox produces a mask.
+        """
+        return self.get_spec().apply(imageBGRA, mask)
+
+
 
 class DraggableToolbox(Toolbox):
     """
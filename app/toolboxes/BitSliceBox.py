@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 
 
 class BitSliceBox(DraggableToolbox):
@@ -14,9 +14,9 @@ class BitSliceBox(DraggableToolbox):
         # Insert a combo list to select a bit plane
         self.combo = self.insert_combo_list(["0", "1", "2", "3", "4", "5", "6", "7"])
 
-    def execute(self, imageBGRA, mask):
-        # apply bit plane slicing
-        imageBGRA = processors.extract_bit_planes(imageBGRA, int(self.combo.currentText()))
-
-        return imageBGRA
+    def get_spec(self):
+        # get the selected bit plane
+        return specs.BitSliceSpec(int(self.combo.currentText()))
 
+    def set_spec(self, spec):
+        self.combo.setCurrentText(str(spec.bit_plane))
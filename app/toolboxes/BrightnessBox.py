@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 
 class BrightnessBox(DraggableToolbox):
     """
@@ -16,8 +16,10 @@ class BrightnessBox(DraggableToolbox):
         # Create a slider to adjust brightness
         self.brightness = self.insert_slider(heading="Brightness", minValue=-255, maxValue=255)  
 
-    def execute(self, imageBGRA, mask):
-        # apply brightness adjustment
-        imageBGRA = processors.adjust_brightness(imageBGRA, self.brightness[0].value(), self.color_channel.currentText(), mask)  
+    def get_spec(self):
+        # get the brightness value and the selected color space
+        return specs.BrightnessSpec(self.brightness[0].value(), self.color_channel.currentText())
 
-        return imageBGRA
\ No newline at end of file
+    def set_spec(self, spec):
+        self.color_channel.setCurrentText(spec.color_space)
+        self.brightness[0].setValue(spec.value)
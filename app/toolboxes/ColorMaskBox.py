@@ -1,7 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
-import numpy as np
+from app import specs
 
 
 class ColorMaskBox(DraggableToolbox):
@@ -19,13 +18,14 @@ class ColorMaskBox(DraggableToolbox):
         self.intensityMin = self.insert_triple_input("min HSV:", 0, 0, 0)
         self.intensityMax = self.insert_triple_input("max HSV:", 0, 0, 0)
 
-    def execute(self, imageBGRA, mask):
+    def get_spec(self):
         # get the min-max HSV values from the input boxes
         rMin, gMin, bMin = self.get_component_value(self.intensityMin[:3], mins=[0, 0, 0], maxs=[255,255, 255], defaults=[0, 0, 0])
         rMax, gMax, bMax = self.get_component_value(self.intensityMax[:3], mins=[0, 0, 0], maxs=[255,255, 255], defaults=[0, 0, 0])
 
-        # apply masking
-        mask = processors.generate_color_mask(imageBGRA, np.asarray([rMin, gMin, bMin]), np.asarray([rMax, gMax, bMax]), self.invert[0].isChecked(), mask)
+        return specs.ColorMaskSpec((rMin, gMin, bMin), (rMax, gMax, bMax), self.invert[0].isChecked())
 
-        return imageBGRA, mask
-  
\ No newline at end of file
+    def set_spec(self, spec):
+        self.invert[0].setChecked(spec.invert)
+        for widget, value in zip(self.intensityMin[:3] + self.intensityMax[:3], spec.lower + spec.upper):
+            widget.setText(str(value))
@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 
 
 class ComplementBox(DraggableToolbox):
@@ -11,7 +11,8 @@ class ComplementBox(DraggableToolbox):
     def __init__(self):
         super().__init__(constants.TOOLBOXES['COMPLEMENT']['NAME'])
   
-    def execute(self, imageBGRA, mask):
-        imageBGRA = processors.get_image_complement(imageBGRA)    # apply complement operation
+    def get_spec(self):
+        return specs.ComplementSpec()
 
-        return imageBGRA
+    def set_spec(self, spec):
+        pass                    # the toolbox has no parameters
@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 
 class ContrastBox(DraggableToolbox):
     """
@@ -26,25 +26,22 @@ class ContrastBox(DraggableToolbox):
         # connect widgets to the appropriate combo lists  
         self.set_combo_adapt_widgets(self.combo, [[self.inMinMax, self.outMinMax], [self.alpha, self.beta]])
 
-    def execute(self, imageBGRA, mask):
-
-        if self.combo.currentText() == "by Input-Output Range":
-            # get input and output range values from the text boxes
-            in_min, in_max = self.get_component_value(self.inMinMax[:2], maxs=[255,255], defaults=[0, 255])
-            out_min, out_max = self.get_component_value(self.outMinMax[:2], maxs=[255,255], defaults=[0, 255])
-
-            # apply contrast stretching using input-output range method
-            imageBGRA = processors.adjust_contrast_by_range(imageBGRA, [in_min, in_max], [out_min, out_max], mask)  
-
-            return imageBGRA  
-
-        elif self.combo.currentText() == "by T(s)":
-            # get the alpha and beta values from sliders
-            alpha = self.alpha[0].value() / self.slider_rescale
-            beta = self.beta[0].value()
-
-            # apply contrast stretching using T(s) method
-            imageBGRA = processors.adjust_contrast_by_T(imageBGRA, alpha, beta, mask)  
-            
-            return imageBGRA
-              
\ No newline at end of file
+    def get_spec(self):
+        # get input and output range values from the text boxes
+        in_min, in_max = self.get_component_value(self.inMinMax[:2], maxs=[255,255], defaults=[0, 255])
+        out_min, out_max = self.get_component_value(self.outMinMax[:2], maxs=[255,255], defaults=[0, 255])
+
+        # get the alpha and beta values from sliders
+        alpha = self.alpha[0].value() / self.slider_rescale
+        beta = self.beta[0].value()
+
+        return specs.ContrastSpec(self.combo.currentText(), (in_min, in_max), (out_min, out_max), alpha, beta)
+
+    def set_spec(self, spec):
+        self.combo.setCurrentText(spec.method)
+        self.inMinMax[0].setText(str(spec.in_range[0]))
+        self.inMinMax[1].setText(str(spec.in_range[1]))
+        self.outMinMax[0].setText(str(spec.out_range[0]))
+        self.outMinMax[1].setText(str(spec.out_range[1]))
+        self.alpha[0].setValue(round(spec.alpha * self.slider_rescale))
+        self.beta[0].setValue(spec.beta)
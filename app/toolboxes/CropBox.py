@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 
 
 class CropBox(DraggableToolbox):
@@ -15,14 +15,15 @@ class CropBox(DraggableToolbox):
         self.leftRight  = self.insert_dual_input("Left-Right:", 0, 0)      
         self.topBottom = self.insert_dual_input("Top-Bottom:", 0, 0)
                         
-    def execute(self, imageBGRA, mask):
-        h,w = imageBGRA.shape[:2]       # get the height and width of the input image
-
-        # get the crop values from input
-        leftCut, rightCut = self.get_component_value(self.leftRight[:2], maxs=[w,w], defaults=[0, 0])
-        topCut, bottomCut = self.get_component_value(self.topBottom[:2], maxs=[h,h], defaults=[0, 0])
+    def get_spec(self):
+        # get the crop values from input, values larger than the image are ignored by the spec
+        leftCut, rightCut = self.get_component_value(self.leftRight[:2], defaults=[0, 0])
+        topCut, bottomCut = self.get_component_value(self.topBottom[:2], defaults=[0, 0])
         
-        # apply cropping
-        imageBGRA = processors.crop_image(imageBGRA, leftCut, rightCut, topCut, bottomCut)  
+        return specs.CropSpec(leftCut, rightCut, topCut, bottomCut)
 
-        return imageBGRA    
+    def set_spec(self, spec):
+        self.leftRight[0].setText(str(spec.left))
+        self.leftRight[1].setText(str(spec.right))
+        self.topBottom[0].setText(str(spec.top))
+        self.topBottom[1].setText(str(spec.bottom))
@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 
 
 
@@ -15,9 +15,11 @@ class FlipBox(DraggableToolbox):
         # Insert a radio button group to select the flip direction
         self.buttonGroup = self.insert_radio_buttons(["Horizontal", "Vertical", "Both"])
 
-    def execute(self, imageBGRA, mask):
+    def get_spec(self):
         flipCodes = [1, 0, -1]          # horizontal, vertical, both
-        imageBGRA = processors.flip_image(imageBGRA, flipCodes[self.buttonGroup[0].checkedId()])  # apply flipping
 
-        return imageBGRA
-    
+        return specs.FlipSpec(flipCodes[self.buttonGroup[0].checkedId()])
+
+    def set_spec(self, spec):
+        flipCodes = [1, 0, -1]          # horizontal, vertical, both
+        self.buttonGroup[0].button(flipCodes.index(spec.flip_code)).setChecked(True)
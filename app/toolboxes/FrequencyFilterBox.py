@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 
 
 class FrequencyFilterBox(DraggableToolbox):
@@ -16,14 +16,19 @@ class FrequencyFilterBox(DraggableToolbox):
         
         # insert a slider to select the filter radius
         self.filter_radius = self.insert_slider(heading="Filter Radius:", minValue=1, maxValue=200, defaultValue=30)
-        
 
-    def execute(self, imageBGRA, mask):
+        # insert a switch to filter only the luminance, which is three times faster than filtering every color channel
+        self.luminance = self.insert_switch("Luminance Only")
+        
 
+    def get_spec(self):
         filter_radius = self.filter_radius[0].value()          # get the first filter radius value
         filter_type = self.combo.currentText()                   # get the selected filter type from combo box
+        luminance_only = self.luminance[0].isChecked()
         
-        # apply the selected frequency filter
-        imageBGRA = processors.apply_frequency_filter(imageBGRA, filter_radius, filter_type)
+        return specs.FrequencyFilterSpec(filter_radius, filter_type, luminance_only)
 
-        return imageBGRA
\ No newline at end of file
+    def set_spec(self, spec):
+        self.combo.setCurrentText(spec.filter_type)
+        self.filter_radius[0].setValue(spec.radius)
+        self.luminance[0].setChecked(spec.luminance_only)
@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 
 
 class FullScaleContrastBox(DraggableToolbox):
@@ -11,8 +11,8 @@ class FullScaleContrastBox(DraggableToolbox):
     def __init__(self):
         super().__init__(constants.TOOLBOXES['FULL_SCALE_CONTRAST']['NAME'])
   
-    def execute(self, imageBGRA, mask):
-        # apply full scale contrast stretching
-        imageBGRA = processors.apply_full_scale_contrast(imageBGRA, mask)  
-        
-        return imageBGRA
+    def get_spec(self):
+        return specs.FullScaleContrastSpec()
+
+    def set_spec(self, spec):
+        pass                    # the toolbox has no parameters
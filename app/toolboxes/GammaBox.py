@@ -1,7 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
-import numpy as np
+from app import specs
 
 
 class GammaBox(DraggableToolbox):
@@ -17,9 +16,10 @@ class GammaBox(DraggableToolbox):
         # insert signle input box to select the gamma value
         self.gamma = self.insert_slider(heading="Gamma:", minValue=1, maxValue=100, defaultValue=10, rescale=self.slider_rescale)
 
-    def execute(self, imageBGRA, mask):
-        gamma = self.gamma[0].value() / self.slider_rescale             # get the threshold value from slider
-        imageBGRA = processors.apply_gamma_transform(imageBGRA, gamma, mask)    # apply gamma transformation
+    def get_spec(self):
+        gamma = self.gamma[0].value() / self.slider_rescale             # get the gamma value from slider
 
-        return np.uint8(imageBGRA)     
+        return specs.GammaSpec(gamma)
 
+    def set_spec(self, spec):
+        self.gamma[0].setValue(round(spec.gamma * self.slider_rescale))
@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 
 
 class HistCLAHEBox(DraggableToolbox):
@@ -17,14 +17,14 @@ class HistCLAHEBox(DraggableToolbox):
         self.clipLimit = self.insert_slider(heading="Clip Limit:", minValue=1, maxValue=100, defaultValue=2, rescale=self.clipLimit_rescale)  
         self.tileGridSize = self.insert_mono_input("Tile Grid Size:", defaultValue=8)
 
-    def execute(self, imageBGRA, mask):
+    def get_spec(self):
         # get the clip limit and tile grid size values
         clipLimit = self.clipLimit[0].value() / self.clipLimit_rescale
         tileGridSize = self.get_component_value(self.tileGridSize[:1], mins=[4], maxs=[64], defaults=[8])
         tileGridSize = tileGridSize if tileGridSize % 2 == 0 else tileGridSize + 1          # allow only even numbers for tile grid size
 
-        # apply CLAHE
-        imageBGRA = processors.apply_clahe(imageBGRA, clipLimit, tileGridSize, mask)
+        return specs.HistCLAHESpec(clipLimit, tileGridSize)
 
-        return imageBGRA
- 
\ No newline at end of file
+    def set_spec(self, spec):
+        self.clipLimit[0].setValue(round(spec.clip_limit * self.clipLimit_rescale))
+        self.tileGridSize[0].setText(str(spec.tile_grid_size))
@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 
 
 class HistEqualizationBox(DraggableToolbox):
@@ -11,8 +11,8 @@ class HistEqualizationBox(DraggableToolbox):
     def __init__(self):
         super().__init__(constants.TOOLBOXES['HISTEQ']['NAME'])
   
-    def execute(self, imageBGRA, mask):
-        # apply histogram equalization
-        imageBGRA = processors.apply_histogram_equalization(imageBGRA, mask)  
-        
-        return imageBGRA
+    def get_spec(self):
+        return specs.HistEqualizationSpec()
+
+    def set_spec(self, spec):
+        pass                    # the toolbox has no parameters
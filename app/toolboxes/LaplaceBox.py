@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 
 
 class LaplaceBox(DraggableToolbox):
@@ -16,8 +16,10 @@ class LaplaceBox(DraggableToolbox):
         self.extended = self.insert_switch("Extended Laplace")
         self.norm = self.insert_switch("Normalize")
 
-    def execute(self, imageBGRA, mask):
-        # apply laplace transformation
-        imageBGRA = processors.get_laplacian_filter(imageBGRA, self.extended[0].isChecked(), self.norm[0].isChecked())  
+    def get_spec(self):
+        # get the extended laplace and normalize options
+        return specs.LaplaceSpec(self.extended[0].isChecked(), self.norm[0].isChecked())
 
-        return imageBGRA
+    def set_spec(self, spec):
+        self.extended[0].setChecked(spec.extended)
+        self.norm[0].setChecked(spec.normalize)
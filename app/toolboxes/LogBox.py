@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 
 class LogBox(DraggableToolbox):
     """
@@ -10,9 +10,8 @@ class LogBox(DraggableToolbox):
     def __init__(self):
         super().__init__(constants.TOOLBOXES['LOG']['NAME'])
           
-    def execute(self, imageBGRA, mask):
-        # apply log transformation
-        imageBGRA = processors.apply_log_transform(imageBGRA, mask)  
-
-        return imageBGRA
+    def get_spec(self):
+        return specs.LogSpec()
 
+    def set_spec(self, spec):
+        pass                    # the toolbox has no parameters
@@ -1,8 +1,10 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
-from app.toolbox_bases import select_image
+from app import specs
+from app import processor_utils
+from app.toolbox_bases import select_image_file
 import cv2
+import uuid
 
 class LogicBox(DraggableToolbox):
     """
@@ -14,6 +16,8 @@ class LogicBox(DraggableToolbox):
 
 
         self.secondImage = None         # set a variable to store the second image
+        self.secondImageKey = ""        # a unique key of the second image, changed every time a new image is selected
+        self.secondImagePath = ""       # the path of the second image, saved with the pipeline
 
         # insert a combo list to select the logic operation
         self.combo = self.insert_combo_list(["And", "Or", "Xor"])
@@ -23,19 +27,28 @@ class LogicBox(DraggableToolbox):
         self.button[0].clicked.connect(self.open_second_image_button)  # connect the button click to the open_second_image_button method
 
 
-    def execute(self, imageBGRA, mask):
-        if self.secondImage is not None:
-            operation = self.combo.currentText()                                        # get the selected operation from combo box
-            imageBGRA = processors.perform_image_logic(imageBGRA, self.secondImage, operation)    # apply logic operation
+    def get_spec(self):
+        operation = self.combo.currentText()                                        # get the selected operation from combo box
 
-        return imageBGRA 
+        return specs.LogicSpec(operation, self.secondImageKey, self.secondImagePath, self.secondImage)
+
+    def set_spec(self, spec):
+        self.combo.setCurrentText(spec.operation)
+
+        # the second image is taken over from the spec, it was read from its path when the spec was loaded
+        self.secondImage = spec.second_image
+        self.secondImageKey = spec.second_image_key
+        self.secondImagePath = spec.second_image_path
 
     def open_second_image_button(self):
         """
         Open a file dialog to select the second image.
         """
-        imageBGRA = select_image()     # read the image
+        filePath = select_image_file()      # select the image file
 
-        if imageBGRA is not None:
+        if filePath:
+            imageBGRA = processor_utils.read_image(filePath)                # read the image
             self.secondImage = cv2.cvtColor(imageBGRA, cv2.COLOR_BGRA2BGR)  # convert the image to BGR format
+            self.secondImageKey = str(uuid.uuid4())
+            self.secondImagePath = filePath
             self.updateTrigger.emit()        # emit the signal to indicate that the settings have been changed
@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 
 
 class NoiseBox(DraggableToolbox):
@@ -24,28 +24,28 @@ class NoiseBox(DraggableToolbox):
         # insert signle input boxes to select the salt and pepper probability
         self.saltPepProb = self.insert_slider(heading="Probability:", minValue=0, maxValue=200, defaultValue=20, rescale=self.saltPepProb_rescale)
 
+        # insert a single input box to select the seed of the noise, shown for every noise type
+        self.seed = self.insert_mono_input("Seed:", defaultValue=0)
+
          # connect widgets to the appropriate combo lists 
         self.set_combo_adapt_widgets(self.combo, [[self.mean, self.std], [self.saltPepProb], []])
    
-    def execute(self, imageBGRA, mask):
-        if self.combo.currentText() == "Gaussian":
-            # get mean and std values from inputs and apply gaussian noise
-            mean = self.mean[0].value() 
-            std = self.std[0].value()
-            imageBGRA = processors.add_gaussian_noise(imageBGRA, mean, std, mask)  
-            
-            return imageBGRA
-        
-        elif self.combo.currentText() == "Salt & Pepper":
-            # get salt and pepper probability values from the text boxes and apply salt and pepper noise
-            saltPepProb = self.saltPepProb[0].value() / self.saltPepProb_rescale
-            imageBGRA = self.add_salt_and_pepper(imageBGRA, saltPepProb, mask)
-            
-            return imageBGRA    
-        
-        elif self.combo.currentText() == "Poisson": 
-            # apply poisson noise
-            imageBGRA = self.add_poisson_noise(imageBGRA, mask)
-            
-            return imageBGRA
-  
\ No newline at end of file
+    def get_spec(self):
+        # get mean and std values for the gaussian noise
+        mean = self.mean[0].value() 
+        std = self.std[0].value()
+
+        # get salt and pepper probability value from the slider
+        saltPepProb = self.saltPepProb[0].value() / self.saltPepProb_rescale
+
+        # get the seed of the noise
+        seed = self.get_component_value(self.seed[:1], mins=[0], defaults=[0])
+
+        return specs.NoiseSpec(self.combo.currentText(), mean, std, saltPepProb, seed=seed)
+
+    def set_spec(self, spec):
+        self.combo.setCurrentText(spec.noise_type)
+        self.mean[0].setValue(spec.mean)
+        self.std[0].setValue(spec.std)
+        self.saltPepProb[0].setValue(round(spec.salt_pep_prob * self.saltPepProb_rescale))
+        self.seed[0].setText(str(spec.seed))
@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 
 class OrderStatBox(DraggableToolbox):
     """
@@ -18,17 +18,15 @@ class OrderStatBox(DraggableToolbox):
          # connect widgets to the appropriate combo lists 
         self.set_combo_adapt_widgets(self.combo, [[self.kernel], [self.kernel], [self.kernel]])
 
-    def execute(self, imageBGRA, mask):
+    def get_spec(self):
         # get the kernel size and make sure it is odd
         w = self.get_component_value(self.kernel[:1], mins=[0], defaults=[3])         
         w = w if w % 2 == 1 else w + 1                                      
         
-        # apply the selected smoothing method
-        if self.combo.currentText() == "Median":
-            imageBGRA = processors.apply_order_stat_filter(imageBGRA, w, "median", mask)  
-        elif self.combo.currentText() == "Max":
-            imageBGRA = processors.apply_order_stat_filter(imageBGRA, w, "max", mask)  
-        elif self.combo.currentText() == "Min":
-            imageBGRA = processors.apply_order_stat_filter(imageBGRA, w, "min", mask)   
+        # the order names used by the processor are the lowercase combo box items
+        return specs.OrderStatSpec(self.combo.currentText().lower(), w)
 
-        return imageBGRA
+    def set_spec(self, spec):
+        # the order names used by the processor are the lowercase combo box items
+        self.combo.setCurrentText(spec.order.capitalize())
+        self.kernel[0].setText(str(spec.kernel_size))
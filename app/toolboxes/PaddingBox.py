@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 import cv2
 
 class PaddingBox(DraggableToolbox):
@@ -25,7 +25,7 @@ class PaddingBox(DraggableToolbox):
         self.set_combo_adapt_widgets(self.combo, [[self.constant, self.leftRight, self.topBottom], 
                                                                 [self.leftRight, self.topBottom], [self.leftRight, self.topBottom]])
 
-    def execute(self, imageBGRA, mask):
+    def get_spec(self):
         # get the padding type based on the selected combo box value
         padCodes = [cv2.BORDER_CONSTANT, cv2.BORDER_REFLECT, cv2.BORDER_REPLICATE]
         selectedId = self.combo.currentIndex()        
@@ -36,7 +36,13 @@ class PaddingBox(DraggableToolbox):
         lPad, rPad = self.get_component_value(self.leftRight[:2], defaults=[0, 0])
         tPad, bPad = self.get_component_value(self.topBottom[:2], defaults=[0, 0])
 
-        # apply padding
-        imageBGRA = processors.apply_padding(imageBGRA, paddingType, lPad, rPad, tPad, bPad, constant)  
+        return specs.PaddingSpec(paddingType, lPad, rPad, tPad, bPad, constant)
 
-        return imageBGRA
+    def set_spec(self, spec):
+        padCodes = [cv2.BORDER_CONSTANT, cv2.BORDER_REFLECT, cv2.BORDER_REPLICATE]
+        self.combo.setCurrentIndex(padCodes.index(spec.padding_type))
+        self.constant[0].setText(str(spec.constant))
+        self.leftRight[0].setText(str(spec.left))
+        self.leftRight[1].setText(str(spec.right))
+        self.topBottom[0].setText(str(spec.top))
+        self.topBottom[1].setText(str(spec.bottom))
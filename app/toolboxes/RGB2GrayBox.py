@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 
 
 class RGB2GrayBox(DraggableToolbox):
@@ -12,8 +12,8 @@ class RGB2GrayBox(DraggableToolbox):
     def __init__(self):
         super().__init__(constants.TOOLBOXES['RGB2GRAY']['NAME'])
 
-    def execute(self, imageBGRA, mask):
-        # apply RGB to grayscale conversion
-        imageBGRA = processors.apply_rgb2gray_transform(imageBGRA)              
+    def get_spec(self):
+        return specs.RGB2GraySpec()
 
-        return imageBGRA
+    def set_spec(self, spec):
+        pass                    # the toolbox has no parameters
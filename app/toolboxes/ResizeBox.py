@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 import cv2
 
 class ResizeBox(DraggableToolbox):
@@ -14,7 +14,7 @@ class ResizeBox(DraggableToolbox):
         self.im_width = 0
         self.im_height = 0
                         
-    def execute(self, imageBGRA, mask):
+    def get_spec(self):
 
         if self.combo.currentText() == "Resize by Absolute Size":
             # get input and output range values from the text boxes
@@ -25,10 +25,15 @@ class ResizeBox(DraggableToolbox):
             reWidth = int(self.im_width * percentage)
             reHeight = int(self.im_height * percentage)
             
-        # apply resizing
-        imageBGRA = processors.resize_image(imageBGRA, reWidth, reHeight, self.interpolation_types[self.interpolation.currentIndex()])  
-    
-        return imageBGRA
+        return specs.ResizeSpec(reWidth, reHeight, self.interpolation_types[self.interpolation.currentIndex()])
+
+
+    def set_spec(self, spec):
+        # the saved size is absolute, the percentage is relative to the image the pipeline was saved with
+        self.combo.setCurrentText("Resize by Absolute Size")
+        self.newWidthHeight[0].setText(str(spec.width))
+        self.newWidthHeight[1].setText(str(spec.height))
+        self.interpolation.setCurrentIndex(self.interpolation_types.index(spec.interpolation))
 
 
     def update_toolbox(self, imageBGRA):
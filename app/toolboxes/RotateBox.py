@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 
 
 class RotateBox(DraggableToolbox):
@@ -14,8 +14,10 @@ class RotateBox(DraggableToolbox):
         # Insert a slider to adjust the rotate angle
         self.angle = self.insert_slider(heading="Angle: ", minValue=-180, maxValue=180)  
 
-    def execute(self, imageBGRA, mask):
+    def get_spec(self):
         value = self.angle[0].value()                           # Get the current value of the slider
-        imageBGRA = processors.rotate_image(imageBGRA, value)         # Apply rotation
 
-        return imageBGRA
+        return specs.RotateSpec(value)
+
+    def set_spec(self, spec):
+        self.angle[0].setValue(spec.angle)
@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 
 class SaturationBox(DraggableToolbox):
     """
@@ -13,8 +13,9 @@ class SaturationBox(DraggableToolbox):
         # Create a slider to adjust saturation
         self.saturation = self.insert_slider(heading="Saturation", minValue=-50, maxValue=50)
 
-    def execute(self, imageBGRA, mask):
-        # apply saturation adjustment
-        imageBGRA = processors.adjust_saturation(imageBGRA, self.saturation[0].value(), mask)     
+    def get_spec(self):
+        # get the saturation value from the slider
+        return specs.SaturationSpec(self.saturation[0].value())
 
-        return imageBGRA
\ No newline at end of file
+    def set_spec(self, spec):
+        self.saturation[0].setValue(spec.value)
@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 
 
 class SharpeningBox(DraggableToolbox):
@@ -27,7 +27,7 @@ class SharpeningBox(DraggableToolbox):
         self.set_combo_adapt_widgets(self.combo, [[self.extended, self.alpha], [self.alpha],
                                                                  [self.kernel, self.sigma, self.alpha]])
 
-    def execute(self, imageBGRA, mask):
+    def get_spec(self):
         # get the kernel size and make sure it is odd
         w = self.get_component_value(self.kernel[:1], mins=[0], defaults=[3])         
         w = w if w % 2 == 1 else w + 1                                      
@@ -37,13 +37,11 @@ class SharpeningBox(DraggableToolbox):
         alpha = self.alpha[0].value() / self.alpha_rescale      
         extended = self.extended[0].isChecked()                 
         
-        # apply the selected sharpening method
-        if self.combo.currentText() == "Laplace Sharpening":
-            imageBGRA = processors.apply_laplacian_sharpening(imageBGRA, alpha, extended, mask)
-        elif self.combo.currentText() == "Sobel Sharpening":
-            imageBGRA = processors.apply_sobel_sharpening(imageBGRA, alpha, mask)
-        elif self.combo.currentText() == "Unsharp Masking":
-            imageBGRA = processors.apply_unsharp_mask(imageBGRA, w, sigma, alpha, mask)
+        return specs.SharpeningSpec(self.combo.currentText(), w, sigma, alpha, extended)
 
-        return imageBGRA
- 
\ No newline at end of file
+    def set_spec(self, spec):
+        self.combo.setCurrentText(spec.method)
+        self.kernel[0].setText(str(spec.kernel_size))
+        self.sigma[0].setValue(round(spec.sigma * self.sigma_rescale))
+        self.alpha[0].setValue(round(spec.alpha * self.alpha_rescale))
+        self.extended[0].setChecked(spec.extended)
@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 
 class SmoothingBox(DraggableToolbox):
     """
@@ -22,7 +22,7 @@ class SmoothingBox(DraggableToolbox):
          # connect widgets to the appropriate combo lists 
         self.set_combo_adapt_widgets(self.combo, [[self.kernel], [self.kernel, self.sigma]])
 
-    def execute(self, imageBGRA, mask):
+    def get_spec(self):
         # get the kernel size and make sure it is odd
         w = self.get_component_value(self.kernel[:1], mins=[0], defaults=[3])         
         w = w if w % 2 == 1 else w + 1                                      
@@ -30,11 +30,9 @@ class SmoothingBox(DraggableToolbox):
         # get the sigma value from inputs
         sigma = self.sigma[0].value() / self.sigma_rescale      
         
-        # apply the selected smoothing method
-        if self.combo.currentText() == "Mean":
-            imageBGRA = processors.apply_box_filter(imageBGRA, w, mask)
-        elif self.combo.currentText() == "Gaussian":
-            imageBGRA = processors.apply_gaussian_blur(imageBGRA, w, sigma, mask)  
+        return specs.SmoothingSpec(self.combo.currentText(), w, sigma)
 
-        return imageBGRA
-  
\ No newline at end of file
+    def set_spec(self, spec):
+        self.combo.setCurrentText(spec.method)
+        self.kernel[0].setText(str(spec.kernel_size))
+        self.sigma[0].setValue(round(spec.sigma * self.sigma_rescale))
@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 
 
 class SobelBox(DraggableToolbox):
@@ -14,8 +14,9 @@ class SobelBox(DraggableToolbox):
         # insert a switch to select the normalize option
         self.norm = self.insert_switch("Normalize")
         
-    def execute(self, imageBGRA, mask):
-        # apply sobel transformation
-        imageBGRA = processors.get_sobel_filter(imageBGRA, self.norm[0].isChecked())  
+    def get_spec(self):
+        # get the normalize option
+        return specs.SobelSpec(self.norm[0].isChecked())
 
-        return imageBGRA
+    def set_spec(self, spec):
+        self.norm[0].setChecked(spec.normalize)
@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 
 class SpatialMaskBox(DraggableToolbox):
     """
@@ -14,16 +14,24 @@ class SpatialMaskBox(DraggableToolbox):
         self.im_size = [0, 0]
 
 
-    def execute(self, imageBGRA, mask):
+    def get_spec(self):
+
+        # get the slider values of the spatial mask
+        return specs.SpatialMaskSpec(self.slid_width[0].value(), self.slid_height[0].value(),
+                                     self.slid_left[0].value(), self.slid_top[0].value(), 
+                                     self.slid_bor_radius[0].value(), self.invert[0].isChecked())
+
+
+    def set_spec(self, spec):
+        self.invert[0].setChecked(spec.invert)
+
+        # the sliders are limited to the size of the current image, they are extended to fit the saved values
+        for slider, value in ((self.slid_width, spec.width), (self.slid_height, spec.height), (self.slid_left, spec.left),
+                              (self.slid_top, spec.top), (self.slid_bor_radius, spec.border_radius)):
+            slider[0].setMaximum(max(slider[0].maximum(), value))
+            slider[0].setValue(value)
 
-        # get the slider values and apply spatial masking
-        mask = processors.generate_spatial_mask(imageBGRA, self.slid_width[0].value(), self.slid_height[0].value(),
-                                                    self.slid_left[0].value(), self.slid_top[0].value(), 
-                                                    self.slid_bor_radius[0].value(), self.invert[0].isChecked()) 
 
-        return imageBGRA, mask
-    
-    
     def update_toolbox(self, imageBGRA):
         super().update_toolbox(imageBGRA)  
 
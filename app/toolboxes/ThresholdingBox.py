@@ -1,6 +1,6 @@
 from app.toolbox_bases import DraggableToolbox
 import constants
-from app import processors
+from app import specs
 
 
 class ThresholdingBox(DraggableToolbox):
@@ -14,8 +14,10 @@ class ThresholdingBox(DraggableToolbox):
         # insert slider to select the threshold value
         self.threshold = self.insert_slider(heading="Threshold:", minValue=0, maxValue=255, defaultValue=128)
 
-    def execute(self, imageBGRA, mask):
+    def get_spec(self):
         threshold = self.threshold[0].value()                               # get the threshold value from slider
-        imageBGRA = processors.apply_threshold_filter(imageBGRA, threshold)          # apply thresholding
         
-        return imageBGRA
+        return specs.ThresholdingSpec(threshold)
+
+    def set_spec(self, spec):
+        self.threshold[0].setValue(spec.threshold)
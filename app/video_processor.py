@@ -0,0 +1,181 @@
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+
+import constants
+from app.pipeline import Pipeline
+
+
+class VideoFile():
+    """
+    A class giving random access to the frames of a video file, used to scrub through a video in the GUI.
+    Args:
+        filePath (str): The path of the video file.
+    """
+    def __init__(self, filePath):
+        self.path = filePath
+        self.capture = cv2.VideoCapture(filePath)
+        if not self.capture.isOpened():
+            raise ValueError(f"Failed to open the video: {filePath}")
+
+        self.frame_count = int(self.capture.get(cv2.CAP_PROP_FRAME_COUNT))
+        self.fps = self.capture.get(cv2.CAP_PROP_FPS) or 30.0
+        self.position = 0                   # the index of the frame the next read returns
+
+
+    def read_frame(self, index):
+        """
+        Read a frame of the video.
+        Args:
+            index (int): The index of the frame.
+        Returns:
+            frame (numpy.ndarray): The frame in the BGRA format, or None if the frame can not be read.
+        """
+        if index != self.position:          # seeking is slow, consecutive frames are read one after another
+            self.capture.set(cv2.CAP_PROP_POS_FRAMES, index)
+
+        ok, frame = self.capture.read()
+        self.position = index + 1 if ok else -1
+
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2BGRA) if ok else None
+
+
+    def release(self):
+        """
+        Close the video file.
+        """
+        self.capture.release()
+
+
+class VideoProcessor():
+    """
+    A class that runs the pipeline on every frame of a video file and writes the processed frames to a new video file.
+    Decoding, processing and encoding run as separate stages connected by bounded queues: a reader thread decodes the frames
+    and hands them to a pool of worker threads, and the calling thread encodes the processed frames in their original order.
+    Every worker has its own pipeline, OpenCV releases the GIL so the frames are processed in parallel.
+    Args:
+        workers (int): The number of threads processing the frames. Defaults to the number of CPUs.
+        fourcc (str): The codec of the output video. Defaults to 'constants.VIDEO_FOURCC'.
+    """
+    def __init__(self, workers=None, fourcc=constants.VIDEO_FOURCC):
+        self.workers = workers or os.cpu_count() or 1
+        self.fourcc = fourcc
+        self.local = threading.local()      # the pipeline of every worker thread
+
+
+    def run(self, input_path, output_path, specs, progress=None, cancelled=None):
+        """
+        Process a video file.
+        Args:
+            input_path (str): The path of the input video.
+            output_path (str): The path of the output video, its extension must suit the codec.
+            specs (list): A snapshot of the steps taken by 'Pipeline.snapshot', None for the disabled steps.
+            progress (callable): A function called on the calling thread with the number of written frames and the total number of frames.
+            cancelled (callable): A function checked between the frames, the processing stops when it returns True.
+        Returns:
+            int: The number of written frames.
+        """
+        capture = cv2.VideoCapture(input_path)
+        if not capture.isOpened():
+            raise ValueError(f"Failed to open the video: {input_path}")
+
+        total = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+        fps = capture.get(cv2.CAP_PROP_FPS) or 30.0
+
+        results = queue.Queue(maxsize=self.workers * constants.VIDEO_FRAMES_PER_WORKER)     # the futures of the frames in their order
+        stop = threading.Event()
+        writer = None
+        written = 0
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            reader = threading.Thread(target=self.read_frames, args=(capture, pool, specs, results, stop), daemon=True)
+            reader.start()
+
+            try:
+                while True:
+                    future = results.get()
+                    if future is None:              # the reader reached the end of the video
+                        break
+
+                    frame = future.result()
+                    frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR if frame.ndim == 2 else cv2.COLOR_BGRA2BGR)
+                    if writer is None:              # the size of the output is known once the first frame is processed
+                        writer = self.open_writer(output_path, fps, frame.shape)
+                        size = frame.shape[:2]
+                    elif frame.shape[:2] != size:
+                        raise ValueError("The pipeline must produce frames of the same size")
+                    writer.write(frame)
+                    written += 1
+
+                    if progress is not None:
+                        progress(written, total)
+                    if cancelled is not None and cancelled():
+                        break
+            finally:
+                # stop the reader and let it leave a full queue, the frames in flight are dropped
+                stop.set()
+                while reader.is_alive():
+                    try:
+                        results.get(timeout=0.1)
+                    except queue.Empty:
+                        pass
+                capture.release()
+                if writer is not None:
+                    writer.release()
+
+        return written
+
+
+    def read_frames(self, capture, pool, specs, results, stop):
+        """
+        Decode the frames of the video and submit them to the workers, runs on the reader thread.
+        Args:
+            capture (cv2.VideoCapture): The opened input video.
+            pool (ThreadPoolExecutor): The pool of the workers.
+            specs (list): The snapshot of the steps.
+            results (queue.Queue): The bounded queue receiving the futures of the frames in their order, None marks the end.
+            stop (threading.Event): Set when the processing is stopped.
+        """
+        while not stop.is_set():
+            ok, frame = capture.read()
+            if not ok:
+                break
+            results.put(pool.submit(self.process_frame, cv2.cvtColor(frame, cv2.COLOR_BGR2BGRA), specs))   # blocks while the queue is full
+
+        results.put(None)
+
+
+    def process_frame(self, frame, specs):
+        """
+        Run the pipeline on a single frame, runs on a worker thread.
+        Args:
+            frame (numpy.ndarray): The frame in the BGRA format.
+            specs (list): The snapshot of the steps.
+        Returns:
+            numpy.ndarray: The processed frame in the BGRA format, or a single plane for an opaque grayscale frame.
+        """
+        if not hasattr(self.local, "pipeline"):
+            self.local.pipeline = Pipeline(cache_bytes=0)      # every frame is processed once, caching the steps would only hold memory
+
+        return self.local.pipeline.run(frame, specs)
+
+
+    def open_writer(self, output_path, fps, shape):
+        """
+        Open the output video.
+        Args:
+            output_path (str): The path of the output video.
+            fps (float): The frame rate of the output video.
+            shape (tuple): The shape of the frames.
+        Returns:
+            cv2.VideoWriter: The opened output video.
+        """
+        height, width = shape[:2]
+        writer = cv2.VideoWriter(output_path, cv2.VideoWriter_fourcc(*self.fourcc), fps, (width, height))
+        if not writer.isOpened():
+            raise ValueError(f"Failed to create the video: {output_path}")
+
+        return writer
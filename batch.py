@@ -0,0 +1,179 @@
+import os, sys, glob, time, argparse, traceback
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2
+
+import constants
+from app import pipeline_file, processor_utils
+from app.pipeline import Pipeline
+from app.tiled_executor import TiledExecutor
+
+
+# The pipeline loaded by the initializer of every worker process, reused for all the images processed by the worker.
+worker_pipeline = None
+worker_specs = None
+worker_executor = None                      # the executor of the tiled runs, None if the images are processed at once
+
+
+def init_worker(pipeline_path, tile_size=None):
+    """
+    Load the saved pipeline once in a worker process.
+    Args:
+        pipeline_path (str): The path of the pipeline file.
+        tile_size (int): The size of the tiles if the images are processed tile by tile, None to process them at once.
+    """
+    global worker_pipeline, worker_specs, worker_executor
+
+    cv2.setNumThreads(1)                    # the processes already use all the cores
+    worker_pipeline = Pipeline(cache_bytes=0)           # every image is processed once, caching the steps would only hold memory
+    worker_specs = pipeline_file.load_pipeline(pipeline_path)
+    if tile_size is not None:
+        worker_executor = TiledExecutor(tile_size, workers=1)          # the processes already use all the cores
+
+
+def process_image(job):
+    """
+    Apply the pipeline of the worker to a single image and write the output.
+    Args:
+        job (tuple): The input path and the output path of the image.
+    Returns:
+        tuple: The input path and the error message, None if the image was processed successfully.
+    """
+    input_path, output_path = job
+    try:
+        image = processor_utils.read_image(input_path, keep_gray=True)
+        if worker_executor is not None:
+            output = worker_pipeline.run_tiled(image, worker_specs, worker_executor)
+        else:
+            output = worker_pipeline.run(image, worker_specs)
+        if not cv2.imwrite(output_path, output):
+            raise ValueError("Failed to write the output image")
+    except Exception as e:
+        return input_path, f"{type(e).__name__}: {e}"
+
+    return input_path, None
+
+
+def find_images(source):
+    """
+    List the image files of a directory or matching a glob pattern.
+    Args:
+        source (str): A directory or a glob pattern.
+    Returns:
+        list: The sorted paths of the image files.
+    """
+    if os.path.isdir(source):
+        paths = [os.path.join(source, name) for name in os.listdir(source)]
+    else:
+        paths = glob.glob(source, recursive=True)
+
+    return sorted(path for path in paths if os.path.isfile(path) and os.path.splitext(path)[1].lower() in constants.IMAGE_EXTENSIONS)
+
+
+def get_jobs(paths, output_dir, extension=None):
+    """
+    Pair every input image with the path of its output.
+    The outputs mirror the subdirectories of the inputs below their common directory, so images with the same name
+    in different directories do not overwrite each other.
+    Args:
+        paths (list): The paths of the input images.
+        output_dir (str): The directory of the outputs, named after the inputs.
+        extension (str): The extension of the outputs, which selects their format. Defaults to the extension of the input.
+    Returns:
+        list: The (input path, output path) pairs.
+    Raises:
+        ValueError: If several inputs would be written to the same output, e.g. 'x.png' and 'x.jpg' with the extension 'png'.
+    """
+    base_dir = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in paths])
+    jobs = []
+    outputs = {}
+    for path in paths:
+        name, input_extension = os.path.splitext(os.path.relpath(os.path.abspath(path), base_dir))
+        output_extension = input_extension if extension is None else "." + extension.lstrip(".")
+        output_path = os.path.join(output_dir, name + output_extension)
+
+        if output_path in outputs:
+            raise ValueError(f"{outputs[output_path]} and {path} would both be written to {output_path}")
+        outputs[output_path] = path
+        jobs.append((path, output_path))
+
+    return jobs
+
+
+def run_batch(pipeline_path, jobs, workers=None, tile_size=None):
+    """
+    Process the images on a pool of worker processes.
+    Args:
+        pipeline_path (str): The path of the pipeline file.
+        jobs (list): The (input path, output path) pairs of the images.
+        workers (int): The number of worker processes. Defaults to the number of CPUs.
+        tile_size (int): The size of the tiles if the images are processed tile by tile, None to process them at once.
+    Returns:
+        list: The (input path, error message) pairs of the images that failed.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, min(32, len(jobs) // (workers * 4)))             # large enough to keep the workers busy, small enough to balance them
+    failures = []
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(pipeline_path, tile_size)) as pool:
+        for done, (path, error) in enumerate(pool.map(process_image, jobs, chunksize=chunksize), 1):
+            if error is not None:
+                failures.append((path, error))
+                print(f"Failed: {path}: {error}", file=sys.stderr)
+            if done % 100 == 0:
+                print(f"{done}/{len(jobs)} images processed")
+
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply a saved pipeline to a directory of images.")
+    parser.add_argument("pipeline", help="the pipeline file saved by the application")
+    parser.add_argument("input", help="a directory of images or a glob pattern, e.g. 'photos/**/*.jpg'")
+    parser.add_argument("output", help="the directory the processed images are written to")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="the number of worker processes, defaults to the number of CPUs")
+    parser.add_argument("-e", "--extension", default=None, help="the format of the outputs, e.g. 'png', defaults to the format of the input")
+    parser.add_argument("-t", "--tiled", type=int, nargs="?", const=constants.TILE_SIZE, default=None, metavar="TILE_SIZE",
+                        help=f"process the images tile by tile to bound the memory of the intermediate images, "
+                             f"with tiles of the given size, defaults to {constants.TILE_SIZE}")
+    args = parser.parse_args(argv)
+
+    # load the pipeline once here, so a broken pipeline file is reported before the workers are started
+    try:
+        specs = pipeline_file.load_pipeline(args.pipeline)
+    except Exception:
+        traceback.print_exc()
+        return 2
+
+    if args.tiled is not None:
+        whole_steps = [type(spec).__name__ for spec in specs if spec is not None and spec.halo is None]
+        if whole_steps:
+            print(f"Steps applied to the whole image despite --tiled: {', '.join(whole_steps)}", file=sys.stderr)
+
+    paths = find_images(args.input)
+    if not paths:
+        print(f"No images found: {args.input}", file=sys.stderr)
+        return 2
+
+    # check the outputs before the workers are started, so no image is overwritten by another one
+    try:
+        jobs = get_jobs(paths, args.output, args.extension)
+    except ValueError as e:
+        print(f"Conflicting outputs: {e}", file=sys.stderr)
+        return 2
+
+    for output_dir in sorted({os.path.dirname(output_path) for _, output_path in jobs}):
+        os.makedirs(output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    failures = run_batch(args.pipeline, jobs, args.workers, args.tiled)
+    elapsed = time.perf_counter() - start
+
+    print(f"{len(jobs) - len(failures)} of {len(jobs)} images processed in {elapsed:.2f} s "
+          f"({len(jobs) / elapsed:.2f} images/s), {len(failures)} failed")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,287 @@
+import sys, json, time, inspect, fnmatch, argparse, platform, datetime, statistics
+
+import cv2
+import numpy as np
+
+from app import processors
+
+
+# The sizes of the synthetic images as (height, width), named after their megapixels.
+SIZES = {
+    "1MP": (864, 1152),
+    "12MP": (3000, 4000),
+    "48MP": (6000, 8000),
+}
+
+LAYOUTS = ("opaque", "alpha", "gray")           # opaque BGRA, BGRA with a real alpha channel, grayscale stored in BGRA
+
+# The representative parameters of every processor exported from 'app/processors', as (label, args, kwargs).
+# 'SECOND' is replaced by a second synthetic BGR image of the same size, 'WIDTH' and 'HEIGHT' by the size of the image.
+SECOND, WIDTH, HEIGHT = "<second>", "<width>", "<height>"
+CASES = {
+    "add_gaussian_noise": [("std=25", (0, 25), {})],
+    "add_poisson_noise": [("", (), {})],
+    "add_salt_and_pepper": [("p=0.02", (0.02,), {})],
+    "adjust_brightness": [("HSV", (30, "HSV"), {}), ("RGB", (30, "RGB"), {})],
+    "adjust_contrast_by_range": [("50-200", ([50, 200], [0, 255]), {})],
+    "adjust_contrast_by_T": [("a=1.5", (1.5, 10), {})],
+    "adjust_saturation": [("+30", (30,), {})],
+    "apply_box_filter": [("k=5", (5,), {}), ("k=31", (31,), {})],
+    "apply_clahe": [("clip=2", (2.0, 8), {})],
+    "apply_frequency_filter": [("low r=30", (30, "Low Pass"), {}), ("high r=30", (30, "High Pass"), {})],
+    "apply_full_scale_contrast": [("", (), {})],
+    "apply_gamma_transform": [("g=0.5", (0.5,), {})],
+    "apply_gaussian_blur": [("k=5", (5, 1.5), {}), ("k=31", (31, 8.0), {})],
+    "apply_histogram_equalization": [("", (), {})],
+    "apply_image_arithmetic": [("Add", (SECOND, 0.5, "Add"), {}), ("Divide", (SECOND, 1.0, "Divide"), {})],
+    "apply_laplacian_sharpening": [("a=1", (1.0,), {})],
+    "apply_log_transform": [("", (), {})],
+    "apply_order_stat_filter": [("median k=3", (3, "median"), {}), ("max k=7", (7, "max"), {})],
+    "apply_padding": [("reflect 64", (cv2.BORDER_REFLECT, 64, 64, 64, 64, 0), {})],
+    "apply_rgb2gray_transform": [("", (), {})],
+    "apply_sobel_sharpening": [("a=1", (1.0,), {})],
+    "apply_threshold_filter": [("t=128", (128,), {})],
+    "apply_unsharp_mask": [("k=5", (5, 1.5, 1.0), {})],
+    "crop_image": [("64", (64, 64, 64, 64), {})],
+    "extract_bit_planes": [("bit=7", (7,), {})],
+    "flip_image": [("horizontal", (1,), {})],
+    "generate_color_mask": [("green", (np.array([35, 50, 50]), np.array([85, 255, 255])), {})],
+    "generate_spatial_mask": [("r=50", (WIDTH, HEIGHT, 0, 0, 50), {})],
+    "get_image_complement": [("", (), {})],
+    "get_laplacian_filter": [("", (), {}), ("normalized", (), {"normalize": True})],
+    "get_sobel_filter": [("", (), {}), ("normalized", (), {"normalize": True})],
+    "perform_image_logic": [("And", (SECOND, "And"), {})],
+    "resize_image": [("half area", (WIDTH, HEIGHT, cv2.INTER_AREA), {})],
+    "rotate_image": [("30", (30,), {})],
+}
+
+
+def make_image(size, layout, seed=0):
+    """
+    Create a deterministic synthetic image with smooth structure, edges and fine noise, like a photograph.
+    Args:
+        size (tuple): The (height, width) of the image.
+        layout (str): One of 'LAYOUTS'.
+        seed (int): The seed of the random content.
+    Returns:
+        numpy.ndarray: The image in the BGRA format.
+    """
+    height, width = size
+    rng = np.random.default_rng(seed)
+
+    coarse = rng.integers(0, 256, (height // 64 + 2, width // 64 + 2, 3), dtype=np.uint8)
+    image = cv2.resize(coarse, (width, height), interpolation=cv2.INTER_CUBIC)          # smooth gradients
+    cv2.rectangle(image, (width // 8, height // 8), (width // 3, height // 3), (20, 200, 60), -1)   # flat areas with sharp edges
+    cv2.add(image, rng.integers(0, 16, image.shape, dtype=np.uint8), dst=image)         # fine noise
+
+    if layout == "gray":
+        image = cv2.cvtColor(cv2.cvtColor(image, cv2.COLOR_BGR2GRAY), cv2.COLOR_GRAY2BGR)
+    image = cv2.cvtColor(image, cv2.COLOR_BGR2BGRA)
+    if layout == "alpha":
+        image[:, :, 3] = np.linspace(0, 255, width, dtype=np.uint8)                     # a horizontal alpha ramp
+
+    return image
+
+
+def make_mask(size):
+    """
+    Create the mask of the masked variants, an ellipse covering about half of the image.
+    Args:
+        size (tuple): The (height, width) of the image.
+    Returns:
+        numpy.ndarray: The mask, 255 inside the ellipse and 0 outside.
+    """
+    height, width = size
+    mask = np.zeros(size, dtype=np.uint8)
+    cv2.ellipse(mask, (width // 2, height // 2), (int(width * 0.4), int(height * 0.4)), 0, 0, 360, 255, -1)
+
+    return mask
+
+
+def resolve_args(args, size, second):
+    """
+    Replace the placeholders of the parameters of a case.
+    Args:
+        args (tuple): The parameters of the case.
+        size (tuple): The (height, width) of the image.
+        second (numpy.ndarray): The second image of the two-image processors.
+    Returns:
+        tuple: The parameters passed to the processor.
+    """
+    height, width = size
+    placeholders = {SECOND: second, WIDTH: width // 2, HEIGHT: height // 2}
+
+    return tuple(placeholders.get(arg, arg) if isinstance(arg, str) else arg for arg in args)
+
+
+def time_case(function, image, args, kwargs, repeat):
+    """
+    Time a processor on fresh copies of the image, the copies are not timed since the processors may write their input.
+    Args:
+        function (callable): The processor.
+        image (numpy.ndarray): The input image.
+        args (tuple): The positional parameters.
+        kwargs (dict): The keyword parameters.
+        repeat (int): The number of timed runs, after one untimed warm-up run.
+    Returns:
+        dict: The median and the minimum time in milliseconds.
+    """
+    times = []
+    for run in range(repeat + 1):
+        work = image.copy()
+        start = time.perf_counter()
+        function(work, *args, **kwargs)
+        elapsed = time.perf_counter() - start
+        if run > 0:
+            times.append(elapsed * 1000)
+
+    return {"median_ms": round(statistics.median(times), 3), "min_ms": round(min(times), 3)}
+
+
+def run_benchmarks(sizes, layouts, pattern="*", repeat=5):
+    """
+    Time every case of 'CASES' on every size and layout, unmasked and, if the processor takes a mask, masked.
+    Args:
+        sizes (list): The names of the sizes, keys of 'SIZES'.
+        layouts (list): The channel layouts, items of 'LAYOUTS'.
+        pattern (str): A glob pattern selecting the processors by name.
+        repeat (int): The number of timed runs of every case.
+    Returns:
+        dict: The results keyed by 'processor[label]/size/layout/variant', the failed cases hold an 'error' instead of the times.
+    """
+    results = {}
+    names = [name for name in sorted(CASES) if fnmatch.fnmatch(name, pattern)]
+
+    exported = [name for name in dir(processors) if not name.startswith("_") and inspect.isfunction(getattr(processors, name))]
+    for name in sorted(set(exported) - set(CASES)):
+        print(f"Warning: {name} has no case in CASES and is not timed", file=sys.stderr)
+
+    for size_name in sizes:
+        size = SIZES[size_name]
+        mask = make_mask(size)
+        for layout in layouts:
+            image = make_image(size, layout)
+            second = cv2.cvtColor(make_image(size, layout, seed=1), cv2.COLOR_BGRA2BGR)     # the toolboxes load the second image as BGR
+
+            for name in names:
+                function = getattr(processors, name)
+                takes_mask = "mask" in inspect.signature(function).parameters
+                for label, args, kwargs in CASES[name]:
+                    args = resolve_args(args, size, second)
+                    variants = [("unmasked", kwargs)] + ([("masked", dict(kwargs, mask=mask))] if takes_mask else [])
+                    for variant, variant_kwargs in variants:
+                        key = f"{name}[{label}]/{size_name}/{layout}/{variant}"
+                        try:
+                            results[key] = time_case(function, image, args, variant_kwargs, repeat)
+                        except Exception as e:
+                            results[key] = {"error": f"{type(e).__name__}: {e}"}
+                        print(f"{key}: {format_result(results[key])}", flush=True)
+
+    return results
+
+
+def format_result(result):
+    """
+    Format a result for printing.
+    Args:
+        result (dict): A result of 'run_benchmarks'.
+    Returns:
+        str: The median and the minimum time, or the error.
+    """
+    if "error" in result:
+        return result["error"]
+
+    return f"{result['median_ms']:.2f} ms (min {result['min_ms']:.2f} ms)"
+
+
+def get_environment():
+    """
+    Describe the machine and the libraries, since the times are only comparable on the same environment.
+    Returns:
+        dict: The environment of the run.
+    """
+    return {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "opencv": cv2.__version__,
+        "opencv_threads": cv2.getNumThreads(),
+    }
+
+
+def compare_results(baseline, current, threshold):
+    """
+    Compare the median times of two runs.
+    Args:
+        baseline (dict): The results of the baseline run.
+        current (dict): The results of the current run.
+        threshold (float): The relative slowdown flagged as a regression, e.g. 0.1 for 10%.
+    Returns:
+        list: The (key, baseline ms, current ms, ratio) of the regressions, sorted from the worst.
+    """
+    regressions = []
+    for key in sorted(set(baseline) & set(current)):
+        before, after = baseline[key], current[key]
+        if "error" in before or "error" in after or before["median_ms"] <= 0:
+            continue
+
+        ratio = after["median_ms"] / before["median_ms"]
+        marker = "REGRESSION" if ratio > 1 + threshold else ""
+        print(f"{key}: {before['median_ms']:.2f} -> {after['median_ms']:.2f} ms ({ratio:.2f}x) {marker}")
+        if marker:
+            regressions.append((key, before["median_ms"], after["median_ms"], ratio))
+
+    return sorted(regressions, key=lambda regression: -regression[3])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the image processors on synthetic images and compare the times with a baseline.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="time the processors and write the results to a JSON file")
+    run_parser.add_argument("output", help="the JSON file the results are written to, e.g. 'baseline.json'")
+    run_parser.add_argument("-s", "--sizes", nargs="+", choices=list(SIZES), default=list(SIZES), help="the image sizes, defaults to all")
+    run_parser.add_argument("-l", "--layouts", nargs="+", choices=LAYOUTS, default=list(LAYOUTS), help="the channel layouts, defaults to all")
+    run_parser.add_argument("-k", "--processors", default="*", help="a glob pattern selecting the processors, e.g. 'apply_*'")
+    run_parser.add_argument("-r", "--repeat", type=int, default=5, help="the number of timed runs of every case, defaults to 5")
+    run_parser.add_argument("-t", "--threads", type=int, default=None, help="the number of OpenCV threads, defaults to the OpenCV default")
+
+    compare_parser = commands.add_parser("compare", help="compare two result files and flag the regressions")
+    compare_parser.add_argument("baseline", help="the JSON file of the baseline run")
+    compare_parser.add_argument("current", help="the JSON file of the current run")
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="the relative slowdown flagged as a regression, defaults to 0.1")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        if args.threads is not None:
+            cv2.setNumThreads(args.threads)
+
+        results = run_benchmarks(args.sizes, args.layouts, args.processors, args.repeat)
+        with open(args.output, "w") as file:
+            json.dump({"environment": get_environment(), "results": results}, file, indent=2)
+        print(f"{len(results)} cases written to {args.output}")
+
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.current) as file:
+        current = json.load(file)
+
+    if baseline["environment"] != current["environment"]:
+        changed = [name for name in current["environment"] if name != "date" and baseline["environment"].get(name) != current["environment"][name]]
+        if changed:
+            print(f"Warning: the environments differ in {', '.join(changed)}", file=sys.stderr)
+
+    regressions = compare_results(baseline["results"], current["results"], args.threshold)
+    print(f"{len(regressions)} regressions beyond {args.threshold:.0%}")
+    for key, before, after, ratio in regressions:
+        print(f"  {key}: {before:.2f} -> {after:.2f} ms ({ratio:.2f}x)")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
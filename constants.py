@@ -1,154 +1,187 @@
 # keys will be displayed in the GUI.
 # Values must exactly match the related class names defined in the toolboxes.py file.
+# 'SPEC' is the class name of the parameters of the toolbox defined in the specs package, used to save and load pipelines.
 TOOLBOXES = {
     "BRIGHTNESS": {
         "NAME": "Brightness",
-        "CLASS": "BrightnessBox"
+        "CLASS": "BrightnessBox",
+        "SPEC": "BrightnessSpec"
     },
 
     "SATURATION": {
         "NAME": "Saturation",
-        "CLASS": "SaturationBox"
+        "CLASS": "SaturationBox",
+        "SPEC": "SaturationSpec"
     },
 
     "CONTRAST": {
         "NAME": "Contrast",
-        "CLASS": "ContrastBox"
+        "CLASS": "ContrastBox",
+        "SPEC": "ContrastSpec"
     },
 
     "FULL_SCALE_CONTRAST": {
         "NAME": "Full Scale Contrast",
-        "CLASS": "FullScaleContrastBox"
+        "CLASS": "FullScaleContrastBox",
+        "SPEC": "FullScaleContrastSpec"
     },
 
     "LOG": {
         "NAME": "Log Transform",
-        "CLASS": "LogBox"
+        "CLASS": "LogBox",
+        "SPEC": "LogSpec"
     },
 
     "GAMMA": {
         "NAME": "Gamma Transform",
-        "CLASS": "GammaBox"
+        "CLASS": "GammaBox",
+        "SPEC": "GammaSpec"
     },
 
     "RGB2GRAY": {
         "NAME": "RGB to Gray",
-        "CLASS": "RGB2GrayBox"
+        "CLASS": "RGB2GrayBox",
+        "SPEC": "RGB2GraySpec"
     },
 
     "THRESHOLDING": {
         "NAME": "Thresholding",
-        "CLASS": "ThresholdingBox"
+        "CLASS": "ThresholdingBox",
+        "SPEC": "ThresholdingSpec"
     },
 
     "COMPLEMENT":   {
         "NAME": "Complement",
-        "CLASS": "ComplementBox"
+        "CLASS": "ComplementBox",
+        "SPEC": "ComplementSpec"
     },
 
     "CROP": {
         "NAME": "Crop",
-        "CLASS": "CropBox"
+        "CLASS": "CropBox",
+        "SPEC": "CropSpec"
     },
 
     "FLIP":   {
         "NAME": "Flip",
-        "CLASS": "FlipBox"
+        "CLASS": "FlipBox",
+        "SPEC": "FlipSpec"
     },
 
     "ROTATE": {
         "NAME": "Rotate",
-        "CLASS": "RotateBox"
+        "CLASS": "RotateBox",
+        "SPEC": "RotateSpec"
     },
 
     "RESIZE": {
         "NAME": "Resize",
-        "CLASS": "ResizeBox"
+        "CLASS": "ResizeBox",
+        "SPEC": "ResizeSpec"
     },
 
     "PADDING": {
         "NAME": "Padding",
-        "CLASS": "PaddingBox"
+        "CLASS": "PaddingBox",
+        "SPEC": "PaddingSpec"
     },
 
     "HISTEQ": {
         "NAME": "Histogram Equalization",
-        "CLASS": "HistEqualizationBox"
+        "CLASS": "HistEqualizationBox",
+        "SPEC": "HistEqualizationSpec"
     },
 
     "HISTCLAHE": {
         "NAME": "Local Hist. Equalization",
-        "CLASS": "HistCLAHEBox"
+        "CLASS": "HistCLAHEBox",
+        "SPEC": "HistCLAHESpec"
     }, 
 
     "COLOR_MASKING": {
         "NAME": "Color Masking",
-        "CLASS": "ColorMaskBox"
+        "CLASS": "ColorMaskBox",
+        "SPEC": "ColorMaskSpec"
     },
 
     "SPATIAL_MASKING":   {
         "NAME": "Spatial Masking",
-        "CLASS": "SpatialMaskBox"
+        "CLASS": "SpatialMaskBox",
+        "SPEC": "SpatialMaskSpec"
     },
 
     "BITSLICE": {
         "NAME": "Bit Plane Slicing",
-        "CLASS": "BitSliceBox"
+        "CLASS": "BitSliceBox",
+        "SPEC": "BitSliceSpec"
     },
 
     "ADD_NOISE": {
         "NAME": "Add Noise",
-        "CLASS": "NoiseBox"
+        "CLASS": "NoiseBox",
+        "SPEC": "NoiseSpec"
     },
 
     "ARITHMETIC": {
         "NAME": "Image Arithmetic",
-        "CLASS": "ArithmeticBox"
+        "CLASS": "ArithmeticBox",
+        "SPEC": "ArithmeticSpec"
     },
 
     "LOGIC": {
         "NAME": "Image Logic",
-        "CLASS": "LogicBox"
+        "CLASS": "LogicBox",
+        "SPEC": "LogicSpec"
     },
 
     "LAPLACE": {
         "NAME": "Laplacian Filter",
-        "CLASS": "LaplaceBox"
+        "CLASS": "LaplaceBox",
+        "SPEC": "LaplaceSpec"
     },
 
     "SOBEL": {
         "NAME": "Sobel Filter",
-        "CLASS": "SobelBox"
+        "CLASS": "SobelBox",
+        "SPEC": "SobelSpec"
     },
 
     "ORDER_STAT": {
         "NAME": "Order Statistic Filter",
-        "CLASS": "OrderStatBox"
+        "CLASS": "OrderStatBox",
+        "SPEC": "OrderStatSpec"
     },
 
     "SMOOTHING": {
         "NAME": "Smoothing Filter",
-        "CLASS": "SmoothingBox"
+        "CLASS": "SmoothingBox",
+        "SPEC": "SmoothingSpec"
     },
 
     "SHARPENING": {
         "NAME": "Sharpening Filter",
-        "CLASS": "SharpeningBox"
+        "CLASS": "SharpeningBox",
+        "SPEC": "SharpeningSpec"
     },
 
     "FREQ_FILTER": {
         "NAME": "Frequency Filter",
-        "CLASS": "FrequencyFilterBox"
+        "CLASS": "FrequencyFilterBox",
+        "SPEC": "FrequencyFilterSpec"
     }
 }
 
 
 # main button names
 OPEN_BUTTON = "Open"
+OPEN_VIDEO_BUTTON = "Open Video"
 HISTOGRAM_BUTTON = "Histogram"
 CHANNELS_BUTTON = "Channels"
 FREQUENCY_BUTTON = "Frequency"
 SAVE_BUTTON = "Save"
+SAVE_PIPELINE_BUTTON = "Save Pipeline"
+LOAD_PIPELINE_BUTTON = "Load Pipeline"
+SAVE_TRACE_BUTTON = "Save Trace"
 
 
 # title of the 'add new' toolbox
@@ -167,6 +200,58 @@ VISUALIZATION_TYPES = {"Image":["RGBA", "Red (RGBA)", "Green (RGBA)", "Blue (RGB
                         }
 
 
+# Maximum number of bytes the pipeline may spend on caching the outputs of its steps.
+PIPELINE_CACHE_BYTES = 1024 * 1024 * 1024
+
+# Number of recent input images recognized by the pipeline cache, the full resolution image and its preview proxy.
+PIPELINE_CACHED_INPUTS = 2
+
+
+# Size in pixels of the square tiles used by the tiled execution of the pipeline.
+TILE_SIZE = 1024
+
+# Largest fraction of the image covered by the bounding box of a mask for which a masked step is run on the bounding box only.
+ROI_MAX_FRACTION = 0.5
+
+# Number of the transfer functions of the frequency filter kept in memory, each as large as a float32 plane of the image.
+TRANSFER_FUNCTION_CACHE_SIZE = 4
+
+# Number of rows of the bands the noise is drawn in, every band from its own random stream. Changing it changes the noise of a seed.
+NOISE_BAND_ROWS = 256
+
+# Number of the spatial masks kept in memory, each as large as a uint8 plane of the image.
+SPATIAL_MASK_CACHE_SIZE = 4
+
+# Largest number of pixels counted by the histogram view, larger images are sampled with a stride. None counts every pixel.
+HISTOGRAM_MAX_PIXELS = 4 * 1024 * 1024
+
+# Time in milliseconds the window has to stop being resized for before the views are redrawn at the new size.
+RESIZE_REDRAW_DELAY = 100
+
+# Number of the most recent timed spans (steps, displays) kept by the profiler for the trace export.
+PROFILER_MAX_EVENTS = 50000
+
+# Whether the profiler of the GUI measures the peak memory of every step, which slows down the allocations.
+PROFILE_MEMORY = False
+
+
+# Version of the pipeline file format written by 'app.pipeline_file'.
+PIPELINE_FILE_VERSION = 1
+
+
+# Extensions of the image files processed by the batch command line tool, the same formats the file dialogs accept.
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tif", ".tiff", ".webp")
+
+# Extensions of the video files accepted by the file dialogs.
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".mkv", ".m4v", ".wmv")
+
+# Codec of the written videos, as the four characters passed to 'cv2.VideoWriter_fourcc'.
+VIDEO_FOURCC = "mp4v"
+
+# Number of frames each worker of the video processing may have in flight, bounding the queues between the stages.
+VIDEO_FRAMES_PER_WORKER = 2
+
+
 # Base64 encoded placeholder image for the GUI.
 NO_IMAGE_BASE64 = b"""
 iVBORw0KGgoAAAANSUhEUgAAAOIAAADiCAYAAABTEBvXAAAgAElEQVR4AezBbaw0913f//fnO7N7zvG57Fk7xBZN2jhkQqkUBF5qcSfaCtRCVQqtVIFQHyAkiIJoGkIUlNgNwXU83jixoQreIZBKqKCKaUFqixAJy40UEDwAQYNoH6VIdUSAKL7s+LrmzNndmd+nO4pW+B8RQ8U/PTfZ10ve4eDg4ELJOxwcHFwoeYeDg4MLJe9wcHBwoeQdDg4OLpS8w8HBwYWSdzg4OLhQ8g4HBwcXSt7h4ODgQsk7HBwcXCh5h4ODgwsl73BwcHCh5B0ODg4ulLzDwcHBhZJ3ODg4uFDyDgcHBxdK3uHg4OBCyTscHBxcKHmHg4ODCyXvcHBwcKHkHQ4ODi6UvMPBwcGFknc4ODi4UPIOBwcHF0re4eDg4ELJOxwcHFwoeYeDg4MLJe9wcHBwoeQdDg4OLpS8w8HBwYWSdzg4OLhQ8g4HBwcXSt7h4ODgQsk7HBwcXCh5h4ODgwsl73BwcHCh5B0ODg4ulLzDwcHBhZJ3ODg4uFDyDgcHBxdK3uHg4OBCyTscHBxcKHmHg4ODCyXvcHBwcKHkHQ4ODi6UvMPBwcGFkne4wmxz8PlLEteBvMMVZpuDz1+SuA7kHa4w20ii73vyPGe02WyYTqcMw8CeJEaSeDHbHFx+KSUiAkkMw0Ce56SUkIQkrjp5h2vANpIYhoEsyxgNw0CWZbwU2xxcXpKwjSRGtkkpkWUZI9tI4qqTd7jiUkrYZpRlGX3f89xzz3FyckLf99hmZJuRJPYigoPLyza2GfV9z9HREXmec3Z2xmw2IyKQhCSuMnmHKyylREQwSimRUuK//bf/xn/4D/+B09NT/jIpJQ4utyzLkETf90wmE87OznjNa17DY489RkQgCUns2UYSV4m8wzUwDAOSiAj+43/8j7zvfe/jvvvu4/z8nM9kG9uMsizj4PKyTUqJlBJZlnF8fMzNmze5//77+emf/mlSSkhCEnu2kcRVIu9wxfV9T5ZlSMI2P/dzP0dd19x1110Mw8BIEpL4TCklDi6viCAikMT5+TkjSbzmNa/hqaeeIiKQhCSuMnmHK842kkgpkVLi53/+53n/+9/PyckJeZ5jm88kCUnY5uDyyrKMvu8Z5XlOSonz83O+6Iu+iPe9731EBJK46uQdrrCUEhFBSomUEnme85/+03/ix37sx7jnnntIKZFSYhgGhmFgGAb2JJFS4uDy2m633HXXXYyyLCPLMm7dusX999/PBz7wAWwjiatO3uEasI1tIoKmaajrmqIokETXddx///183/d9H2dnZ0wmEyaTCdvtloPLwTaS2LONbabTKR/5yEf4iZ/4Ce69915SSrRtS1mWLJdL9iRxlck7XAO2sU1E0DQNdV1TFAXn5+dst1sefPBB3v3udzOyzcHlIInPxjajX//1X+fxxx/nxo0bDMPA2dkZr33ta3n66aeRxEgSV5m8wzVgG9tEBE3TUNc1RVEgidu3bzOfz3niiScYrddrJDGZTLDNwcVJKTGyjST2bDOaTCb8yq/8Cv/23/5b7rrrLiRxfn7Oa1/7Wp5++mn2JHGVyTtcA7axTUTQNA11XVMUBSkl1us1DzzwAI8//jgRwYvZ5uDiSOKlpJRYrVY8/vjj3HPPPdjm1q1bvOY1r+HHf/zH2ZPEVSbvcA3YxjYRQdM01HVNURQMw0Df98znc971rnchib2+75lMJhxcHNvYZk8SI9vYJssyfuVXfoWqqrj77rsZhoFbt25RliXvf//7sc1IEleZvMM1YBvbRARN01DXNUVRkFKi6zoeeOABFosFWZbxYrY5uDiS+GxsI4kPfvCDPPbYY9x9991EBG3bUpYldV1jm5EkrjJ5h2vANraJCJqmoa5riqLANl3XMZ/Pefe7380opYRtRlmWcXDxbCOJPdvYJiJYrVY89thjzGYzIoK2bXn1q1/N008/TUQwksRVJu9wDdjGNhFB0zTUdU1RFKSUWK/XPPDAAzz22GNkWYYkDi4/29jmV3/1V3n88ce58847sc3Z2RllWVLXNXuSuMrkHa4B29gmImiahrqumc1mpJTouo75fM5isUAStpGEbSRxmdlGEi+WUsI2WZbxYiklIoJRSomIYJRSwjZZlvFiKSUigsvCNpLYSykREaxWK6qqoigKRm3bUpYly+WSPUlcZfIO14BtbBMRNE1DXdfMZjNSSnRdx3w+Z7FYIAnbSMI2krjMbDOSxGcahoEsy7CNJF7MNpJ4sZQSo4jgMrKNJPZSSkQEq9WKqqooioJR27aUZclyuWRPEleZvMM1YBvbRARN01DXNbPZjJQSXdcxn89ZLBZIwjaSsI0kLrvNZsN0OmW0Xq+ZTqdIIqVERJBSIiJIKZFSIs9zRraxzcg2EYEkRtvtlslkwmViG0nspZSICFarFVVVURQFo7ZtKcuS5XLJniSuMnmHa8A2tokImqahrmtmsxkpJbquYz6fs1gskIRtJGEbSVxmKSUiAtuMJGGb7XbLdDolpYRtsixjlFJCEiNJfDbDMJBlGZeJbSSxl1IiIlitVlRVRVEUjNq2pSxLlssle5K4yuQdrgHb2CYiaJqGuq6ZzWaklOi6jvl8zmKxQBK2kYRtJHEVDMPAKCKwTUoJSWRZxna7JSKQxN4wDEQEKSUigizLGG23WyaTCaOUEhHBZWEbSeyllIgIVqsVVVVRFAWjtm0py5LlcsmeJK4yeYdrwDa2iQiapqGua2azGSkluq5jPp+zWCyQhG0kYRtJXDa2+UySGKWUiAhSSrzwwgvcvHmTZ599lrOzM05PT3nFK17BPffcQ0QwmUywzTAMjPI8Z5RSIiIYhoEsy7gsbCOJvZQSEcFqtaKqKoqiYNS2LWVZslwu2ZPEVSbvcA3YxjYRQdM01HXNbDYjpUTXdczncxaLBZKwjSRsI4nLxDYvZpuIYLvdsvcHf/AHfPCDH+QP//AP+dM//VOyLEMSoxs3bvCqV72Kr/3ar+Uf/sN/yJ133kmWZWy3W/I8RxKbzYbpdMplYxtJ7KWUiAhWqxVVVVEUBaO2bSnLkuVyyZ4krjJ5h2vANraJCJqmoa5rZrMZKSW6rmM+n7NYLJCEbSRhG0lcJrZ5MUmcn59zfHzMM888w7//9/+e3/zN3yTLMiKCo6MjRiklRhHBrVu3SCnxyle+ku/8zu/kH/yDf8BkMmG73TKZTEgpEREMw0CWZVwWtpHEXkqJiGC1WlFVFUVRMGrblrIsWS6X7EniKpN3uAZsY5uIoGka6rpmNpuRUqLrOubzOYvFAknYRhK2kcRlklLCNlmWMdpsNuR5zu///u/zrne9i+eff57T01NOTk7YbDYMw4Ak/iK2OTs741u/9Vt505vexHa7ZTKZkFIipUSe51wmtpHEXkqJiGC1WlFVFUVRMGrblrIsWS6X7EniKpN3uAZsY5uIoGka6rpmNpuRUqLrOubzOYvFAknYRhK2kcRFso0kbDOyTURgm77vmUwmfOQjH+Ghhx5iGAaKouDs7IzNZkOe50QEL0USm82Gb/zGb+TNb34zm82GyWTCSBKXiW0ksZdSIiJYrVZUVUVRFIzatqUsS5bLJXuSuMrkHa4B29gmImiahrqumc1mpJTouo75fM5isUAStpGEbSRxGQzDQJZl2EYStkkp8eyzz/LGN76R27dvI4mRJLIsYxgG/ioigk996lN8//d/P//sn/0zzs/POT4+JqVERHBZ2EYSeyklIoLVakVVVRRFwahtW8qyZLlcsieJq0ze4RqwjW0igqZpqOua2WxGSomu65jP5ywWCyRhG0nYRhKXwTAMZFmGbVJKZFnG6IknnuCXf/mXOT09ZbPZcHx8zHq95ujoiPV6TZZlvBTbTKdThmEgIvixH/sxXvGKV5BSIiK4TGwjib2UEhHBarWiqiqKomDUti1lWbJcLtmTxFUm73AN2MY2EUHTNNR1zWw2I6VE13XM53MWiwWSsI0kbCOJyyClREQwDAPDMDCdTvnYxz7GD/zAD/CpT32Kk5MTUkoMw8B0OsU2fd8TEfxlhmHg9PSUT3ziE7z+9a/nX/7Lf8nZ2Rl33HEHl4ltJLGXUiIiWK1WVFVFURSM2ralLEuWyyV7krjK5B2uAdvYJiJomoa6rpnNZqSU6LqO+XzOYrFAEraRhG0kcZn0fY8kJPGf//N/5v3vfz9FUSCJvu+JCM7Ozjg9PWXU9z0vxTbHx8fcvn2biOD+++9nsVhwfHxMlmVkWcZlYRtJ7KWUiAhWqxVVVVEUBaO2bSnLkuVyyZ4krjJ5h2vANraJCJqmoa5rZrMZKSW6rmM+n7NYLJCEbSRhG0lcJiklbDN6+OGH+Z3f+R3uvPNOttstWZbR9z3T6ZTNZoMkIoKXEhF0XcfJyQmj559/np/+6Z/mb/2tv0VKiYjgsrCNJPZSSkQEq9WKqqooioJR27aUZclyuWRPEleZvMM1YBvbRARN01DXNbPZjJQSXdcxn89ZLBZIwjaSsI0kLtowDGRZxt52uyXLMr7ne76Hj3/840wmEyKC7XZLRJDnOV3XcXJyQt/37NlmJIk922RZxna75fT0lE984hP88A//MH/v7/09IgJJXBa2kcReSomIYLVaUVUVRVEwatuWsixZLpfsSeIqk3e4Bmxjm4igaRrqumY2m5FSous65vM5i8UCSdhGEraRxEWyjSRezDY3b97kjW98I88//zyTyYS+78nznL7vyfOclBK2kcRLsU1E0Pc9k8mEF154gbe+9a180zd9ExHBZWIbSeyllIgIVqsVVVVRFAWjtm0py5LlcsmeJK4yeYdrwDa2iQiapqGua2azGSkluq5jPp+zWCyQhG0kYRtJXDTbSMI2tokIbt++zetf/3pu3bqFJGyzNwwDR0dHDMOAbV6KJCKCYRg4OjriYx/7GD/0Qz/EP/kn/4S+78nznMvCNpLYSykREaxWK6qqoigKRm3bUpYly+WSPUlcZfIO14BtbBMRNE1DXdfMZjNSSnRdx3w+Z7FYIAnbSMI2krhowzCQZRmjvu/J85zNZsMb3vAG/viP/5jpdEpKiTzPsc0wDEwmE7bbLRHBS7FNlmUMw0BEcPv2bR555BG+7uu+js1mw3Q65bKwjST2UkpEBKvViqqqKIqCUdu2lGXJcrlkTxJXmbzDNWAb20QETdNQ1zWz2YyUEl3XMZ/PWSwWSMI2krCNJC5aSomIYJRSYmSbd73rXfzar/0aL3vZyzg/P+fo6Ij1es3R0RGbzYZRRPBSbDOShG2Oj4956qmneOUrX8koIrgsbCOJvZQSEcFqtaKqKoqiYNS2LWVZslwu2ZPEVSbvcA3YxjYRQdM01HXNbDYjpUTXdczncxaLBZKwjSRsI4mLZBtJjGwjiWEYyLKMX/zFX+Q973kPL3vZy9hut4z6vufo6Ij1es10OmUYBl5KRDAMA5PJhLOzM/723/7bPPXUU4zyPOcysY0k9lJKRASr1YqqqiiKglHbtpRlyXK5ZE8SV5m8wzVgG9tEBE3TUNc1s9mMlBJd1zGfz1ksFkjCNpKwjSQuA9vYJiJIKRERfPzjH+dNb3oTn/rUpzg5OaHveyaTCX3fk1JiOp0yDAMvRRK2iQg+8YlP8La3vY1v/dZvZbvdMplMuExsI4m9lBIRwWq1oqoqiqJg1LYtZVmyXC7Zk8RVJu9wDdjGNhFB0zTUdc1sNiOlRNd1zOdzFosFkrCNJGwjicsgpUREMAwDWZZhm9FP/dRP8fM///OklMjznCzLWK/XRAQjSbwU20QEm82GV73qVbz3ve/lxo0bDMNAlmVI4rKwjST2UkpEBKvViqqqKIqCUdu2lGXJcrlkTxJXmbzDNWAb20QETdNQ1zWz2YyUEl3XMZ/PWSwWSMI2krCNJC5a3/dkWYYkttstk8mEzWbDdDrl/PycN77xjTzzzDOcnp6y2WyICEa2+ctEBLY5Pz/nHe94B1/3dV/HZrNhOp1iG0lcFraRxF5KiYhgtVpRVRVFUTBq25ayLFkul+xJ4iqTd7gGbGObiKBpGuq6ZjabkVKi6zrm8zmLxQJJ2EYStpHEZWKbkW1sk2UZzzzzDG9/+9v5kz/5E17+8pfzwgsvcHJywnq9RhJZlpFSYhgGIoKIYCQJ2zz33HO85S1v4Vu+5Vvo+57pdErf9+R5zmViG0nspZSICFarFVVVURQFo7ZtKcuS5XLJniSuMnmHa8A2tokImqahrmtmsxkpJbquYz6fs1gskIRtJGEbSVwmthnZZjQMA6OPfexjPPXUU3zkIx+hKAomkwm2kcQwDKSUyPOcPM/ZbDas12tsM51O+e7v/m6+5Vu+hYhgs9kwnU65jGwjib2UEhHBarWiqiqKomDUti1lWbJcLtmTxFUm73AN2MY2EUHTNNR1zWw2I6VE13XM53MWiwWSsI0kbCOJy8g2I9uMIoLnnnuOn/u5n+NDH/oQzz33HJKICLIsI89zbNO2LZvNhi/4gi/g/vvv57u+67v48i//clJKrNdrTk5OuKxsI4m9lBIRwWq1oqoqiqJg1LYtZVmyXC7Zk8RVJu9wDdjGNhFB0zTUdc1sNiOlRNd1zOdzFosFkrCNJGwjictuGAbOz885PT1l9Mwzz/Dbv/3b/N7v/R5/8id/Qtu2bDYbTk5OuPfee3nta1/L13zN1/Dggw8yGoaBUZZljGyTUkISEcFlYRtJ7KWUiAhWqxVVVVEUBaO2bSnLkuVyyZ4krjJ5h2vANraJCJqmoa5rZrMZKSW6rmM+n7NYLJCEbSRhG0lcdraRxGazYTKZMAwDEUFEcPPmTbquo+97bty4wV133UWe54wkMer7nizL2Gw2ZFlGnudcRraRxF5KiYhgtVpRVRVFUTBq25ayLFkul+xJ4iqTd7gGbGObiKBpGuq6ZjabkVKi6zrm8zmLxQJJ2EYStpHEZZdSIqVEnueM+r4nz3PW6zVHR0fs2cY2wzBgmzzPSSmR5zkv1vc9eZ5z2dhGEnspJSKC1WpFVVUURcGobVvKsmS5XLIniatM3uEasI1tIoKmaajrmtlsRkqJruuYz+csFgskYRtJ2EYSV0nXdZycnDAMA1mW0XUd0+mULMvYs81IEqNhGLBNRDAMA1mWERFst1smkwmXhW0ksZdSIiJYrVZUVUVRFIzatqUsS5bLJXuSuMrkHa4B29gmImiahrqumc1mpJTouo75fM5isUAStpGEbSRxWdhmTxIj20jCNtvtlul0ymeTUkISe5KwjSQ+03a7ZTKZcJnYRhJ7KSUigtVqRVVVFEXBqG1byrJkuVyyJ4mrTN7hGrCNbSKCpmmo65rZbEZKia7rmM/nLBYLJGEbSdhGEv9/GIaBLMvYs40k/iK22ZPEwafZRhJ7KSUigtVqRVVVFEXBqG1byrJkuVyyJ4mrTN7hGrCNbSKCpmmo65rZbEZKia7rmM/nLBYLJGEbSdhGEn8dfd+TZRmSGA3DwCjLMl6KbUaSOPg020hiL6VERLBaraiqiqIoGLVtS1mWLJdL9iRxlck7XAO2sU1E0DQNdV0zm81IKdF1HfP5nMVigSRsIwnbSOKva71ec3R0xHa7ZTKZsJdSIiL4bGwjiYNPs40k9lJKRASr1YqqqiiKglHbtpRlyXK5ZE8SV5m8wzVgG9tEBE3TUNc1s9mMlBJd1zGfz1ksFkjCNpKwjST+Ovq+J89zUkpEBMMwEBEMw4Aksizj4K/GNpLYSykREaxWK6qqoigKRm3bUpYly+WSPUlcZfIO14BtbBMRNE1DXdfMZjNSSnRdx3w+Z7FYIAnbSMI2kvjr2G63TCYTnnnmGYZh4NWvfjXb7ZbJZMLB/x3bSGIvpUREsFqtqKqKoigYtW1LWZYsl0v2JHGVyTtcA7axTUTQNA11XTObzUgp0XUd8/mcxWKBJGwjCdtI4v+WbfYkcfv2bd72trfR9z3vfe97ueOOO7DNKCKQxMFfzjaS2EspERGsViuqqqIoCkZt21KWJcvlkj1JXGXyDteAbWwTETRNQ13XzGYzUkp0Xcd8PmexWCAJ20jCNpL4q7LNX+Td7343H/rQh5hMJvz9v//3efjhhxmGAUlIYiSJg5dmG0nspZSICFarFVVVURQFo7ZtKcuS5XLJniSuMnmHa8A2tokImqahrmtmsxkpJbquYz6fs1gskIRtJGEbSfxV2WbPNqOf+Zmf4QMf+AD33HMPkrh58ybf9V3fxXd+53ey3W6ZTCbsSeLgs7ONJPZSSkQEq9WKqqooioJR27aUZclyuWRPEleZvMM1YBvbRARN01DXNbPZjJQSXdcxn89ZLBZIwjaSsI0k/jLDMGCbPM8Z3b59mxs3brBarXjiiSe466672Gw2bDYb7rjjDp5//nne/va384/+0T9iGAYkERGMNpsN0+mUkW0kcfBptpHEXkqJiGC1WlFVFUVRMGrblrIsWS6X7EniKpN3uAZsY5uIoGka6rpmNpuRUqLrOubzOYvFAknYRhK2kcRLSSkREYxSSpydnXHjxg3+x//4Hzz00EOcnZ1xenpK3/dMp1M2mw0RQUqJxx57jC/7si9js9kwnU4ZhoEsy+j7njzPSSkRERx8mm0ksZdSIiJYrVZUVUVRFIzatqUsS5bLJXuSuMrkHa4B29gmImiahrqumc1mpJTouo75fM5isUAStpGEbSTxUmxjm5QSEUFE8PGPf5yHHnqIZ555hrvuuou+77FNlmWMhmHANl/wBV9AVVW88pWvZL1ec3R0xHq9ZjKZMIoIDv6cbSSxl1IiIlitVlRVRVEUjNq2pSxLlssle5K4yuQdrgHb2CYiaJqGuq6ZzWaklOi6jvl8zmKxQBK2kYRtJPFXsd1ukYQk3vKWt/Df//t/5+6778Y22+2WiCAiSCkxsk3btvzdv/t3eec738l0OiUiyPOc0Xa7ZTKZcPDnbCOJvZQSEcFqtaKqKoqiYNS2LWVZslwu2ZPEVSbvcA3YxjYRQdM01HXNbDYjpUTXdczncxaLBZKwjSRsI4mXYhtJnJ2dcccdd/D444/zoQ99iHvvvZdbt24REUQEkpDEdrtlOp1y+/ZtiqLgz/7sz/jmb/5m3vrWt2IbSWRZhm1sExEcfJptJLGXUiIiWK1WVFVFURSM2ralLEuWyyV7krjK5B2uAdvYJiJomoa6rpnNZqSU6LqO+XzOYrFAEraRhG0k8Rexzcg22+2Wo6MjfuZnfoaf+qmf4uTkhMlkwmazYZRlGSkl+r5nMpnQ9z133HEHZ2dnTCYTnn/+ed7whjfwHd/xHazXayQxnU7p+548zzn4NNtIYi+lRESwWq2oqoqiKBi1bUtZliyXS/YkcZXJO1wDtrFNRNA0DXVdM5vNSCnRdR3z+ZzFYoEkbCMJ20jiM9nGNqO+78myjN/4jd/g8ccfJ8syptMp6/WaLMsYZVmGbUaS6PuezWbDnXfeSdd1HB8fc/PmTd75znfy9V//9azXa46Ojjj4/7KNJPZSSkQEq9WKqqooioJR27aUZclyuWRPEleZvMM1YBvbRARN01DXNbPZjJQSXdcxn89ZLBZIwjaSsI0kPpNtbGObLMv4n//zf/LWt76V0fHxMdvtlpQSeZ6TUiKlhG0kEREMw8DR0RHn5+dMJhNs0/c9WZbxxBNP8Hf+zt/h/Pyc4+NjDv6cbSSxl1IiIlitVlRVRVEUjNq2pSxLlssle5K4yuQdrgHb2CYiaJqGuq6ZzWaklOi6jvl8zmKxQBK2kYRtJNH3PXme82K2Gd28eZM3v/nNfPKTn+To6Ijtdott8jyn73sigpdiG9scHx9z69Yt7rvvPv7dv/t33HPPPez1fU9E0Pc90+mUUUqJiODziW0ksZdSIiJYrVZUVUVRFIzatqUsS5bLJXuSuMrkHa4B29gmImiahrqumc1mpJTouo75fM5isUAStpGEbVJKZFnG3jAMRATb7ZbR2972Nj7ykY+Q5zlHR0dIou97IoKIIKXES5FElmV0Xcfp6Smf/OQneeCBB3jyySfZbrccHx/T9z15njMMA1mWkVIiIkgpERF8vrCNJPZSSkQEq9WKqqooioJR27aUZclyuWRPEleZvMM1YBvbRARN01DXNbPZjJQSXdcxn89ZLBZIwjaSsI0kRpvNhul0im32fuRHfoRf+IVf4MaNG0QEthkNw0CWZaSUkMRfZhgGJDGZTLBN27Z8wzd8A29/+9vZbDZEBLbJ8xxJjDabDdPplM8ntpHEXkqJiGC1WlFVFUVRMGrblrIsWS6X7EniKpN3uAZsY5uIoGka6rpmNpuRUqLrOubzOYvFAknYRhK2kUTf9+R5zjAM2CbPc372Z3+Wn/iJn+DOO+8kz3POz8+JCLbbLZPJhMlkwnq9JiJ4KSklsixDEsMwkOc5o5s3b/K93/u9fMd3fAe22Ww2HB0dMdput0wmE1JKRASfL2wjib2UEhHBarWiqiqKomDUti1lWbJcLtmTxFUm73AN2MY2EUHTNNR1zWw2I6VE13XM53MWiwWSsI0kbJNSIssyttstfd9zcnLChz/8YR599FHuuOMObNP3PaPj42POz8+ZTCbYJqWEJF5KRCCJzWZDnudsNhsmkwlZltG2LW9/+9v5+q//emxzfn7OyckJo81mw3Q65fOJbSSxl1IiIlitVlRVRVEUjNq2pSxLlssle5K4yuQdrgHb2CYiaJqGuq6ZzWaklOi6jvl8zmKxQBK2kYRtJGGbvu+ZTCb80R/9Ef/6X/9rJJFlGcMwIImRJFJK5HlO27YcHx9jm5eSZRmbzYaUEsfHx4xSSkQE6/Wa4+NjHn30UV73utcxDAOSGEUEn29sI4m9lBIRwWq1oqoqiqJg1LYtZVmyXC7Zk8RVJu9wDdjGNhFB0zTUdc1sNiOlRNd1zOdzFosFkrCNJGwzDANZlrHdbtlsNrzxjW/kj/7oj5jNZqSUsE2WZWy3W4ZhIM9zsixju91ydPG8dloAABlASURBVHTEMAy8lJQSeZ6TUiIi6PueLMsYhoEsyzg/P+dv/s2/yZNPPsldd93FZrPh+PiY0TAMZFnG5wvbSGIvpUREsFqtqKqKoigYtW1LWZYsl0v2JHGVyTtcA7axTUTQNA11XTObzUgp0XUd8/mcxWKBJGwjCdvspZT4wR/8QX7v936Pl7/85dy+fZs8zxmGgSzLGEUEfd+TUiLPc2zzVzWZTLh16xY3btzANufn55ycnGCbF154gQceeIDHH3+cLMuwTZZlSOLziW0ksZdSIiJYrVZUVUVRFIzatqUsS5bLJXuSuMrkHa4B29gmImiahrquKYqCYRjouo6v/MqvpKoqhmEgyzL2ttstk8mEJ598kl/4hV/g3nvv5ezsjFGWZaSU+FzKsgxJPPfcc/zTf/pP+YEf+AFGktgbhoEsy3ixvu/J85zLLqWEJCTxYn3fk+c5KSUiglHf9+R5TkqJiCClRESwWq2oqoqiKBi1bUtZliyXS/YkcZXJO1wDtrFNRNA0DXVdUxQFeZ7z7LPP8uCDD/Ke97wH22w2GyaTCZvNhuPjY372Z3+WD3zgA8xmM9brNRFB3/eMIoLPpZQSkjg+PuaTn/wkb3rTm/jn//yfs16vOTo6wjaSsE1KiSzLSCkREaSUiAguu5QSEYFthmEgz3NGfd+T5zmjYRjIsoy9YRiICCSxWq2oqoqiKBi1bUtZliyXS/YkcZXJO1wDtrFNRNA0DXVdUxQFKSXOz8/5qq/6Kt75zneS5zmj8/Nzjo+P+fCHP8w73vEOTk9PkcRoOp1ydnbG8fExKSU+l7Is4+zsjOPjYzabDX3f8+ijj/LVX/3VDMNAlmVst1uyLCMi2G63TCYTRraRxGVmG0l0XcfJyQm22W632CbLMkaSsE2WZUjCNpIYhoEsy1itVlRVRVEUjNq2pSxLlssle5K4yuQdrgHb2CYiaJqGuq4pioJhGFiv13zFV3wFVVVhm4hg9NGPfpSHH36YW7dukec5EYFtuq7j7rvv5vbt22RZxueSbY6Ojrh16xanp6dsNhuOj49ZLBa89rWvpW1bTk9P6fseSWRZxl5KiYjgMuv7njzPGQ3DgG2yLEMSH/3oR3nNa15D3/dMJhNGfd8TEUQEwzCQZRmr1YqqqiiKglHbtpRlyXK5ZE8SV5m8wzVgG9tEBE3TUNc1RVGQUmKz2fC6172O97znPYzOz88ZhoE3v/nNfPSjH+Xee++l6zqGYSAimEwmrNdrIgJJfC6llJhMJmy3WyKCiKDrOr7oi76IRx55hPvuu4+2bTk9PWW9XnN0dMQwDGRZxlWx2WyQxGQy4fz8nKOjIz74wQ/yxBNP8L3f+71827d9G9vtFttMp1NsI4ntdstkMmG1WlFVFUVRMGrblrIsWS6X7EniKpN3uAZsY5uIoGka6rqmKAps07YtDz74IIvFgs1mQ57n/Jt/82/48Ic/zL333st6vSYi2Gw2nJ6esl6vybKMlBKS+FySREoJ2xwfH9N1HZIYfdmXfRmPPPIIksiyDEmklBhJQhKXnW2GYSDPc4ZhIMsyfvVXf5XFYsF0OkUSb3jDG/jmb/5m1us1R0dH7A3DQJZlrFYrqqqiKApGbdtSliXL5ZI9SVxl8g7XgG1sExE0TUNd1xRFgSRu377Nl37pl/IjP/IjjH70R3+U//pf/ytFUTBar9dkWcZkMmG9XhMRZFmGbWzzuRYRpJTIsoy+75lMJmy3W1544QW+7du+jX/1r/4V5+fn5HlOnufsrddrjo6OuOy22y1933NycsLv/u7v8uijj3J2dsYdd9yBJG7dusWTTz7J6173OoZh4OjoiM1mw3Q6ZbRaraiqiqIoGLVtS1mWLJdL9iRxlck7XAO2sU1E0DQNdV1TFAW22Ww2fOmXfilPPPEE/+W//BeefvppTk5OiAiGYUASEUFKiWEYODk54fbt2xwdHWGbzyXb5HlO3/eklJhOp2w2G/I8JyK4desWr3/96/n2b/92NpsNEUGe51wVm82G6XRK3/d89KMf5a1vfSsjSUii73um0ynDMPDII4/wwAMP0HUdJycn9H1PnuesViuqqqIoCkZt21KWJcvlkj1JXGXyDteAbWwTETRNQ13XFEVBRHDz5k2+4Ru+gX/8j/8x73jHO4gIIoKIwDaX3e3bt3nPe97DV3zFV7Berzk+PmYYBrIs47OxjW0igs8l20hilFIiIhj1fU+e52y3WyKC//2//zcPPfQQzz77LDdu3OD8/JzJZMIwDJycnPDCCy8wm8147LHHKMuSvu/JsgxJ/NIv/RLvfe97ufvuu1mv1wzDwCtf+Up+8id/EtuMJHGVyTtcA7axTUTQNA11XVMUBbbZbDbcd9992OZP//RPybKM6XTKKKXEZZdlGdPplHe961188Rd/MW3bcnp6St/3RAQRwSilxCgi+H8ppUREMLJN3/dMJhM2mw3T6ZQ/+7M/4y1veQuf+MQnOD4+xjaSsE1EsN1uueuuu3j22We57777ePzxx/kbf+NvkFJiMpnwy7/8yzz55JNkWcZ0OuX27dt8yZd8Ce973/vYk8RVJu9wDdjGNhFB0zTUdU1RFKSUSCkxnU65desWd955J6O+77GNJC6ziGC9XpNS4v777+epp57i5OSELMsYhoGIQBIj29gmIvh/aRgGsixju90ymUwYrddrjo6OePbZZ3n44Yf5X//rf3Hjxg2GYWC9XnN8fMwwDNhmOp2y3W5JKXF+fs4rXvEKnn76ae688042mw2/9Vu/xUMPPcQXfuEXMgwDXdfx6le/mve///3YZiSJq0ze4RqwjW0igqZpqOuaoiiQxGazYTKZkOc5m82GUd/3TCYTbHOZpZTI85wsy7h16xYPPvggVVWx2WzIsoyIQBJ/EdtI4v8F20his9kwnU4Z3bx5k0cffZTf/d3f5eUvfzmbzYaIQBKbzYajoyP6viciGIaB6XSKbdbrNa961at45JFHuO+++/j1X/91fuiHfoiXvexlRAQvvPACZVmyXC6RxEgSV5m8wzVgG9tEBE3TUNc1RVFgG9uMttstk8mElBKSyLKMlBKXWZZlbDYbsiwjyzI+9alP8S/+xb/g+77v+9hut+R5TkoJSUQEe7aRxOfaer3m6OgI2wzDQJZlDMOAbR5++GF++7d/m5e97GWs12uOjo7ouo6joyOOj4954YUXODk54fz8nOl0yjAMSGI6nXLz5k3m8zlPPvkkv/iLv8iP/uiPcvfdd3N2dsZms+FVr3oVP/mTP4ltRpK4yuQdrgHb2CYiaJqGuq7/T3vwD3LJXfZ//P25Zuacc++9m52NMY1oMQSiIhhEsFAsTCG2dgEjWNpvJOCqKAETsmpIMF+18A8oy4g2WtnIVhaxFhHEThDD4p/73p3zZ77X9cwUB+THr5An7nM8J9/Xi+vXrzOOIzMzQxJVVeHuuDvujplxDHLONE2Du7Ner/n85z/Ppz/9afYiAknMIoKZJP4vjOOImTGOI4vFgtmXv/xl7t69y2OPPcYs50zOmbqucXe22y3L5ZLNZsPVq1e5vLykqipmy+WS7XbLxcUFTz/9NB/96Ed54YUXWCwWnJ2dMQwDTz75JN/4xjeo65qZJI6ZYsIJiAgiAjOj73tSSly/fp3ZbrdjduXKFS4vLzEz6rrG3ZHEf7Pdbsf5+Tm73Y5xHFmtVmy3WyRx69YtnnrqKRaLBZKYRQQzSUQEknjYcs5IwszIOfPyyy/zq1/9ikcffZQHDx5QVRWSMDOGYeCRRx7hwYMHNE1DRPDgwQOuXbuGmbFer5ktFgtyzkQEZ2dn7HY73J2qqrh37x7ve9/7+M53vkNEMJPEMVNMOAERQURgZvR9T0qJ69ev4+6YGbPNZsNiscDdaZqG3W6HJP6bSSLnTERQ1zXujpkxjiNt2/LNb36Ttm1ZrVbMcs5UVcXM3TEzHqacM1VVkXOmqipSSvR9z40bN9jtdlRVxTiOSMLMiAhm7k5d10QEksg5s1fXNdvtlqqqmEUEM3dnuVxyeXnJE088QUqJiGAmiWOmmHACIoKIwMzo+56UEm3bknPmmEliFhHMIoJ/9Z73vIfbt2+zXC6RxMzMmLk7ZsZ/Qs6ZqqrIOVNVFe7OzMwYhoGzszN+8IMf8KMf/Yjz83NmTdOQc+atkoS7Y2ZIYhgGuq4jpcSeJI6ZYsIJiAgiAjOj73tSSrRtS86ZU3Z5ecnTTz/NrVu3cHdmOWeapuE/wd0xM7bbLYvFgohAEnvr9ZrVasWdO3f44Q9/yNnZGTlnIoKIwMx4qyTh7pgZkhiGga7rSCmxJ4ljpphwAiKCiMDM6PuelBJt25Jz5phFBDNJ7EliL+fMdrvlmWee4dlnn6VpGmY5Z2ZVVfFWjONIXdfMNpsNy+WSWUSw2WxYrVb88pe/5JVXXuHatWtsNhuWyyWSGMeR/wRJuDtmhiSGYaDrOlJK7EnimCkmnICIICIwM/q+J6VE27bknDlmEcFMEnuS2KvrmnEcubi44Atf+AKf+tSnGIaB1WqFJP4T1us1q9WKmbtjZmy3WxaLBXfv3uWll15isViw3W5ZLpfknBnHkaZpiAjeKkm4O2aGJIZhoOs6UkrsSeKYKSacgIggIjAz+r4npUTbtuScOWURQc6ZpmmoqoovfvGLfPjDH2a9XrNYLJCEJP633B0zYxxH6romIthsNqxWK9544w2+/vWvM44jkpBEzpmIYFZVFRHBWyUJd8fMkMQwDHRdR0qJPUkcM8WEExARRARmRt/3pJRo25acM6ckIvhXZoaZMY4j4zjSti2vvvoqjz/+OJvNhrquMTMksRcRSOLf5e6YGbP1es1qteJ3v/sdt27d4uLigvPzcyICM2O329E0DTlnqqoi58xbJQl3x8yQxDAMdF1HSok9SRwzxYQTEBFEBGZG3/eklGjblpwzpyoicHdWqxXr9ZqmaViv1zzxxBPcvn2b5XKJu2NmSEISEcFMEv+OiCAimLk7Zsaf//xnbt68yb179zg/P6dpGv75z39SVRVN0zCTxGazoWka3ipJuDtmhiSGYaDrOlJK7EnimCkmnICIICIwM/q+J6VE27bknDl1kogIzIyI4OLigo9//ON89atfZbfbYWaYGZKICGaS+HfknKmqipwzZsZf/vIXbt68yZtvvsn5+TnjOLLb7Vgul0jC3dntdjRNwywieKsk4e6YGZIYhoGu60gpsSeJY6aYcAIigojAzOj7npQSbduSc+aURQRmRkSQc6auaxaLBffu3eMzn/kMn/vc53B3zIyIoKoqcs6YGZKY5Zypqgp3x8yYRQQRwSwiMDP+/ve/8/zzz/PHP/6R8/NzZhHBwyYJd8fMkMQwDHRdR0qJPUkcM8WEExARRARmRt/3pJRo25acM6fO3WmaBjPj8vKS5XJJRJBz5rnnnuMTn/gEm82GiGC1WvH/M44jdV2z2+1omoacM1VVsdvtkMQwDDz33HP84Q9/4J3vfCf3799nuVyy2+142CTh7pgZkhiGga7rSCmxJ4ljpphwAiKCiMDM6PuelBJt25Jz5pSZGe5ORCAJd2f2yCOP8Ne//pXVasXLL7/M+9//fsZxpK5rIoL/lyQiAkmM40hd1wzDwHK5JCJ4/vnn+e1vf8uNGzfYbrfUdc1ut6OqKh42Sbg7ZoYkhmGg6zpSSuxJ4pgpJpyAiCAiMDP6vielRNu25Jw5ZRFBRFBVFbvdjitXrrBerzEz6rrm4uKCxx9/nNdee41HH32U9XrN2dkZs4hAErNxHKnrmllEMI4jTdPg7nzpS1/ijTfe4MaNG1xcXLBYLDAzNpsNVVXxsEnC3TEzJDEMA13XkVJiTxLHTDHhBEQEEYGZ0fc9KSXatiXnzCmrqophGDg7O2McRyKCuq7JOZNz5sqVK9y/f58nn3yS27dvY2bknFksFuzlnKmqilnOGUncv3+fa9eu8eKLL/LrX/+axWKBu1PXNTlnzAxJRAQPmyTcHTNDEsMw0HUdKSX2JHHMFBNOQEQQEZgZfd+TUqJtW3LOnLK6rhnHkYjAzBjHkaqqWCwWjOPIbrdjuVxyeXnJJz/5SW7evMlsvV6zWq3YbrcsFgvGcaSua2a73Y6maUgp8ZOf/IS2bWmahs1mQ9M0uDvujiQk8bBJwt0xMyQxDANd15FSYk8Sx0wx4QREBBGBmdH3PSkl2rYl58wpyzmzWCwYxxEzo65rHjx4wKxpGpqmYbPZYGYMw8Czzz7LZz/7WSSRc6aqKna7HWbGbLfbsVqtuHPnDikl3vGOd7Ber7ly5QqXl5esVisignEcWS6XjOPIwyYJd8fMkMQwDHRdR0qJPUkcM8WEExARRARmRt/3pJRo25acM6cuIqjrmmEYWC6XmBnujrsTESwWCzabDavVir/97W985Stf4WMf+xhVVRERmBk5Z3LOLBYL7ty5w/e+9z2uXr1KRFDXNdvtlrqucXfMjIjA3TEzHjZJuDtmhiSGYaDrOlJK7EnimCkmnICIICIwM/q+J6VE27bknHk7k8Q4jqxWKzabDbPlcsnXvvY1PvCBD+DumBmbzYblcskvfvELXn31VZqm4ezsjN1ux6FJwt0xMyQxDANd15FSYk8Sx0wx4QREBBGBmdH3PSkl2rYl58zbmbvTNA3b7Za6rqmqiouLC9797nfzrW99i0ceeYRhGDg/P+fu3bvcvn0bSZgZm82Gpmk4NEm4O2aGJIZhoOs6UkrsSeKYKSacgIggIjAz+r4npUTbtuSceTuLCCICSZgZZoYkLi8v+eAHP8iLL75IXdf85je/4aWXXmK329E0DRHBLCI4NEm4O2aGJIZhoOs6UkrsSeKYKSacgIggIjAz+r4npUTbtuSceTszMyKC2TiOmBmSaJqGN998k2eeeYaPfOQjvPDCC2y3WxaLBZvNhrqumUUEhyYJd8fMkMQwDHRdR0qJPUkcM8WEExARRARmRt/3pJRo25acM29nknB3JGFmrNdrmqYhIlgul6zXaxaLBeM4UlUVm82Gs7Mz1us1TdMQERyaJNwdM0MSwzDQdR0pJfYkccwUE05ARBARmBl935NSom1bcs68nbk7ZsbMzBjHkbOzM9brNXsRQVVVRASzqqrIOfPfQhLujpkhiWEY6LqOlBJ7kjhmigknICKICMyMvu9JKdG2LTln3s4igitXrnBxcUFEcPXqVS4vL5FE0zRIYubumBnuTs4ZSUhCEocmCXfHzJDEMAx0XUdKiT1JHDPFhBMQEUQEZkbf96SUaNuWnDNvZ2bGOI5EBKvVis1mQ13XRATuTkRgZuSckURVVUhiHEeapiHnzKFJwt0xMyQxDANd15FSYk8Sx0wx4QREBBGBmdH3PSkl2rYl50xx3CTh7pgZkhiGga7rSCmxJ4ljpphwAiKCiMDM6PuelBJt25JzpjhuknB3zAxJDMNA13WklNiTxDFTTDgBEUFEYGb0fU9KibZtyTlTHDdJuDtmhiSGYaDrOlJK7EnimCkmnICIICIwM/q+J6VE27bknCmOmyTcHTNDEsMw0HUdKSX2JHHMFBNOQEQQEZgZfd+TUqJtW3LOFMdNEu6OmSGJYRjouo6UEnuSOGaKCScgIogIzIy+70kp0bYtOWeK4yYJd8fMkMQwDHRdR0qJPUkcM8WEExARRARmRt/3pJRo25acM8Vxk4S7Y2ZIYhgGuq4jpcSeJI6ZYsIJiAgiAjOj73tSSrRtS86Z4rhJwt0xMyQxDANd15FSYk8Sx0wx4cjlnKmqilnOmZ///Oe8/vrrXL9+HXenOF6ScHfGceTs7IycMw8ePOC9730vr7zyCnVdcwoUE45YRCCJiMDdqaqKn/3sZ7z22mu0bUvOmeJ4uTuLxQJ3ZxxHJJFzpus6Xn/9dSICSRw7xYQTsNvtiAgWiwU//elP+fa3v81jjz1GzpniuLk7kjAzmqbhH//4B+9617v4/ve/T0SwJ4ljpZhwxNwdM2MvIvjxj3/Md7/7XRaLBRFBcbzMjHEcmdV1jbtz//59nnrqKVJKSEISM0kcK8WEIxcRuDuzqqr405/+xO9//3uuXr1KRFAcL0nMttstTdPQNA2bzYazszM+9KEP0TQNkphJ4lgpJhyxiEASs3Ecqeua4nSM40hd1+y5OzMzIyL4V5I4VooJJ8LdyTlTVRWzcRyp65rieJkZOWfcHUlIoqoqZrvdjrqukcSxU0w4cu5ORFBVFbOcM5IwM4rjFhG4O1VVMYsIJBERSOJUKCYURXFQiglFURyUYkJRFAelmFAUxUEpJhRFcVCKCUVRHJRiQlEUB6WYUBTFQSkmFEVxUIoJRVEclGJCURQHpZhQFMVBKSYURXFQiglFURyUYkJRFAelmFAUxUEpJhRFcVCKCUVRHJRiQlEUB6WYUBTFQSkmFEVxUIoJRVEclGJCURQHpZhQFMVBKSYURXFQiglFURyUYkJRFAelmFAUxUEpJhRFcVCKCUVRHJRiQlEUB6WYUBTFQSkmFEVxUIoJRVEclGJCURQHpZhQFMVBKSYURXFQiglFURyUYkJRFAelmFAUxUEpJhRFcVCKCUVRHJRiQlEUB6WYUBTFQSkmFEVxUIoJRVEclGJCURQHpZhQFMVBKSYURXFQiglFURzU/wCw5hJKwT6e6QAAAABJRU5ErkJggg==
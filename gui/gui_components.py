@@ -21,6 +21,7 @@ class GUiComponents():
         self.font.setPointSize(10) 
 
         self.trigger = None          # signal to be emitted when the value of any input box is changed
+        self.sliders = []            # sliders created by this class, used to detect an ongoing interaction
 
 
     def set_parent(self, parent_widget):
@@ -41,6 +42,15 @@ class GUiComponents():
         self.trigger = trigger
 
 
+    def is_interacting(self):
+        """
+        This method checks whether the user is currently dragging any of the sliders.
+        Returns:
+            bool: True if any slider is being dragged.
+        """
+        return any(slider.isSliderDown() for slider in self.sliders)
+
+
     def on_change(self, new_value=None, label=None):
         """
         This method is called when the value of any input box is changed.
@@ -263,8 +273,11 @@ class GUiComponents():
         slider.valueChanged[int].connect(lambda new_value: self.on_change(new_value if rescale == 1 else new_value/rescale, label))
         # call the on_change method to set the initial value of the label
         self.on_change(slider.value() if rescale == 1 else slider.value()/rescale, label)  
+        # emit the trigger once more when the slider is released, so that the final value is processed at full resolution
+        slider.sliderReleased.connect(self.on_change)
         
         parent.addWidget(slider)
+        self.sliders.append(slider)
 
         return [slider, label]
 
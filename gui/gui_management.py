@@ -1,13 +1,18 @@
 import cv2
 import numpy as np
 
-from PySide6.QtCore import Slot
-from PySide6.QtWidgets import QMessageBox, QFileDialog
+from PySide6.QtCore import Qt, Slot
+from PySide6.QtWidgets import QMessageBox, QFileDialog, QProgressDialog, QApplication
 
 import constants
 from constants import VISUALIZATION_TYPES
 from app.pipeline import Pipeline
-from app import toolboxes
+from app.image_array import ImageArray
+from app.profiler import Profiler
+from app import toolboxes, pipeline_file, processor_utils
+from app.toolbox_bases import select_image
+from app.video_processor import VideoFile, VideoProcessor
+from gui.render_worker import RenderWorker
 
 
 class GUiManagement():
@@ -18,43 +23,55 @@ class GUiManagement():
     def __init__(self):
         self.init_variables()
 
-    def init_ui_variables(self, toolbox_wrapper, footer_toolbox, in_im_canvas, out_im_canvas, 
-                          left_title, right_title, vis_mod_list, color_chan_list, zoom_btns):
+    def init_ui_variables(self, toolbox_wrapper, footer_toolbox, in_im_canvas, out_im_canvas, in_im_viewer, out_im_viewer,
+                          left_title, right_title, vis_mod_list, color_chan_list, zoom_btns, frame_slider, frame_label):
         """
         Gets the necessary widgets and layout from the 'main_window' and sets up the pipeline.
         Args:
             toolbox_wrapper (QVBoxLayout): The layout where the toolboxes are added.
             footer_toolbox (QWidget): The footer widget for the toolbox layout.
-            in_im_canvas (MatplotlibCanvas): The canvas for displaying the input image.
-            out_im_canvas (MatplotlibCanvas): The canvas for displaying the output image.
+            in_im_canvas (MatplotlibCanvas): The canvas for displaying the histogram of the input image.
+            out_im_canvas (MatplotlibCanvas): The canvas for displaying the histogram of the output image.
+            in_im_viewer (ImageViewer): The viewer for displaying the input image.
+            out_im_viewer (ImageViewer): The viewer for displaying the output image.
             left_title (QLabel): The label for the left title.
             right_title (QLabel): The label for the right title.
+            frame_slider (QSlider): The slider selecting the frame of an opened video.
+            frame_label (QLabel): The label showing the index of the selected frame.
         """
         self.toolbox_wrapper = toolbox_wrapper
         self.footer_toolbox = footer_toolbox
         self.in_im_canvas = in_im_canvas
         self.out_im_canvas = out_im_canvas
+        self.in_im_viewer = in_im_viewer
+        self.out_im_viewer = out_im_viewer
         self.left_title = left_title
         self.right_title = right_title
         self.vis_mod_list = vis_mod_list
         self.color_chan_list = color_chan_list
         self.zoom_btn_1, self.zoom_btn_2, self.zoom_btn_3 = zoom_btns
+        self.frame_slider = frame_slider
+        self.frame_label = frame_label
 
-        # Initialize the pipeline
-        self.pipeline = Pipeline()  
+        # Initialize the pipeline and the background worker that runs it
+        self.pipeline = Pipeline(profiler=Profiler(track_memory=constants.PROFILE_MEMORY))  
+        self.render_worker = RenderWorker(self.pipeline)
+        self.render_worker.rendered.connect(self.on_rendered)
+        self.render_worker.start()
 
         # Modes and their corresponding methods which are called when the mode is activated.
+        # They are given the indices of the canvases to redraw, 0 for the input and 1 for the output.
         self.view_handlers = {      
-            "Image": lambda: self.display_images(self.get_color_channels()),  
-            "Histogram": lambda: self.display_histogram(),
-            "Frequency": lambda: self.display_images(self.fourier_transform())
+            "Image": lambda indices: self.display_images(indices, self.get_color_channels(self.get_images(indices))),  
+            "Histogram": lambda indices: self.display_histogram(indices),
+            "Frequency": lambda indices: self.display_images(indices, self.fourier_transform(indices))
         }
 
         # Declares which widgets will be shown and which widgets will be hidden based on the selected mode.
         self.widgets_per_mode = {
-            "Image": [self.left_title, self.right_title],
-            "Histogram": [self.zoom_btn_1, self.zoom_btn_2, self.zoom_btn_3],
-            "Frequency": [self.left_title, self.right_title]
+            "Image": [self.left_title, self.right_title, self.in_im_viewer, self.out_im_viewer],
+            "Histogram": [self.zoom_btn_1, self.zoom_btn_2, self.zoom_btn_3, self.in_im_canvas, self.out_im_canvas],
+            "Frequency": [self.left_title, self.right_title, self.in_im_viewer, self.out_im_viewer]
         }
 
 
@@ -64,8 +81,16 @@ class GUiManagement():
         """
         self.input_BGRA = None                      # input image variable
         self.output_BGRA = None                     # output image variable
+        self.output_scale = 1.0                     # size of the output image relative to the full resolution output
+        self.request_scale = 1.0                    # scale of the most recent render request
+        self.proxy = None                           # (canvas size, proxy image, scale) of the downscaled input used while interacting
         self.view_mode = "Image"                    # name of the currently active view mode
         self.color_channel = "RGBA"            # name of the currently active color channel   
+        self.video = None                           # the opened video file, its frames are scrubbed through as the input image
+        self.spectra = [(None, {}), (None, {})]     # the (image, spectra by color channel) of the input and the output shown in the frequency view
+        self.histograms = [(None, {}), (None, {})]  # the (image, histograms by color channel) of the input and the output shown in the histogram view
+        self.image_versions = [0, 0]                # the versions of the input and the output images, increased every time they are replaced
+        self.drawn_views = [None, None]             # the (image version, view mode, color channel) shown on the input and the output canvases
 
     def open_new_image(self):
         """
@@ -75,17 +100,96 @@ class GUiManagement():
         image = self.select_image()              # select an image using the file dialog
 
         if image is not None:
-            self.init_variables()                # reinitialize all the variables
-            
-            self.input_BGRA = image.copy()       # make a copy of the input image for input
-            self.output_BGRA = image.copy()      # make a copy of the input image for output
+            self.close_video()
+            self.set_new_image(image)
+
+
+    def open_video(self):
+        """
+        This method is called when the 'Open Video' button is clicked.
+        It opens a file dialog to select a video file and displays its first frame, the frame slider scrubs through the other frames.
+        """
+        extensions = " ".join("*" + extension for extension in constants.VIDEO_EXTENSIONS)
+        filePath, _ = QFileDialog.getOpenFileName(None, "Select a video", "", f"Video Files ({extensions})")
+        if not filePath:
+            return
+
+        try:
+            video = VideoFile(filePath)
+            frame = video.read_frame(0)
+            if frame is None:
+                raise ValueError("The video has no frames")
+        except Exception as e:
+            QMessageBox.information(None, "Error", f"Failed to open the video.\n{str(e)}")
+            return
+
+        self.close_video()
+        self.set_new_image(frame)
+        self.video = video
+
+        self.frame_slider.blockSignals(True)
+        self.frame_slider.setRange(0, max(0, video.frame_count - 1))
+        self.frame_slider.setValue(0)
+        self.frame_slider.blockSignals(False)
+        self.frame_label.setText(f"Frame 1 / {video.frame_count}")
+        self.frame_slider.show()
+        self.frame_label.show()
+
+
+    def close_video(self):
+        """
+        Close the opened video and hide the frame slider.
+        """
+        if self.video is not None:
+            self.video.release()
+            self.video = None
+
+        self.frame_slider.hide()
+        self.frame_label.hide()
+
+
+    def set_new_image(self, image):
+        """
+        Set a new input image, update the toolboxes and process the image through the pipeline.
+        Args:
+            image (np.ndarray): The new input image in the BGRA format.
+        """
+        self.init_variables()                # reinitialize all the variables
+
+        # the input image is shared by the pipeline, the views and the toolboxes and never written, so no copies are made
+        # it keeps the data derived from it, like its HSV image, for both the pipeline and the views
+        image.flags.writeable = False
+        self.input_BGRA = ImageArray.wrap(image)
+        self.output_BGRA = image             # the output is the input until the pipeline produces one
+
+        # update toolbox components according to new image (max slider values, etc.)
+        for toolbox in self.pipeline.steps:  
+            toolbox.update_toolbox(self.input_BGRA)
 
-            # update toolbox components according to new image (max slider values, etc.)
-            for toolbox in self.pipeline.steps:  
-                toolbox.update_toolbox(self.input_BGRA)
+        self.switch_view("Image")                   # switch back to the image view mode
+        self.pipeline_on_change()                   # process the image through the pipeline
 
-            self.switch_view("Image")                   # switch back to the image view mode
-            self.pipeline_on_change()                   # process the image through the pipeline
+
+    def show_video_frame(self, index):
+        """
+        This method is called when the frame slider is moved.
+        It reads the selected frame of the video and processes it as the new input image, keeping the view and the toolboxes.
+        Args:
+            index (int): The index of the frame.
+        """
+        if self.video is None:
+            return
+
+        frame = self.video.read_frame(index)
+        if frame is None:
+            return
+
+        frame.flags.writeable = False
+        self.input_BGRA = ImageArray.wrap(frame)
+        self.image_versions[0] += 1
+        self.proxy = None                           # the proxy of the previous frame is out of date
+        self.frame_label.setText(f"Frame {index + 1} / {self.video.frame_count}")
+        self.pipeline_on_change()
 
 
     def select_image(self):
@@ -94,27 +198,7 @@ class GUiManagement():
         Returns:
             image (np.ndarray): The selected image as a NumPy array.
         """
-        # Open file dialog to select an image file
-        filePath, _ = QFileDialog.getOpenFileName(None, "Select an image file", "", "Image Files (*.png *.jpg *.jpeg *.bmp *.gif *.tif *.tiff *.webp)")
-
-        # Check if a file was selected
-        if filePath:
-            image = cv2.imread(filePath, cv2.IMREAD_UNCHANGED)      # read the image
-            
-            if image is None:
-                raise ValueError("No input image provided")
-            elif len(image.shape) == 2:                             # if image is (h,w)
-                image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGRA)
-            elif len(image.shape) == 3 and image.shape[2] == 1:     # if image is (h,w,1)
-                image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGRA)
-            elif len(image.shape) == 3 and image.shape[2] == 3:     # if image is (BGR) (h,w,3)
-                image = cv2.cvtColor(image, cv2.COLOR_BGR2BGRA)
-            elif len(image.shape) == 3 and image.shape[2] == 4:     # if image is (BGRA) (h,w,4)
-                pass
-            else:
-                raise ValueError("Unsupported image format")
-            
-            return image
+        return select_image()
     
     
     @Slot(str)
@@ -131,6 +215,16 @@ class GUiManagement():
                 new_toolbox = toolbox_class()  # create an instance of the toolbox class
                 break
 
+        self.add_toolbox(new_toolbox)
+        self.pipeline_on_change()                                   # trigger the update method to rerun the updated pipeline 
+
+
+    def add_toolbox(self, new_toolbox):
+        """
+        Connect a toolbox and add it to the end of the layout and pipeline.
+        Args:
+            new_toolbox (Toolbox): The toolbox to be added.
+        """
         # connect the toolbox signals
         new_toolbox.updateTrigger.connect(self.pipeline_on_change)   
         new_toolbox.removeTrigger.connect(self.remove_toolbox) 
@@ -144,8 +238,6 @@ class GUiManagement():
         self.toolbox_wrapper.addWidget(new_toolbox)                 # add the toolbox to the layout
         self.toolbox_wrapper.addWidget(self.footer_toolbox)         # add the special footer widget back
 
-        self.pipeline_on_change()                                   # trigger the update method to rerun the updated pipeline 
-
 
     @Slot(str)
     def remove_toolbox(self, id):
@@ -169,11 +261,71 @@ class GUiManagement():
     def pipeline_on_change(self):
         """
         This method is called when the pipeline is updated.
-        It runs the pipeline on the input image and updates the ui based on the current mode.
+        It sends a snapshot of the pipeline to the background worker, the ui is updated when the output is rendered.
+        While a slider is being dragged, the pipeline runs on a downscaled proxy of the input image sized to the canvas,
+        the full resolution output is rendered once the slider is released.
         """
         if self.input_BGRA is not None:
-            self.output_BGRA = self.pipeline.run(self.input_BGRA)               # run the pipeline on the input image
-            self.view_handlers[self.view_mode]()                                # update the ui based on the current mode
+            specs = self.pipeline.snapshot()
+            input_image, scale = self.input_BGRA, 1.0
+
+            if any(step.is_interacting() for step in self.pipeline.steps):
+                input_image, scale = self.get_proxy_image()
+                # rescale the size dependent parameters so that the proxy output looks the same as the full resolution output
+                specs = [spec.rescale(scale) if spec is not None and scale != 1.0 else spec for spec in specs]
+
+            self.render_worker.request(input_image, specs)         # run the pipeline on the input image
+            self.request_scale = scale
+
+
+    def get_proxy_image(self):
+        """
+        Get the downscaled proxy of the input image, sized to fit the output canvas.
+        The proxy is cached until the input image or the canvas size changes.
+        Returns:
+            tuple: The proxy image in the BGRA format and its size relative to the input image.
+        """
+        ratio = self.out_im_viewer.devicePixelRatioF()
+        canvas_size = (self.out_im_viewer.width() * ratio, self.out_im_viewer.height() * ratio)
+
+        if self.proxy is None or self.proxy[0] != canvas_size:
+            height, width = self.input_BGRA.shape[:2]
+            scale = min(1.0, canvas_size[0] / width, canvas_size[1] / height)       # the image is fitted into the canvas
+
+            if scale < 1.0:
+                proxy_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+                proxy = cv2.resize(self.input_BGRA, proxy_size, interpolation=cv2.INTER_AREA)
+                proxy.flags.writeable = False           # the pipeline only recognizes a read-only input in the following runs
+            else:
+                proxy, scale = self.input_BGRA, 1.0         # the canvas is larger than the image, no need for a proxy
+
+            self.proxy = (canvas_size, proxy, scale)
+
+        return self.proxy[1], self.proxy[2]
+
+
+    @Slot(int, object)
+    def on_rendered(self, request_id, output_image):
+        """
+        This method is called when the background worker finishes a request.
+        It updates the ui based on the current mode unless a newer request has been made in the meantime.
+        Args:
+            request_id (int): The id of the finished request.
+            output_image (numpy.ndarray): The output image of the pipeline in the BGRA format.
+        """
+        if request_id != self.render_worker.latest_id:
+            return
+
+        self.output_BGRA = output_image
+        self.output_scale = self.request_scale
+        self.image_versions[1] += 1
+        with self.pipeline.profiler.span(f"display {self.view_mode}", "display"):
+            self.refresh_views()                                            # update the ui based on the current mode
+
+        # show the time of every step on its toolbox, unless the steps were changed after the run
+        if len(self.pipeline.step_times) == len(self.pipeline.steps):
+            for step, step_time in zip(self.pipeline.steps, self.pipeline.step_times):
+                step.show_time(step_time)
 
 
     def switch_view(self, mode_name):
@@ -225,19 +377,66 @@ class GUiManagement():
         if self.input_BGRA is None:
             return
         
-        # Reset the input and output image canvases       
-        self.in_im_canvas.reset_plot()
-        self.out_im_canvas.reset_plot()
-
         self.color_channel = channel_name.split(" ")[0]     # get the color channel name from the button text
-        self.view_handlers[self.view_mode]()                # update the view based on the current view mode
 
+        # Reset the input and output image canvases, unless they already show the view
+        if any(view is None or view[1:] != (self.view_mode, self.color_channel) for view in self.drawn_views):
+            self.in_im_canvas.reset_plot()
+            self.out_im_canvas.reset_plot()
+            self.in_im_viewer.reset_zoom()
+            self.out_im_viewer.reset_zoom()
+            self.drawn_views = [None, None]                 # the cleared canvases are drawn again
+
+        self.refresh_views()                                # update the view based on the current view mode
+
+
+    def refresh_views(self):
+        """
+        Redraw the canvases whose image, view mode or color channel changed since they were last drawn.
+        The input image usually stays the same while the pipeline is edited, so only the output canvas is redrawn.
+        """
+        views = [(version, self.view_mode, self.color_channel) for version in self.image_versions]
+        indices = [i for i, view in enumerate(views) if view != self.drawn_views[i]]
+
+        if indices:
+            self.view_handlers[self.view_mode](indices)
+            for i in indices:
+                self.drawn_views[i] = views[i]
 
-    def display_images(self, images):
+
+    def redraw_views(self):
+        """
+        Redraw the views at the current size of the canvases, e.g. after the window is resized.
+        The cached output and the cached data of the views are reused, the pipeline is not run again.
         """
-        Display input and output images on the embedded matplotlib canvas.
+        for viewer in (self.in_im_viewer, self.out_im_viewer):
+            if not viewer.is_zoomed:
+                viewer.fit_image()
+            viewer.viewport().update()
+
+        if self.view_mode == "Histogram":
+            for canvas in (self.in_im_canvas, self.out_im_canvas):
+                canvas.draw_idle()
+
+
+    def get_images(self, indices=(0, 1)):
+        """
+        Get the input and/or the output image.
+        Args:
+            indices (list): The indices of the images, 0 for the input and 1 for the output.
+        Returns:
+            list: The images in the BGRA format.
+        """
+        images = [self.input_BGRA, self.output_BGRA]
+        return [images[i] for i in indices]
+
+
+    def display_images(self, indices, images):
+        """
+        Display input and/or output images on the image viewers, the buffers of the images are displayed without copying them.
 
         Parameters:
+            indices (list): The indices of the viewers to display the images on, 0 for the input and 1 for the output.
             images (list): A list containing the images to be displayed. 
         """
         # Toggle visibility of titles based on the color channel
@@ -255,34 +454,30 @@ class GUiManagement():
             if len(images[i].shape) == 2:
                 images[i] = cv2.cvtColor(images[i], cv2.COLOR_GRAY2BGRA)
 
-        # Plot the images on the respective canvases
-        for image, canvas in zip(images, [self.in_im_canvas, self.out_im_canvas]):
-            
-            # clear the current canvas and plot the new image
-            canvas.set_plot_type("image")
-            canvas._axes.imshow(image[:, :, [2, 1, 0, 3]], interpolation="none")    # convert BGRA to RGBA and display it
-            canvas.configure_imgae_plot()
-            canvas.draw()
+        # Display the images on the respective viewers, a proxy output is stretched to the size of the full resolution output
+        viewers, scales = [self.in_im_viewer, self.out_im_viewer], [1.0, self.output_scale]
+        for i, image in zip(indices, images):
+            viewers[i].set_image(image, scales[i])
  
 
-    def display_histogram(self):
+    def display_histogram(self, indices=(0, 1)):
         """
         Plot the histogram of the given image on the canvas.
+        Args:
+            indices (list): The indices of the canvases to plot the histograms on, 0 for the input and 1 for the output.
         """ 
-        for image, canvas in zip(self.get_color_channels(), [self.in_im_canvas, self.out_im_canvas]):
+        # the histograms of large images are estimated from a strided sample, the counts are scaled to the size of the image
+        histograms = self.get_cached_views(self.histograms, lambda image, step: processor_utils.get_histograms(image) * step ** 2,
+                                           constants.HISTOGRAM_MAX_PIXELS, indices)
+        values = np.arange(256)
+        canvases = [self.in_im_canvas, self.out_im_canvas]
+
+        for image_histograms, i in zip(histograms, indices):
+            canvas = canvases[i]
             canvas.set_plot_type("histogram")
             
-            # image can be in the form of 1-channel grayscale or 4-channel BGRA
-            channel_count = image.shape[2] if len(image.shape) == 3 else 1
             # plot the histogram for each channel if the image has more than 1 channel
-            for i in range(channel_count):
-                channel = image if channel_count == 1 else image[:, :, i]       
-
-                # Calculate histogram values and bin edges
-                hist_vals, bin_edges = np.histogram(channel, bins=255, range=(0, 256))
-
-                # Use midpoints for x-axis
-                bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
+            for i, hist_vals in enumerate(image_histograms):
                 
                 # Set the color for the histogram
                 if self.color_channel == "RGBA":
@@ -293,16 +488,18 @@ class GUiManagement():
                     colors = ['black']
 
                 # Plot the histogram
-                canvas._axes.step(bin_centers, hist_vals, color=colors[i], where='mid', linewidth=1)
+                canvas._axes.step(values, hist_vals, color=colors[i], where='mid', linewidth=1)
                 canvas._axes.set_title(f"{self.color_channel} Channel")
                 canvas.configure_hist_plot()
 
             canvas.draw()
 
 
-    def get_color_channels(self):
+    def get_color_channels(self, images=None):
         """
         Extracts the specified color channel from the input and output images.
+        Args:
+            images (list): The images to extract the channel from. Defaults to the input and output images.
         Returns:
             list: A list containing the extracted color channels from the input and output images.
         """
@@ -316,61 +513,181 @@ class GUiManagement():
             "Value":     ("HSV", 2),
         }
 
-        # If the color channel is not specified or is RGBA, return the input and output images as they are (4 channel BGRA images)
+        if images is None:
+            images = self.get_images()
+
+        # If the color channel is not specified or is RGBA, return the input and output images as 4 channel BGRA images,
+        # the grayscale images carried as a single plane by the pipeline are only expanded to be displayed
         if self.color_channel not in channel_maps or self.color_channel == "RGBA":
-            return [self.input_BGRA, self.output_BGRA]
+            return [processor_utils.to_bgra(image) for image in images]
 
         space, index = channel_maps[self.color_channel]
 
         def extract_channel(image, space, index):
-            if space == "BGR":
+            if space == "BGR" and image.ndim == 2:
+                channel = image if index < 3 else np.full_like(image, 255)     # a single plane is grayscale and opaque
+            elif space == "BGR":
                 channel = image[:, :, index]
             else:
-                converted = cv2.cvtColor(image[:, :, :3], getattr(cv2, f'COLOR_BGR2{space}'))
-                channel = converted[:, :, index]
+                channel = processor_utils.get_hsv(image)[:, :, index]      # the HSV image is shared with the pipeline steps
             return channel
 
         # Return the extracted channels (1 channel grayscale images)
-        return [
-            extract_channel(self.input_BGRA, space, index),
-            extract_channel(self.output_BGRA, space, index)
-        ]
+        return [extract_channel(image, space, index) for image in images]
 
 
-    def fourier_transform(self):
+    def fourier_transform(self, indices=(0, 1)):
         """
         Perform a Fourier Transform on the input image and return the magnitude spectrum.
+        The spectra are cached for every image and color channel, so they are only computed again when the image changes,
+        not when the view is refreshed or the color channel is switched back.
+        Args:
+            indices (list): The indices of the images, 0 for the input and 1 for the output.
         Returns:
-            list: A list containing the magnitude spectrum of the Fourier Transform of the input and output images.
+            list: A list containing the magnitude spectrum of the Fourier Transform of the input and/or output images.
         """
-        magnitude_spectrums = []  
+        return self.get_cached_views(self.spectra, lambda channel, step: cv2.cvtColor(processor_utils.get_magnitude_spectrum(channel), cv2.COLOR_GRAY2BGRA),
+                                     indices=indices)
 
-        for channel in self.get_color_channels():
-            
-            ch_float = np.float32(channel)         # convert the channel to float32   
-            dft = cv2.dft(ch_float, flags=cv2.DFT_COMPLEX_OUTPUT)
-            dft_shift = np.fft.fftshift(dft)
-            magnitude = cv2.magnitude(dft_shift[:,:,0], dft_shift[:,:,1])
-            magnitude_log = np.log(magnitude + 1)
-            magnitude_norm = cv2.normalize(magnitude_log, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
-            mag_im = cv2.cvtColor(magnitude_norm, cv2.COLOR_GRAY2BGRA)  
-            magnitude_spectrums.append(mag_im)
 
-        return magnitude_spectrums
+    def get_cached_views(self, cache, compute, max_pixels=None, indices=(0, 1)):
+        """
+        Get the data shown by a view for the current color channel of the input and the output images.
+        The data is cached for every image and color channel, so it is only computed again when the image changes,
+        not when the view is refreshed or the color channel is switched back.
+        Args:
+            cache (list): The (image, data by color channel) of the input and the output, updated in place.
+            compute (callable): Computes the data from the color channel of an image and the stride the image was sampled with.
+            max_pixels (int): The largest number of pixels the data is computed from, larger images are sampled with a stride.
+            indices (list): The indices of the images, 0 for the input and 1 for the output.
+        Returns:
+            list: The data of the input and/or the output images.
+        """
+        images = [self.input_BGRA, self.output_BGRA]
+
+        # a new image replaces the data of the previous one
+        for i in indices:
+            if cache[i][0] is not images[i]:
+                cache[i] = (images[i], {})
+
+        # the channels are only extracted from the images whose data is missing
+        missing = [i for i in indices if self.color_channel not in cache[i][1]]
+        steps = [processor_utils.get_sampling_step(images[i], max_pixels) for i in missing]
+        # the whole images are passed as they are, so the data they keep is shared with the pipeline
+        channels = self.get_color_channels([images[i] if step == 1 else images[i][::step, ::step] for i, step in zip(missing, steps)]) if missing else []
+        for i, channel, step in zip(missing, channels, steps):
+            cache[i][1][self.color_channel] = compute(channel, step)
+
+        return [cache[i][1][self.color_channel] for i in indices]
+
+
+    def save_pipeline(self):
+        """
+        Open a file dialog to select a file path and save the steps of the pipeline to it.
+        The saved pipeline can be loaded again in the GUI or run without it, see 'app.pipeline_file'.
+        """
+        filePath, _ = QFileDialog.getSaveFileName(None, "Save the pipeline", "", "Pipeline Files (*.json)")
+
+        if filePath:
+            steps = [(step.get_spec(), step.switch.isChecked()) for step in self.pipeline.steps]
+            try:
+                pipeline_file.save_pipeline(filePath, steps)
+            except Exception as e:
+                QMessageBox.information(None, "Error", f"Failed to save the pipeline.\n{str(e)}")
+
+
+    def load_pipeline(self):
+        """
+        Open a file dialog to select a pipeline file and replace the toolboxes with the saved steps.
+        """
+        filePath, _ = QFileDialog.getOpenFileName(None, "Select a pipeline file", "", "Pipeline Files (*.json)")
+
+        if filePath:
+            try:
+                steps = pipeline_file.read_pipeline(filePath)
+            except Exception as e:
+                QMessageBox.information(None, "Error", f"Failed to load the pipeline.\n{str(e)}")
+                return
+
+            # remove the current toolboxes
+            for step in list(self.pipeline.steps):
+                self.toolbox_wrapper.removeWidget(step)
+                step.setParent(None)
+                self.pipeline.remove_step(step.id)
+
+            # create a toolbox for every saved step and set its widgets to the saved parameters
+            toolbox_classes = {toolbox['SPEC']: toolbox['CLASS'] for toolbox in constants.TOOLBOXES.values()}
+            for spec, enabled in steps:
+                new_toolbox = getattr(toolboxes, toolbox_classes[type(spec).__name__])()
+                self.add_toolbox(new_toolbox)
+                new_toolbox.set_spec(spec)
+                new_toolbox.switch.setChecked(enabled)
+
+            self.pipeline_on_change()                   # rerun the loaded pipeline
 
 
     def save_image(self):
         """
         Open a file dialog to select a file path to save the output image.
+        If a video is opened, the whole video is processed and saved instead.
         """
+        if self.video is not None:
+            self.save_video()
+            return
+
         # Open file dialog to select a file path to save the image
         filePath, _ = QFileDialog.getSaveFileName(None, "Save the image", "", "Image Files (*.png *.jpg *.jpeg *.bmp *.gif *.tif *.tiff *.webp)")
         
         # Check if a file path was selected
         if filePath:
+            # make sure the output of the latest pipeline state is saved
+            self.render_worker.wait_until_idle()
+            result = self.render_worker.last_result
+            if result is not None and result[0] == self.render_worker.latest_id:
+                self.output_BGRA = result[1]
+                self.output_scale = self.request_scale
+
             try:
                 cv2.imwrite(filePath, self.output_BGRA)            # Save the image using OpenCV
             except Exception as e:
                 QMessageBox.information(None, "Error", f"Failed to save the image.\n{str(e)}")
 
 
+    def save_video(self):
+        """
+        Open a file dialog to select a file path, then process every frame of the opened video with the current pipeline and save it.
+        A progress dialog is shown while the video is processed, the processing stops when the dialog is cancelled.
+        """
+        filePath, _ = QFileDialog.getSaveFileName(None, "Save the video", "", "Video Files (*.mp4 *.avi)")
+        if not filePath:
+            return
+
+        dialog = QProgressDialog("Processing the video...", "Cancel", 0, max(1, self.video.frame_count))
+        dialog.setWindowModality(Qt.WindowModal)
+        dialog.setMinimumDuration(0)
+
+        def progress(done, total):
+            dialog.setValue(min(done, dialog.maximum()))
+            QApplication.processEvents()                # keep the dialog responsive, the frames are processed on other threads
+
+        fourcc = "MJPG" if filePath.lower().endswith(".avi") else constants.VIDEO_FOURCC
+        try:
+            VideoProcessor(fourcc=fourcc).run(self.video.path, filePath, self.pipeline.snapshot(), progress, dialog.wasCanceled)
+        except Exception as e:
+            QMessageBox.information(None, "Error", f"Failed to save the video.\n{str(e)}")
+        finally:
+            dialog.close()
+
+
+    def save_trace(self):
+        """
+        Open a file dialog to select a file path and save the timed steps and displays of the session as a Chrome trace.
+        The trace can be opened in 'chrome://tracing' or 'ui.perfetto.dev'.
+        """
+        filePath, _ = QFileDialog.getSaveFileName(None, "Save the trace", "", "Trace Files (*.json)")
+
+        if filePath:
+            try:
+                self.pipeline.profiler.save_trace(filePath)
+            except Exception as e:
+                QMessageBox.information(None, "Error", f"Failed to save the trace.\n{str(e)}")
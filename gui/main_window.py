@@ -2,9 +2,10 @@ import cv2
 import base64
 import numpy as np
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
-from PySide6.QtWidgets import QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout, QScrollArea, QCheckBox
+from PySide6.QtCore import Qt, QRectF, QTimer
+from PySide6.QtGui import QFont, QImage, QPainter
+from PySide6.QtWidgets import (QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout, QScrollArea, QCheckBox, QSlider,
+                               QGraphicsView, QGraphicsScene, QFrame)
 
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
@@ -33,26 +34,41 @@ class MainWindow(QWidget, GUiManagement):
 
         # init top, mid and bottom layouts
         self.init_top_layout()
+        self.init_video_layout()
         self.init_midLayout()
         self.init_bottomLayout()
 
         # Initialize UI variables in UiManagement
         self.init_ui_variables(self.contentLayout, self.add_new_box, self.in_im_canvas, self.out_im_canvas, 
-                               self.left_title, self.right_title, self.vis_mod_list, self.color_chan_list, self.zoom_btns)  
+                               self.in_im_viewer, self.out_im_viewer, self.left_title, self.right_title, self.vis_mod_list, self.color_chan_list, self.zoom_btns,
+                               self.frame_slider, self.frame_label)  
 
 
         # Decode and display the base64 encoded placeholder image 
         image_bytes = base64.b64decode(constants.NO_IMAGE_BASE64)
         image_array = np.frombuffer(image_bytes, dtype=np.uint8)
         initial_im = cv2.imdecode(image_array, cv2.IMREAD_UNCHANGED)
-        self.display_images([initial_im, initial_im])
+        self.display_images([0, 1], [initial_im, initial_im])
+
+        # Redraw the views once the window stops being resized
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(constants.RESIZE_REDRAW_DELAY)
+        self.resize_timer.timeout.connect(self.redraw_views)
 
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
 
-        # Recall the pipeline to update the output image when the window is resized
-        self.pipeline_on_change()
+        # the pipeline is not run again, the cached output is redrawn at the new size when the resizing stops
+        self.resize_timer.start()
+
+
+    def closeEvent(self, event):
+        # Stop the background worker before the window is destroyed
+        self.render_worker.stop()
+        self.close_video()
+        super().closeEvent(event)
         
 
     def init_top_layout(self):
@@ -75,9 +91,12 @@ class MainWindow(QWidget, GUiManagement):
         left_layout.addWidget(self.left_title, alignment=Qt.AlignCenter)
         self.left_title.hide()
 
-        # Create input image canvas
+        # Create input image viewer and the input canvas of the histogram view
+        self.in_im_viewer = ImageViewer()
+        left_layout.addWidget(self.in_im_viewer)
         self.in_im_canvas = InteractiveCanvas()  
         left_layout.addWidget(self.in_im_canvas)
+        self.in_im_canvas.hide()
 
         # create spacer layout to separate the two labels
         spacer = QVBoxLayout()
@@ -138,16 +157,35 @@ class MainWindow(QWidget, GUiManagement):
         right_layout.addWidget(self.right_title, alignment=Qt.AlignCenter)
         self.right_title.hide()
 
-        # Create output image canvas
+        # Create output image viewer and the output canvas of the histogram view
+        self.out_im_viewer = ImageViewer()
+        right_layout.addWidget(self.out_im_viewer)
         self.out_im_canvas = InteractiveCanvas()
         right_layout.addWidget(self.out_im_canvas)
+        self.out_im_canvas.hide()
 
         # connect zoom lock buttons to their respective methods
-        x_zoom_lock_btn.toggled.connect(lambda checked: setattr(self.in_im_canvas, "lock_x_zoom", checked))
-        x_zoom_lock_btn.toggled.connect(lambda checked: setattr(self.out_im_canvas, "lock_x_zoom", checked))
-        y_zoom_lock_btn.toggled.connect(lambda checked: setattr(self.in_im_canvas, "lock_y_zoom", checked))
-        y_zoom_lock_btn.toggled.connect(lambda checked: setattr(self.out_im_canvas, "lock_y_zoom", checked))
-        reset_zoom_btn.clicked.connect(lambda: [canvas.reset_zoom(self.display_histogram) for canvas in (self.in_im_canvas, self.out_im_canvas)]) 
+        for canvas in (self.in_im_canvas, self.out_im_canvas, self.in_im_viewer, self.out_im_viewer):
+            x_zoom_lock_btn.toggled.connect(lambda checked, canvas=canvas: setattr(canvas, "lock_x_zoom", checked))
+            y_zoom_lock_btn.toggled.connect(lambda checked, canvas=canvas: setattr(canvas, "lock_y_zoom", checked))
+        reset_zoom_btn.clicked.connect(lambda: [canvas.reset_zoom(lambda: self.display_histogram([i])) for i, canvas in enumerate((self.in_im_canvas, self.out_im_canvas))]) 
+
+
+    def init_video_layout(self):
+        """
+        Initialize the video layout with a slider scrubbing through the frames of an opened video, hidden until a video is opened.
+        """
+        video_layout = QHBoxLayout()
+        self.main_layout.addLayout(video_layout)
+
+        self.frame_slider = QSlider(Qt.Horizontal)
+        self.frame_slider.valueChanged.connect(self.show_video_frame)
+        video_layout.addWidget(self.frame_slider, 1)
+        self.frame_slider.hide()
+
+        self.frame_label = QLabel("")
+        video_layout.addWidget(self.frame_label)
+        self.frame_label.hide()
 
 
     def init_midLayout(self):
@@ -178,6 +216,22 @@ class MainWindow(QWidget, GUiManagement):
             }}
         """)
 
+        # Button 2 - open video
+        btn = QPushButton(constants.OPEN_VIDEO_BUTTON)
+        midLayout.addWidget(btn, 1)      
+        btn.clicked.connect(self.open_video)   
+        btn.setFlat(True)
+        btn.setFont(font) 
+        btn.setStyleSheet(f"""
+            QPushButton {{
+                padding-top: 10px;
+                padding-bottom: 10px;
+            }}
+            QPushButton:hover {{
+                background-color: {colors.COMBO_HOVER};
+            }}
+        """)
+
         # List 1 - Visualization type
         self.vis_mod_list = NoArrowComboBox(items=constants.VISUALIZATION_TYPES)
         midLayout.addWidget(self.vis_mod_list, 1)
@@ -190,7 +244,7 @@ class MainWindow(QWidget, GUiManagement):
         self.color_chan_list.setFont(font)
         self.color_chan_list.currentTextChanged.connect(lambda: self.switch_color_chan(self.color_chan_list.currentText())) 
 
-        # Button 2 - save image
+        # Button 3 - save image
         btn = QPushButton(constants.SAVE_BUTTON)
         midLayout.addWidget(btn, 1)   
         btn.clicked.connect(lambda: self.save_image())   
@@ -206,6 +260,23 @@ class MainWindow(QWidget, GUiManagement):
             }}
         """)
 
+        # Buttons 4, 5 and 6 - save and load the pipeline, save the trace of the timed steps
+        for heading, handler in ((constants.SAVE_PIPELINE_BUTTON, self.save_pipeline), (constants.LOAD_PIPELINE_BUTTON, self.load_pipeline),
+                                 (constants.SAVE_TRACE_BUTTON, self.save_trace)):
+            btn = QPushButton(heading)
+            midLayout.addWidget(btn, 1)   
+            btn.clicked.connect(handler)
+            btn.setFont(font) 
+            btn.setStyleSheet(f"""
+                QPushButton {{
+                    padding-top: 10px;
+                    padding-bottom: 10px;
+                }}
+                QPushButton:hover {{
+                    background-color: {colors.COMBO_HOVER};
+                }}
+            """)
+
 
     def init_bottomLayout(self):
         """
@@ -293,6 +364,147 @@ class MainWindow(QWidget, GUiManagement):
 
 
 
+class ImageViewer(QGraphicsView):
+    """
+    A view displaying a BGRA image without copying it, with panning by dragging and zooming with the scroll wheel.
+    The image buffer is wrapped by a QImage in the ARGB32 format, whose byte order is BGRA, and only the visible part of it
+    is drawn, so displaying a new image is a hand-off of the buffer.
+    The image is drawn from a mipmap pyramid of halved copies, built lazily the first time a zoom needs them, from the
+    smallest level still at least as large as the image on the screen, the full resolution is drawn only past 1:1.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.setScene(QGraphicsScene(self))
+        self.setFrameShape(QFrame.NoFrame)
+        self.setStyleSheet("background: transparent;")                 # Set the viewer to be transparent
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setDragMode(QGraphicsView.ScrollHandDrag)                 # pan by dragging, within the image
+        self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)   # zoom around the cursor
+        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+
+        self.image = None           # the displayed BGRA array, kept alive while the QImage refers to its buffer
+        self.qimage = None          # the QImage wrapping the buffer of the array
+        self.levels = []            # the levels of the pyramid built so far, as (array, QImage) pairs, the first is the image
+
+        self.lock_x_zoom = False    # Flag to lock x-axis zooming
+        self.lock_y_zoom = False    # Flag to lock y-axis zooming
+        self.is_zoomed = False      # Flag to indicate if the view is zoomed
+
+
+    def set_image(self, image, scale=1.0):
+        """
+        Display a new image, keeping the zoom and the position of the view if the size of the image is the same.
+        Args:
+            image (numpy.ndarray): The image in the BGRA format.
+            scale (float): The size of the image relative to the size it is displayed at, a downscaled proxy is
+                stretched to the size of the full resolution image to keep the zoom and pan limits.
+        """
+        if not image.flags.c_contiguous:
+            image = np.ascontiguousarray(image)         # a contiguous image is kept as it is, so it is recognized in the next call
+        height, width = image.shape[:2]
+
+        # the displayed images are never written, the pyramid of the same image is kept
+        if image is not self.image:
+            self.image = image
+            self.qimage = QImage(image.data, width, height, image.strides[0], QImage.Format_ARGB32)
+            self.levels = [(self.image, self.qimage)]
+
+        rect = QRectF(0, 0, width / scale, height / scale)
+        if rect != self.sceneRect():
+            self.setSceneRect(rect)
+            self.is_zoomed = False
+        if not self.is_zoomed:
+            self.fit_image()
+
+        self.viewport().update()
+
+
+    def fit_image(self):
+        """
+        Fit the whole image into the view.
+        """
+        if self.qimage is not None:
+            self.resetTransform()
+            self.fitInView(self.sceneRect(), Qt.KeepAspectRatio)
+
+
+    def reset_zoom(self):
+        """
+        Reset the zoom and panning state of the view.
+        """
+        self.is_zoomed = False
+        self.fit_image()
+
+
+    def drawBackground(self, painter, rect):
+        """
+        Draw the visible part of the image.
+        Args:
+            painter (QPainter): The painter of the viewport, in scene coordinates.
+            rect (QRectF): The exposed part of the scene.
+        """
+        if self.qimage is None:
+            return
+
+        target = rect.intersected(self.sceneRect())
+        if target.isEmpty():
+            return
+
+        # the number of screen pixels per pixel of the image, along the axis zoomed in the most
+        scene = self.sceneRect()
+        zoom = max(self.transform().m11(), self.transform().m22()) * self.devicePixelRatioF() * scene.width() / self.qimage.width()
+        qimage = self.get_level(max(0, int(np.floor(-np.log2(zoom)))) if zoom < 1 else 0)
+
+        # map the exposed part of the scene to the pixels of the level
+        x_ratio, y_ratio = qimage.width() / scene.width(), qimage.height() / scene.height()
+        source = QRectF(target.x() * x_ratio, target.y() * y_ratio, target.width() * x_ratio, target.height() * y_ratio)
+        painter.drawImage(target, qimage, source)
+
+
+    def get_level(self, index):
+        """
+        Get a level of the pyramid, building the missing levels up to it by halving the previous level.
+        Args:
+            index (int): The index of the level, 0 is the full resolution image.
+        Returns:
+            QImage: The level, or the smallest level if the image can not be halved that many times.
+        """
+        while len(self.levels) <= index:
+            previous = self.levels[-1][0]
+            height, width = previous.shape[:2]
+            if height < 2 or width < 2:
+                break
+
+            level = cv2.resize(previous, ((width + 1) // 2, (height + 1) // 2), interpolation=cv2.INTER_AREA)
+            self.levels.append((level, QImage(level.data, level.shape[1], level.shape[0], level.strides[0], QImage.Format_ARGB32)))
+
+        return self.levels[min(index, len(self.levels) - 1)][1]
+
+
+    def wheelEvent(self, event):
+        """
+        Handle the mouse wheel event for zooming in and out of the image, not further out than the whole image.
+        Args:
+            event (QWheelEvent): The wheel event containing information about the scroll direction.
+        """
+        if self.qimage is None:
+            return
+
+        factor = 0.95 if event.angleDelta().y() < 0 else 1.05
+        transform = self.transform()
+        fit = min(self.viewport().width() / self.sceneRect().width(), self.viewport().height() / self.sceneRect().height())
+
+        # Lock the zooming if the flags are set, and do not zoom out further than the whole image
+        x_scale = transform.m11() if self.lock_x_zoom else max(fit, transform.m11() * factor)
+        y_scale = transform.m22() if self.lock_y_zoom else max(fit, transform.m22() * factor)
+        self.scale(x_scale / transform.m11(), y_scale / transform.m22())
+
+        self.is_zoomed = True
+
+
+
 class InteractiveCanvas(FigureCanvas):
     """
     A custom canvas for displaying and interacting with matplotlib figures.
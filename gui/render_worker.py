@@ -0,0 +1,98 @@
+import threading
+import traceback
+
+from PySide6.QtCore import QThread, Signal
+
+
+class RenderWorker(QThread):
+    """
+    A background thread that runs the pipeline, so the GUI stays responsive while the image is processed.
+    Only the latest request is processed. Requests arriving while the worker is busy replace each other,
+    and a running request is cancelled between the steps as soon as a newer one arrives.
+    Args:
+        pipeline (Pipeline): The pipeline to be run on the requests.
+    """
+    # Signal emitted with the id of the request and the output image when a request is finished
+    rendered = Signal(int, object)
+
+    def __init__(self, pipeline):
+        super().__init__()
+
+        self.pipeline = pipeline
+        self.condition = threading.Condition()
+        self.pending = None             # the (id, input image, specs) of the request waiting to be processed
+        self.latest_id = 0              # the id of the most recent request
+        self.busy = False               # True while a request is being processed
+        self.last_result = None         # the (id, output image) of the last finished request
+        self.running = True
+
+
+    def request(self, input_image, specs):
+        """
+        Queue a new render request, replacing any request that has not been started yet.
+        Args:
+            input_image (numpy.ndarray): The input image of the pipeline in the BGRA format.
+            specs (list): A snapshot of the pipeline steps taken by 'Pipeline.snapshot'.
+        Returns:
+            int: The id of the request, it is emitted together with the output image.
+        """
+        with self.condition:
+            self.latest_id += 1
+            self.pending = (self.latest_id, input_image, specs)
+            self.condition.notify_all()
+            return self.latest_id
+
+
+    def is_cancelled(self, request_id):
+        """
+        Check whether a newer request has been made after the given one.
+        Args:
+            request_id (int): The id of the request being processed.
+        Returns:
+            bool: True if the request is obsolete or the worker is stopping.
+        """
+        return request_id != self.latest_id or not self.running
+
+
+    def wait_until_idle(self):
+        """
+        Block until all the requests are processed.
+        """
+        with self.condition:
+            while self.running and (self.pending is not None or self.busy):
+                self.condition.wait()
+
+
+    def stop(self):
+        """
+        Stop the worker thread and wait for it to finish.
+        """
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        self.wait()
+
+
+    def run(self):
+        while True:
+            # wait for a request and take it from the queue
+            with self.condition:
+                while self.running and self.pending is None:
+                    self.condition.wait()
+                if not self.running:
+                    return
+                request_id, input_image, specs = self.pending
+                self.pending = None
+                self.busy = True
+
+            try:
+                output_image = self.pipeline.run(input_image, specs, lambda: self.is_cancelled(request_id))
+                if output_image is not None and not self.is_cancelled(request_id):
+                    self.last_result = (request_id, output_image)
+                    self.rendered.emit(request_id, output_image)
+            except Exception:
+                traceback.print_exc()           # a failing step must not kill the worker
+            finally:
+                with self.condition:
+                    self.busy = False
+                    self.condition.notify_all()
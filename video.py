@@ -0,0 +1,41 @@
+import sys, time, argparse, traceback
+
+import constants
+from app import pipeline_file
+from app.video_processor import VideoProcessor
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply a saved pipeline to every frame of a video.")
+    parser.add_argument("pipeline", help="the pipeline file saved by the application")
+    parser.add_argument("input", help="the input video")
+    parser.add_argument("output", help="the output video, e.g. 'out.mp4'")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="the number of worker threads, defaults to the number of CPUs")
+    parser.add_argument("-c", "--codec", default=constants.VIDEO_FOURCC, help=f"the four character code of the output codec, defaults to '{constants.VIDEO_FOURCC}'")
+    args = parser.parse_args(argv)
+
+    try:
+        specs = pipeline_file.load_pipeline(args.pipeline)
+    except Exception:
+        traceback.print_exc()
+        return 2
+
+    def progress(done, total):
+        if done % 100 == 0:
+            print(f"{done}/{total} frames processed")
+
+    start = time.perf_counter()
+    try:
+        written = VideoProcessor(args.workers, args.codec).run(args.input, args.output, specs, progress)
+    except Exception:
+        traceback.print_exc()
+        return 1
+    elapsed = time.perf_counter() - start
+
+    print(f"{written} frames processed in {elapsed:.2f} s ({written / elapsed:.2f} frames/s)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())